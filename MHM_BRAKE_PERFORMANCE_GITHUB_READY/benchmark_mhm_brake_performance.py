@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Benchmark Suite
+====================================================
+Times each stage of the optimizer pipeline on synthetic fleets
+
+Stages:
+- load_real_iso_brake_data (cold catalog open + legacy view)
+- load_real_iso_brake_data_lazy (cold catalog open, sections built on access)
+- apply_tesla_folding_to_brake_performance (dict path)
+- apply_tesla_folding_batch (vectorized path)
+- optimize_brake_system_components
+- run_complete_brake_optimization
+
+Results (seconds, vehicles/second, peak traced memory) are written to a JSON
+baseline file; --compare reports regressions against a previous run.
+
+Usage:
+    python benchmark_mhm_brake_performance.py
+    python benchmark_mhm_brake_performance.py --sizes 3 1000 --output new.json --compare baseline.json
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_kernels import KERNEL_BACKEND
+from mhm_brake_performance_optimization import (
+    MHMBrakePerformanceOptimizer,
+    ISOBaselineStore,
+    get_builtin_iso_store,
+    get_iso_store,
+    invalidate_iso_data_cache
+)
+
+BENCHMARK_FORMAT = 1
+DEFAULT_FLEET_SIZES = (3, 1000, 100000)
+DEFAULT_OUTPUT = 'mhm_brake_benchmark_results.json'
+
+
+def synthetic_fleet_store(n_vehicles: int, seed: int = 0) -> ISOBaselineStore:
+    """
+    Built-in ISO data scaled to n_vehicles: vehicle classes cycled with ±5% baseline noise
+    """
+    builtin = get_builtin_iso_store()
+    rng = np.random.default_rng(seed)
+    source_rows = np.arange(n_vehicles) % len(builtin.vehicles)
+    
+    performance = builtin.performance[source_rows] * rng.uniform(0.95, 1.05, (n_vehicles, 1, 1))
+    abs_performance = builtin.abs_performance[source_rows] * rng.uniform(0.95, 1.05, (n_vehicles, 1, 1))
+    vehicles = [f"{builtin.vehicles[row]}_{i:06d}" for i, row in enumerate(source_rows)]
+    
+    metadata = dict(builtin.metadata)
+    metadata['test_vehicles'] = {name: dict(builtin.metadata['test_vehicles'][builtin.vehicles[row]],
+                                            vehicle_class=builtin.vehicles[row])
+                                 for name, row in zip(vehicles, source_rows)}
+    return ISOBaselineStore(vehicles, builtin.surfaces, builtin.abs_scenarios, performance, abs_performance,
+                            metadata, builtin.section_order)
+
+
+def _measure(func: Callable[[], object], repeat: int) -> Dict:
+    """
+    Best-of-repeat wall time, then one traced run for peak Python/NumPy memory
+    
+    One untimed warm-up call comes first, so JIT compilation of the kernels and
+    other one-off setup never count towards a stage's time.
+    """
+    func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': min(times), 'peak_memory_bytes': peak}
+
+
+def benchmark_fleet(n_vehicles: int, workdir: str, repeat: int = 3) -> List[Dict]:
+    """
+    Benchmark every pipeline stage on one synthetic fleet size
+    """
+    catalog = synthetic_fleet_store(n_vehicles).save(os.path.join(workdir, f"fleet_{n_vehicles}.catalog"))
+    optimizer = MHMBrakePerformanceOptimizer()
+    
+    def cold_load(lazy=False):
+        invalidate_iso_data_cache(catalog)
+        return optimizer.load_real_iso_brake_data(catalog, lazy=lazy)
+    
+    iso_data = cold_load()
+    store = get_iso_store(catalog)
+    vehicles, dry_table = store.surface_table('dry_asphalt_100_0')
+    _, abs_table = store.abs_table('split_mu_braking')
+    
+    stages = {
+        'load_real_iso_brake_data': cold_load,
+        'load_real_iso_brake_data_lazy': lambda: cold_load(lazy=True),
+        'apply_tesla_folding_to_brake_performance':
+            lambda: optimizer.apply_tesla_folding_to_brake_performance(iso_data),
+        'apply_tesla_folding_to_brake_performance_lazy':
+            lambda: optimizer.apply_tesla_folding_to_brake_performance(store, lazy=True),
+        'apply_tesla_folding_batch':
+            lambda: optimizer.apply_tesla_folding_batch(dry_table, abs_table, vehicles=vehicles),
+        'optimize_brake_system_components': lambda: optimizer.optimize_brake_system_components(iso_data),
+        'run_complete_brake_optimization': lambda: optimizer.run_complete_brake_optimization(catalog)
+    }
+    
+    results = []
+    for stage, func in stages.items():
+        measurement = _measure(func, repeat)
+        results.append({
+            'stage': stage,
+            'fleet_size': n_vehicles,
+            'seconds': measurement['seconds'],
+            'vehicles_per_second': n_vehicles / measurement['seconds'] if measurement['seconds'] > 0 else None,
+            'peak_memory_bytes': measurement['peak_memory_bytes']
+        })
+    invalidate_iso_data_cache(catalog)
+    return results
+
+
+def run_benchmarks(fleet_sizes: Sequence[int] = DEFAULT_FLEET_SIZES, repeat: int = 3) -> Dict:
+    """
+    Benchmark all stages at every fleet size; returns the machine-readable report
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        results = [result for n_vehicles in fleet_sizes for result in benchmark_fleet(n_vehicles, workdir, repeat)]
+    
+    return {
+        'format': BENCHMARK_FORMAT,
+        'created_utc': datetime.now(timezone.utc).isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'kernel_backend': KERNEL_BACKEND,
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'cpu_count': os.cpu_count()
+        },
+        'repeat': repeat,
+        'results': results
+    }
+
+
+def compare_benchmarks(current: Dict, baseline: Dict, tolerance: float = 0.25) -> List[Dict]:
+    """
+    Stages whose time grew by more than tolerance (fraction) versus the baseline report
+    """
+    previous = {(r['stage'], r['fleet_size']): r for r in baseline.get('results', [])}
+    regressions = []
+    for result in current['results']:
+        before = previous.get((result['stage'], result['fleet_size']))
+        if before is None or before['seconds'] <= 0:
+            continue
+        ratio = result['seconds'] / before['seconds']
+        if ratio > 1 + tolerance:
+            regressions.append({'stage': result['stage'], 'fleet_size': result['fleet_size'],
+                                'baseline_seconds': before['seconds'], 'seconds': result['seconds'],
+                                'slowdown': ratio})
+    return regressions
+
+
+def print_report(report: Dict, regressions: Optional[List[Dict]] = None):
+    """Console table of a benchmark report"""
+    print("\n" + "="*90)
+    print("⏱️  MHM BRAKE PERFORMANCE OPTIMIZATION - BENCHMARKS")
+    print("="*90)
+    print(f"{'Stage':<44}{'Vehicles':>10}{'Seconds':>12}{'Vehicles/s':>14}{'Peak MiB':>10}")
+    for result in report['results']:
+        throughput = result['vehicles_per_second']
+        print(f"{result['stage']:<44}{result['fleet_size']:>10}{result['seconds']:>12.6f}"
+              f"{throughput if throughput is not None else float('nan'):>14.0f}"
+              f"{result['peak_memory_bytes'] / 2**20:>10.1f}")
+    
+    if regressions is not None:
+        print(f"\n📊 REGRESSIONS: {len(regressions)}")
+        for regression in regressions:
+            print(f"  ❌ {regression['stage']} @ {regression['fleet_size']}: "
+                  f"{regression['baseline_seconds']:.6f}s -> {regression['seconds']:.6f}s "
+                  f"({regression['slowdown']:.2f}x)")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmark suite from the command line
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the MHM brake optimizer pipeline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_FLEET_SIZES),
+                        help="synthetic fleet sizes (default: 3 1000 100000)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed repetitions per stage (best is kept)")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="where to write the JSON report")
+    parser.add_argument('--compare', help="previous JSON report to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown fraction before a stage counts as a regression")
+    args = parser.parse_args(argv)
+    
+    report = run_benchmarks(args.sizes, args.repeat)
+    
+    regressions = None
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare_benchmarks(report, json.load(f), args.tolerance)
+    
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    
+    print_report(report, regressions)
+    print(f"\n💾 Benchmark results saved to {args.output}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
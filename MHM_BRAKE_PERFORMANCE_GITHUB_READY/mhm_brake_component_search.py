@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Component Design Search
+============================================================
+Constrained search over brake component settings against the stopping-distance simulator
+
+DESIGN VARIABLES (bounds in DEFAULT_COMPONENT_BOUNDS):
+- hydraulic_pressure_bar and pad_friction_coefficient scale the system's full-pressure
+  deceleration capability (brake torque ∝ line pressure × pad friction)
+- abs_control_frequency_hz sets how closely ABS holds the friction peak: the slip
+  lost per control period shrinks with the period, so 1 - abs_efficiency ∝ 1 / frequency
+- front_brake_bias splits brake force between the axles
+
+OBJECTIVE AND CONSTRAINTS:
+- Minimize the mean simulated stopping distance over every vehicle × surface
+- Pedal force ≤ max_pedal_force_n (ECE R13-H: 500 N). The simulated stop ramps to
+  full line pressure, so the driver holds the pedal at the force that commands
+  hydraulic_pressure_bar through the booster / master-cylinder ratio
+  (booster_ratio_bar_per_n): more pressure costs pedal force, pad friction does not
+- Front and rear rotor temperature after each stop ≤ max_brake_temperature_c
+
+scipy's differential_evolution proposes whole populations; each population is
+simulated in one broadcast batch and can be split across worker processes.
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+from mhm_brake_performance_optimization import BRAKE_METRICS, ISOBaselineStore
+from mhm_brake_simulation import (
+    CAST_IRON_SPECIFIC_HEAT_J_KGK,
+    DEFAULT_SIMULATION_PARAMETERS,
+    rotor_mass_kg,
+    simulate_stopping_distance,
+    vehicle_parameter_arrays
+)
+
+COMPONENT_VARIABLES = ('hydraulic_pressure_bar', 'pad_friction_coefficient', 'abs_control_frequency_hz',
+                       'front_brake_bias')
+DEFAULT_COMPONENT_BOUNDS = {
+    'hydraulic_pressure_bar': (80.0, 180.0),
+    'pad_friction_coefficient': (0.30, 0.55),
+    'abs_control_frequency_hz': (20.0, 200.0),
+    'front_brake_bias': (0.55, 0.80)
+}
+DEFAULT_MAX_PEDAL_FORCE_N = 500.0  # ECE R13-H service brake control force limit
+DEFAULT_BOOSTER_RATIO_BAR_PER_N = 0.25  # Line pressure per newton of pedal force (pedal lever × booster / bore)
+COMPONENT_CONSTRAINTS = ('pedal_force_n', 'brake_temperature_c')
+
+
+class _ComponentProblem:
+    """
+    Vehicles × surfaces of a store plus the reference component specs; picklable for worker processes
+    """
+    
+    def __init__(self, store: ISOBaselineStore, system_specs: Mapping,
+                 booster_ratio_bar_per_n: float = DEFAULT_BOOSTER_RATIO_BAR_PER_N, **parameters):
+        unknown = set(parameters) - set(DEFAULT_SIMULATION_PARAMETERS)
+        if unknown:
+            raise TypeError(f"Unknown simulation parameters: {', '.join(sorted(unknown))}")
+        self.parameters = dict(DEFAULT_SIMULATION_PARAMETERS, **parameters)
+        self.booster_ratio_bar_per_n = booster_ratio_bar_per_n
+        vehicle_params = vehicle_parameter_arrays(store.metadata['test_vehicles'], store.vehicles)
+        self.vehicle = {name: values[None, :, None] for name, values in vehicle_params.items()}  # (1, V, 1)
+        self.surface_mu = np.array([s.surface_mu for s in store.surfaces], dtype=np.float64)[None, None, :]
+        self.speed_kmh = np.array([s.test_speed_kmh for s in store.surfaces], dtype=np.float64)[None, None, :]
+        self.reference = {name: float(system_specs[name]) for name in COMPONENT_VARIABLES[:3]}
+        self.reference['front_brake_bias'] = float(self.parameters['front_brake_bias'])
+    
+    def simulation_inputs(self, settings: np.ndarray) -> Dict[str, np.ndarray]:
+        """Simulator parameters for (K, len(COMPONENT_VARIABLES)) candidate settings, shaped (K, 1, 1)"""
+        pressure, friction, frequency, bias = (settings[:, i, None, None] for i in range(len(COMPONENT_VARIABLES)))
+        reference, p = self.reference, self.parameters
+        # Brake torque scales with line pressure × pad friction
+        torque_ratio = pressure / reference['hydraulic_pressure_bar'] * friction / reference['pad_friction_coefficient']
+        return {
+            'max_system_deceleration_g': p['max_system_deceleration_g'] * torque_ratio,
+            'abs_efficiency': 1 - (1 - p['abs_efficiency']) * reference['abs_control_frequency_hz'] / frequency,
+            'front_brake_bias': bias
+        }
+    
+    def evaluate(self, settings: np.ndarray) -> np.ndarray:
+        """(K, 3) mean stopping distance, pedal force and peak rotor temperature per candidate"""
+        settings = np.atleast_2d(np.asarray(settings, dtype=np.float64))
+        inputs = self.simulation_inputs(settings)
+        overrides = {key: value for key, value in self.parameters.items() if key not in inputs}
+        vehicle = self.vehicle
+        result = simulate_stopping_distance(vehicle['mass_kg'], vehicle['wheelbase_m'], vehicle['cg_height_m'],
+                                            self.surface_mu, self.speed_kmh, **dict(overrides, **inputs))
+        
+        # Every stop ramps to full line pressure, which takes pressure / booster ratio at the pedal
+        pedal_force = settings[:, 0] / self.booster_ratio_bar_per_n
+        
+        # Kinetic energy split by brake bias into each axle's pair of rotors
+        kinetic_energy = 0.5 * vehicle['mass_kg'] * (self.speed_kmh / 3.6) ** 2
+        bias = inputs['front_brake_bias']
+        temperature = np.maximum.reduce([
+            kinetic_energy * share / (2 * rotor_mass_kg(vehicle[diameter], self.parameters['rotor_thickness_m'],
+                                                         self.parameters['rotor_solid_fraction'])
+                                      * CAST_IRON_SPECIFIC_HEAT_J_KGK)
+            for share, diameter in ((bias, 'front_brake_diameter_mm'), (1 - bias, 'rear_brake_diameter_mm'))
+        ]) + self.parameters['initial_brake_temperature_c']
+        
+        return np.stack([result.stopping_distance_m.mean(axis=(1, 2)), pedal_force,
+                         np.broadcast_to(temperature, result.stopping_distance_m.shape).max(axis=(1, 2))], axis=-1)
+
+
+def _evaluate_chunk(problem: _ComponentProblem, settings: np.ndarray) -> np.ndarray:
+    return problem.evaluate(settings)
+
+
+class _PopulationEvaluator:
+    """
+    Simulates each population once for the objective and both constraints, optionally across processes
+    """
+    
+    def __init__(self, problem: _ComponentProblem, executor: Optional[ProcessPoolExecutor], workers: int):
+        self.problem = problem
+        self.executor = executor
+        self.workers = workers
+        self.evaluations = 0
+        self._key = None
+        self._values = None
+    
+    def __call__(self, population: np.ndarray) -> np.ndarray:
+        """(S, 3) values for scipy's (N, S) population layout"""
+        settings = np.ascontiguousarray(np.atleast_2d(population.T if population.ndim == 2 else population))
+        key = settings.tobytes()
+        if key != self._key:
+            if self.executor is None or len(settings) < 2 * self.workers:
+                values = self.problem.evaluate(settings)
+            else:
+                chunks = np.array_split(settings, self.workers)
+                values = np.concatenate(list(self.executor.map(_evaluate_chunk, [self.problem] * len(chunks),
+                                                               chunks)))
+            self._key, self._values = key, values
+            self.evaluations += len(settings)
+        return self._values
+    
+    def objective(self, population: np.ndarray) -> np.ndarray:
+        return self(population)[:, 0]
+    
+    def constraints(self, population: np.ndarray) -> np.ndarray:
+        return self(population)[:, 1:].T
+
+
+class ComponentSearchResult:
+    """
+    Best component settings found, with their simulated performance against the reference specs
+    """
+    
+    __slots__ = ('settings', 'reference_settings', 'stopping_distance_m', 'reference_stopping_distance_m',
+                 'constraints', 'constraint_limits', 'feasible', 'generations', 'evaluations', 'message')
+    
+    def __init__(self, settings: Mapping[str, float], reference_settings: Mapping[str, float],
+                 values: np.ndarray, reference_values: np.ndarray, constraint_limits: Mapping[str, float],
+                 generations: int, evaluations: int, message: str):
+        self.settings = dict(settings)
+        self.reference_settings = dict(reference_settings)
+        self.stopping_distance_m = float(values[0])
+        self.reference_stopping_distance_m = float(reference_values[0])
+        self.constraints = dict(zip(COMPONENT_CONSTRAINTS, map(float, values[1:])))
+        self.constraint_limits = dict(constraint_limits)
+        self.feasible = all(self.constraints[name] <= limit * (1 + 1e-9) for name, limit in constraint_limits.items())
+        self.generations = generations
+        self.evaluations = evaluations
+        self.message = message
+    
+    @property
+    def distance_reduction_percent(self) -> float:
+        return (1 - self.stopping_distance_m / self.reference_stopping_distance_m) * 100
+    
+    def to_dict(self) -> Dict:
+        fields = {slot: getattr(self, slot) for slot in self.__slots__}
+        fields['distance_reduction_percent'] = self.distance_reduction_percent
+        return fields
+    
+    def __repr__(self) -> str:
+        return (f"ComponentSearchResult({self.stopping_distance_m:.2f} m vs "
+                f"{self.reference_stopping_distance_m:.2f} m, {'feasible' if self.feasible else 'infeasible'}, "
+                f"{self.evaluations} evaluations)")
+
+
+def search_component_settings(iso_data: Union[Mapping, ISOBaselineStore],
+                              bounds: Optional[Mapping[str, Tuple[float, float]]] = None,
+                              max_pedal_force_n: float = DEFAULT_MAX_PEDAL_FORCE_N,
+                              max_brake_temperature_c: Optional[float] = None,
+                              booster_ratio_bar_per_n: float = DEFAULT_BOOSTER_RATIO_BAR_PER_N,
+                              population_size: int = 15, max_generations: int = 100, tolerance: float = 1e-6,
+                              workers: int = 1, seed: Optional[int] = None, **parameters) -> ComponentSearchResult:
+    """
+    Differential-evolution search for the component settings with the shortest stops
+    
+    The dataset's brake_system_specs are the reference design. bounds override
+    DEFAULT_COMPONENT_BOUNDS per variable. booster_ratio_bar_per_n is the line
+    pressure per newton of pedal force, so max_pedal_force_n caps the usable
+    hydraulic_pressure_bar at their product. max_brake_temperature_c
+    defaults to the hottest brake temperature in the store's baselines, so a design
+    may not run hotter than the measured vehicles. population_size is per variable,
+    as in scipy. workers > 1 splits every population across that many processes.
+    Keyword parameters override DEFAULT_SIMULATION_PARAMETERS.
+    """
+    from scipy.optimize import NonlinearConstraint, differential_evolution
+    
+    bounds = dict(DEFAULT_COMPONENT_BOUNDS, **(bounds or {}))
+    unknown = set(bounds) - set(COMPONENT_VARIABLES)
+    if unknown:
+        raise ValueError(f"Unknown component variables: {', '.join(sorted(unknown))}")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if booster_ratio_bar_per_n <= 0:
+        raise ValueError(f"booster_ratio_bar_per_n must be positive, got {booster_ratio_bar_per_n}")
+    store = iso_data if isinstance(iso_data, ISOBaselineStore) else ISOBaselineStore.from_iso_dict(iso_data)
+    problem = _ComponentProblem(store, store.metadata['brake_system_specs'], booster_ratio_bar_per_n, **parameters)
+    if max_brake_temperature_c is None:
+        max_brake_temperature_c = float(np.nanmax(store.performance[..., BRAKE_METRICS.index('brake_temperature_c')]))
+    limits = {'pedal_force_n': max_pedal_force_n, 'brake_temperature_c': max_brake_temperature_c}
+    
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        evaluator = _PopulationEvaluator(problem, executor, workers)
+        upper = [limits[name] for name in COMPONENT_CONSTRAINTS]
+        result = differential_evolution(
+            evaluator.objective, [bounds[name] for name in COMPONENT_VARIABLES],
+            constraints=NonlinearConstraint(evaluator.constraints, -np.inf, upper),
+            popsize=population_size, maxiter=max_generations, tol=tolerance, seed=seed,
+            vectorized=True, updating='deferred', polish=False)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    reference = np.array([problem.reference[name] for name in COMPONENT_VARIABLES])
+    return ComponentSearchResult(dict(zip(COMPONENT_VARIABLES, map(float, result.x))), problem.reference,
+                                 problem.evaluate(result.x)[0], problem.evaluate(reference)[0], limits,
+                                 int(result.nit), evaluator.evaluations, str(result.message))
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Compiled Kernels
+=====================================================
+Optional numba JIT kernels for the hot loops, with NumPy fallbacks
+
+KERNELS:
+- fold_metrics: per-vehicle Tesla Folding multipliers and improvement percentages
+- integrate_stops: fixed-step (RK2 midpoint) stopping-distance integration
+
+The compiled kernels are selected automatically when numba is installed (the
+'performance' extra). Set MHM_BRAKE_DISABLE_NUMBA=1 to force the NumPy paths.
+Both paths run the same floating-point operations in the same order, so they
+return the same results.
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import os
+import numpy as np
+from typing import Tuple
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+USE_NUMBA = NUMBA_AVAILABLE and os.environ.get('MHM_BRAKE_DISABLE_NUMBA', '') not in ('1', 'true', 'yes')
+KERNEL_BACKEND = 'numba' if USE_NUMBA else 'numpy'
+
+
+def fold_metrics_numpy(baseline: np.ndarray, multipliers: np.ndarray,
+                       improvement_sign: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Apply multipliers to baseline metrics and return (optimized, improvement_percent)
+    """
+    optimized = baseline * multipliers
+    improvements = improvement_sign * (baseline - optimized) / baseline * 100
+    return optimized, improvements
+
+
+def integrate_stops_numpy(v0, demand_ms2, limit_ms2, rise_time_s, drag_per_mass, rolling_ms2,
+                          dt: float, max_steps: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fixed-step (RK2 midpoint) braking kernel over flat arrays
+    
+    Returns (distance_m, time_s, peak_deceleration_ms2). Only still-moving vehicles
+    are stepped, and each vehicle's final step is closed analytically at constant
+    deceleration so the stopping point does not depend on dt.
+    """
+    distance = np.zeros_like(v0)
+    elapsed = np.zeros_like(v0)
+    peak = np.zeros_like(v0)
+    
+    with np.errstate(divide='ignore'):
+        inverse_rise = 1.0 / rise_time_s  # inf for instant pressure build-up
+    
+    index = np.flatnonzero(v0 > 0)
+    v = v0[index]
+    demand, limit, inv_rise = demand_ms2[index], limit_ms2[index], inverse_rise[index]
+    drag, rolling = drag_per_mass[index], rolling_ms2[index]
+    travelled = np.zeros_like(v)
+    step_peak = np.zeros_like(v)
+    
+    def deceleration(speed, t):
+        # fmin treats 0 * inf (instant build-up at t = 0) as full pressure
+        with np.errstate(invalid='ignore'):
+            ramp = np.fmin(1.0, t * inv_rise)
+        return np.minimum(demand * ramp, limit) + drag * speed * speed + rolling
+    
+    step = 0
+    while step < max_steps and index.size:
+        t = step * dt
+        a_mid = deceleration(v - 0.5 * dt * deceleration(v, t), t + 0.5 * dt)
+        v_next = v - a_mid * dt
+        step_peak = np.maximum(step_peak, a_mid)
+        
+        stopping = v_next <= 0
+        if stopping.any():
+            done = index[stopping]
+            v_stop, a_stop = v[stopping], a_mid[stopping]
+            distance[done] = travelled[stopping] + v_stop * v_stop / (2 * a_stop)
+            elapsed[done] = t + v_stop / a_stop
+            peak[done] = step_peak[stopping]
+            
+            moving = ~stopping
+            index, v, v_next = index[moving], v[moving], v_next[moving]
+            demand, limit, inv_rise = demand[moving], limit[moving], inv_rise[moving]
+            drag, rolling = drag[moving], rolling[moving]
+            travelled, step_peak = travelled[moving], step_peak[moving]
+        
+        travelled += (v + v_next) * 0.5 * dt
+        v = v_next
+        step += 1
+    
+    # Vehicles still rolling after max_steps never stopped within max_time_s
+    distance[index] = np.inf
+    elapsed[index] = np.inf
+    peak[index] = step_peak
+    return distance, elapsed, peak
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, error_model='numpy')
+    def _fold_rows(baseline, multipliers, improvement_sign, optimized, improvements):
+        rows, width = baseline.shape
+        for i in range(rows):
+            for j in range(width):
+                value = baseline[i, j] * multipliers[i, j]
+                optimized[i, j] = value
+                improvements[i, j] = improvement_sign[j] * (baseline[i, j] - value) / baseline[i, j] * 100
+    
+    @numba.njit(cache=True, error_model='numpy')
+    def _stop_deceleration(speed, t, demand, limit, inv_rise, drag, rolling):
+        ramp = t * inv_rise
+        if not ramp < 1.0:  # Also catches 0 * inf at t = 0, like np.fmin
+            ramp = 1.0
+        return min(demand * ramp, limit) + drag * speed * speed + rolling
+    
+    @numba.njit(cache=True, error_model='numpy')
+    def _integrate_stops_rows(v0, demand, limit, rise_time, drag, rolling, dt, max_steps,
+                              distance, elapsed, peak):
+        for i in range(v0.size):
+            v = v0[i]
+            if not v > 0:
+                continue
+            inv_rise = 1.0 / rise_time[i] if rise_time[i] != 0 else np.inf
+            travelled = 0.0
+            step_peak = 0.0
+            stopped = False
+            for step in range(max_steps):
+                t = step * dt
+                a_start = _stop_deceleration(v, t, demand[i], limit[i], inv_rise, drag[i], rolling[i])
+                a_mid = _stop_deceleration(v - 0.5 * dt * a_start, t + 0.5 * dt, demand[i], limit[i],
+                                           inv_rise, drag[i], rolling[i])
+                v_next = v - a_mid * dt
+                step_peak = max(step_peak, a_mid)
+                if v_next <= 0:
+                    distance[i] = travelled + v * v / (2 * a_mid)
+                    elapsed[i] = t + v / a_mid
+                    peak[i] = step_peak
+                    stopped = True
+                    break
+                travelled += (v + v_next) * 0.5 * dt
+                v = v_next
+            if not stopped:
+                distance[i] = np.inf
+                elapsed[i] = np.inf
+                peak[i] = step_peak
+
+
+def fold_metrics_numba(baseline: np.ndarray, multipliers: np.ndarray,
+                       improvement_sign: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compiled fold_metrics; broadcasts like the NumPy version and runs one fused loop
+    """
+    baseline, multipliers = np.broadcast_arrays(np.asarray(baseline, dtype=np.float64),
+                                                np.asarray(multipliers, dtype=np.float64))
+    shape = baseline.shape
+    width = shape[-1]
+    optimized = np.empty(shape)
+    improvements = np.empty(shape)
+    _fold_rows(np.ascontiguousarray(baseline).reshape(-1, width),
+               np.ascontiguousarray(multipliers).reshape(-1, width),
+               np.ascontiguousarray(np.broadcast_to(improvement_sign, (width,)), dtype=np.float64),
+               optimized.reshape(-1, width), improvements.reshape(-1, width))
+    return optimized, improvements
+
+
+def integrate_stops_numba(v0, demand_ms2, limit_ms2, rise_time_s, drag_per_mass, rolling_ms2,
+                          dt: float, max_steps: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compiled integrate_stops; each vehicle is stepped in a scalar loop until it stops
+    """
+    distance = np.zeros_like(v0)
+    elapsed = np.zeros_like(v0)
+    peak = np.zeros_like(v0)
+    _integrate_stops_rows(*(np.ascontiguousarray(value, dtype=np.float64) for value in (
+        v0, demand_ms2, limit_ms2, rise_time_s, drag_per_mass, rolling_ms2)),
+        float(dt), int(max_steps), distance, elapsed, peak)
+    return distance, elapsed, peak
+
+
+fold_metrics = fold_metrics_numba if USE_NUMBA else fold_metrics_numpy
+integrate_stops = integrate_stops_numba if USE_NUMBA else integrate_stops_numpy
@@ -22,405 +22,1987 @@ Contact: holdatllc2@gmail.com
 
 import numpy as np
 import json
-from typing import Dict, List, Tuple
+import argparse
+import contextlib
+import copy
+import csv
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Mapping as MappingABC
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Mapping, Optional, Sequence, Union
 
-class MHMBrakePerformanceOptimizer:
-    """
-    Advanced brake performance optimization using Tesla Folding Engine and real ISO data
-    """
-    
-    def __init__(self):
-        """Initialize with proven Tesla Folding parameters"""
-        self.consciousness_level = 0.820  # From AC system
-        self.tesla_multiplier = 2.380     # Proven Tesla Folding
-        self.proven_improvement = 23.4    # Mining success %
-        
-        print("🛑 MHM Brake Performance Optimization System")
-        print(f"   Tesla Folding Engine: {self.proven_improvement}% proven improvement")
-        print(f"   Consciousness Level: {self.consciousness_level}")
-        print(f"   Data Source: Real ISO 21994 brake standards")
-    
-    def load_real_iso_brake_data(self) -> Dict:
-        """
-        Load real brake performance data from ISO standards and research
-        """
-        print("\n🛑 Loading Real ISO Brake Performance Data...")
-        
-        # Real brake performance data from ISO 21994 and MATLAB braking test
-        iso_brake_data = {
-            'standard_info': {
-                'title': 'ISO 21994:2007 - Passenger cars — Stopping distance at straight-line braking with ABS',
-                'standard_id': 'ISO 21994:2007',
-                'scope': 'Open-loop test method for brake performance',
-                'test_conditions': 'MATLAB Braking Test Reference Application',
-                'data_source': 'REAL ISO BRAKE STANDARDS + MATLAB SIMULATION - 100% EXTRACTED',
-                'additional_standards': {
-                    'iso_14512': 'ISO 14512:1999 - Split coefficient friction testing',
-                    'sae_j299': 'SAE J299_2009014 - Stopping Distance Test Procedure'
-                }
+from mhm_brake_kernels import fold_metrics as _fold_metrics
+from mhm_brake_statistics import DEFAULT_PERCENTILES, AggregateStatistics, aggregate, group_codes
+from mhm_brake_result_cache import (
+    DEFAULT_RESULT_CACHE_MAX_BYTES,
+    ResultCache,
+    result_cache_key
+)
+
+# Library use is silent by default; main() and verbose=True route progress to the console
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Metric layouts shared by the scalar and batched Tesla Folding paths
+BRAKE_METRICS = ('stopping_distance_m', 'deceleration_g', 'pedal_force_n', 'brake_temperature_c')
+BRAKE_IMPROVEMENTS = (
+    'distance_reduction_percent',
+    'deceleration_improvement_percent',
+    'pedal_force_reduction_percent',
+    'thermal_improvement_percent'
+)
+ABS_METRICS = ('stopping_distance_m', 'max_yaw_rate_deg_s', 'lateral_displacement_m', 'abs_cycles_per_second')
+ABS_IMPROVEMENTS = (
+    'distance_reduction_percent',
+    'yaw_stability_improvement_percent',
+    'lateral_displacement_reduction_percent',
+    'abs_response_improvement_percent'
+)
+
+# Structured record layouts accepted by apply_tesla_folding_batch
+BRAKE_BASELINE_DTYPE = np.dtype([(name, np.float64) for name in BRAKE_METRICS])
+ABS_BASELINE_DTYPE = np.dtype([(name, np.float64) for name in ABS_METRICS])
+
+# +1 where a lower value is better, -1 where a higher value is better
+BRAKE_IMPROVEMENT_SIGN = np.array([1.0, -1.0, 1.0, 1.0])
+ABS_IMPROVEMENT_SIGN = np.array([1.0, 1.0, 1.0, -1.0])
+
+MetricInput = Union[np.ndarray, Mapping[str, Sequence[float]]]
+
+# Real brake performance data from ISO 21994 and MATLAB braking test
+_REAL_ISO_BRAKE_DATA = {
+    'standard_info': {
+        'title': 'ISO 21994:2007 - Passenger cars — Stopping distance at straight-line braking with ABS',
+        'standard_id': 'ISO 21994:2007',
+        'scope': 'Open-loop test method for brake performance',
+        'test_conditions': 'MATLAB Braking Test Reference Application',
+        'data_source': 'REAL ISO BRAKE STANDARDS + MATLAB SIMULATION - 100% EXTRACTED',
+        'additional_standards': {
+            'iso_14512': 'ISO 14512:1999 - Split coefficient friction testing',
+            'sae_j299': 'SAE J299_2009014 - Stopping Distance Test Procedure'
+        }
+    },
+    'test_vehicles': {
+        'compact_car': {
+            'mass_kg': 1400,
+            'wheelbase_m': 2.65,
+            'cg_height_m': 0.52,
+            'front_brake_diameter_mm': 280,
+            'rear_brake_diameter_mm': 260,
+            'tire_size': '205/55R16'
+        },
+        'midsize_sedan': {
+            'mass_kg': 1600,
+            'wheelbase_m': 2.85,
+            'cg_height_m': 0.55,
+            'front_brake_diameter_mm': 320,
+            'rear_brake_diameter_mm': 280,
+            'tire_size': '225/50R17'
+        },
+        'suv': {
+            'mass_kg': 2000,
+            'wheelbase_m': 2.95,
+            'cg_height_m': 0.68,
+            'front_brake_diameter_mm': 350,
+            'rear_brake_diameter_mm': 320,
+            'tire_size': '235/60R18'
+        }
+    },
+    'baseline_performance': {
+        # ISO 21994 standard test: 100-0 km/h on dry asphalt
+        'dry_asphalt_100_0': {
+            'surface_mu': 0.85,
+            'test_speed_kmh': 100,
+            'compact_car': {
+                'stopping_distance_m': 38.5,
+                'deceleration_g': 0.87,
+                'pedal_force_n': 445,
+                'brake_temperature_c': 180
             },
-            'test_vehicles': {
-                'compact_car': {
-                    'mass_kg': 1400,
-                    'wheelbase_m': 2.65,
-                    'cg_height_m': 0.52,
-                    'front_brake_diameter_mm': 280,
-                    'rear_brake_diameter_mm': 260,
-                    'tire_size': '205/55R16'
-                },
-                'midsize_sedan': {
-                    'mass_kg': 1600,
-                    'wheelbase_m': 2.85,
-                    'cg_height_m': 0.55,
-                    'front_brake_diameter_mm': 320,
-                    'rear_brake_diameter_mm': 280,
-                    'tire_size': '225/50R17'
-                },
-                'suv': {
-                    'mass_kg': 2000,
-                    'wheelbase_m': 2.95,
-                    'cg_height_m': 0.68,
-                    'front_brake_diameter_mm': 350,
-                    'rear_brake_diameter_mm': 320,
-                    'tire_size': '235/60R18'
-                }
+            'midsize_sedan': {
+                'stopping_distance_m': 40.2,
+                'deceleration_g': 0.84,
+                'pedal_force_n': 485,
+                'brake_temperature_c': 195
             },
-            'baseline_performance': {
-                # ISO 21994 standard test: 100-0 km/h on dry asphalt
-                'dry_asphalt_100_0': {
-                    'surface_mu': 0.85,
-                    'test_speed_kmh': 100,
-                    'compact_car': {
-                        'stopping_distance_m': 38.5,
-                        'deceleration_g': 0.87,
-                        'pedal_force_n': 445,
-                        'brake_temperature_c': 180
-                    },
-                    'midsize_sedan': {
-                        'stopping_distance_m': 40.2,
-                        'deceleration_g': 0.84,
-                        'pedal_force_n': 485,
-                        'brake_temperature_c': 195
-                    },
-                    'suv': {
-                        'stopping_distance_m': 43.8,
-                        'deceleration_g': 0.79,
-                        'pedal_force_n': 520,
-                        'brake_temperature_c': 210
-                    }
-                },
-                # Wet surface performance
-                'wet_asphalt_100_0': {
-                    'surface_mu': 0.45,
-                    'test_speed_kmh': 100,
-                    'compact_car': {
-                        'stopping_distance_m': 72.8,
-                        'deceleration_g': 0.46,
-                        'pedal_force_n': 445,
-                        'brake_temperature_c': 120
-                    },
-                    'midsize_sedan': {
-                        'stopping_distance_m': 76.1,
-                        'deceleration_g': 0.44,
-                        'pedal_force_n': 485,
-                        'brake_temperature_c': 125
-                    },
-                    'suv': {
-                        'stopping_distance_m': 82.9,
-                        'deceleration_g': 0.41,
-                        'pedal_force_n': 520,
-                        'brake_temperature_c': 130
-                    }
-                }
+            'suv': {
+                'stopping_distance_m': 43.8,
+                'deceleration_g': 0.79,
+                'pedal_force_n': 520,
+                'brake_temperature_c': 210
+            }
+        },
+        # Wet surface performance
+        'wet_asphalt_100_0': {
+            'surface_mu': 0.45,
+            'test_speed_kmh': 100,
+            'compact_car': {
+                'stopping_distance_m': 72.8,
+                'deceleration_g': 0.46,
+                'pedal_force_n': 445,
+                'brake_temperature_c': 120
             },
-            'abs_performance': {
-                # Split-μ braking (left μ=0.2, right μ=0.8) - REAL ISO 14512:1999 DATA
-                'split_mu_braking': {
-                    'initial_speed_kmh': 80,
-                    'left_surface_mu': 0.2,  # REAL ISO: Low friction surface
-                    'right_surface_mu': 0.8, # REAL ISO: High friction surface
-                    'test_standard': 'ISO 14512:1999',  # REAL: "Split coefficient of friction"
-                    'test_method': 'Open-loop test procedure',  # REAL ISO standard
-                    'compact_car': {
-                        'stopping_distance_m': 52.3,
-                        'max_yaw_rate_deg_s': 8.2,
-                        'lateral_displacement_m': 2.1,
-                        'abs_cycles_per_second': 12
-                    },
-                    'midsize_sedan': {
-                        'stopping_distance_m': 54.7,
-                        'max_yaw_rate_deg_s': 7.8,
-                        'lateral_displacement_m': 2.3,
-                        'abs_cycles_per_second': 11
-                    },
-                    'suv': {
-                        'stopping_distance_m': 58.9,
-                        'max_yaw_rate_deg_s': 9.1,
-                        'lateral_displacement_m': 2.8,
-                        'abs_cycles_per_second': 10
-                    }
-                }
+            'midsize_sedan': {
+                'stopping_distance_m': 76.1,
+                'deceleration_g': 0.44,
+                'pedal_force_n': 485,
+                'brake_temperature_c': 125
             },
-            # REAL MATLAB BRAKING TEST DATA EXTRACTED:
-            'matlab_braking_test': {
-                'description': 'Full vehicle dynamics model undergoing braking test',
-                'test_types': ['straight_braking', 'split_mu_test'],
-                'abs_control_variants': {
-                    'bang_bang_abs': 'Switches between two states to regulate wheel slip',
-                    'five_state_abs': 'Logic-switching based on wheel deceleration',
-                    'open_loop': 'Sets brake pressure to reference value'
-                },
-                'vehicle_variants': {
-                    'PassVeh7DOF': '7 degrees of freedom (3 body + 4 wheel rolling)',
-                    'PassVeh14DOF': '14 degrees of freedom (6 body + 8 wheel)'  # REAL: "6 DOFs — Longitudinal, lateral, vertical and pitch, yaw, and roll"
-                },
-                'abs_parameters': {
-                    'default_surface_friction': [0.6, 0.8],  # REAL: "Constant friction coefficient scaling factor of 0.6" and "Split friction coefficient scaling factors of 0.6 and 0.8"
-                    'control_frequency_hz': 50,  # REAL: "abs_control_frequency_hz: 50"
-                    'esc_threshold_g': 0.3      # REAL: "esc_intervention_threshold_g: 0.3"
-                },
-                'iso_compliance': {
-                    'iso_15037': 'Standard measurement signals',  # REAL: "ISO 15037-1:2006 Standard Measurement Signals"
-                    'fault_tracking': 'ISO 14512 compliance'     # REAL: "ISO 14512" referenced
-                }
+            'suv': {
+                'stopping_distance_m': 82.9,
+                'deceleration_g': 0.41,
+                'pedal_force_n': 520,
+                'brake_temperature_c': 130
+            }
+        }
+    },
+    'abs_performance': {
+        # Split-μ braking (left μ=0.2, right μ=0.8) - REAL ISO 14512:1999 DATA
+        'split_mu_braking': {
+            'initial_speed_kmh': 80,
+            'left_surface_mu': 0.2,  # REAL ISO: Low friction surface
+            'right_surface_mu': 0.8, # REAL ISO: High friction surface
+            'test_standard': 'ISO 14512:1999',  # REAL: "Split coefficient of friction"
+            'test_method': 'Open-loop test procedure',  # REAL ISO standard
+            'compact_car': {
+                'stopping_distance_m': 52.3,
+                'max_yaw_rate_deg_s': 8.2,
+                'lateral_displacement_m': 2.1,
+                'abs_cycles_per_second': 12
             },
-            'brake_system_specs': {
-                'hydraulic_pressure_bar': 120,
-                'brake_fluid_type': 'DOT 4',
-                'pad_friction_coefficient': 0.42,
-                'rotor_material': 'Cast iron',
-                'abs_control_frequency_hz': 50,
-                'esc_intervention_threshold_g': 0.3
+            'midsize_sedan': {
+                'stopping_distance_m': 54.7,
+                'max_yaw_rate_deg_s': 7.8,
+                'lateral_displacement_m': 2.3,
+                'abs_cycles_per_second': 11
             },
-            'validation_status': 'REAL ISO STANDARDS DATA'
+            'suv': {
+                'stopping_distance_m': 58.9,
+                'max_yaw_rate_deg_s': 9.1,
+                'lateral_displacement_m': 2.8,
+                'abs_cycles_per_second': 10
+            }
         }
+    },
+    # REAL MATLAB BRAKING TEST DATA EXTRACTED:
+    'matlab_braking_test': {
+        'description': 'Full vehicle dynamics model undergoing braking test',
+        'test_types': ['straight_braking', 'split_mu_test'],
+        'abs_control_variants': {
+            'bang_bang_abs': 'Switches between two states to regulate wheel slip',
+            'five_state_abs': 'Logic-switching based on wheel deceleration',
+            'open_loop': 'Sets brake pressure to reference value'
+        },
+        'vehicle_variants': {
+            'PassVeh7DOF': '7 degrees of freedom (3 body + 4 wheel rolling)',
+            'PassVeh14DOF': '14 degrees of freedom (6 body + 8 wheel)'  # REAL: "6 DOFs — Longitudinal, lateral, vertical and pitch, yaw, and roll"
+        },
+        'abs_parameters': {
+            'default_surface_friction': [0.6, 0.8],  # REAL: "Constant friction coefficient scaling factor of 0.6" and "Split friction coefficient scaling factors of 0.6 and 0.8"
+            'control_frequency_hz': 50,  # REAL: "abs_control_frequency_hz: 50"
+            'esc_threshold_g': 0.3      # REAL: "esc_intervention_threshold_g: 0.3"
+        },
+        'iso_compliance': {
+            'iso_15037': 'Standard measurement signals',  # REAL: "ISO 15037-1:2006 Standard Measurement Signals"
+            'fault_tracking': 'ISO 14512 compliance'     # REAL: "ISO 14512" referenced
+        }
+    },
+    'brake_system_specs': {
+        'hydraulic_pressure_bar': 120,
+        'brake_fluid_type': 'DOT 4',
+        'pad_friction_coefficient': 0.42,
+        'rotor_material': 'Cast iron',
+        'abs_control_frequency_hz': 50,
+        'esc_intervention_threshold_g': 0.3
+    },
+    'validation_status': 'REAL ISO STANDARDS DATA'
+}
+
+# Compiled baseline catalog layout (see ISOBaselineStore.save / open)
+BASELINE_CATALOG_FORMAT = 1
+BASELINE_CATALOG_SUFFIX = '.catalog'
+_CATALOG_MANIFEST = 'catalog.json'
+# Array files of catalogs whose manifest does not list them
+_CATALOG_ARRAYS = {'performance': 'performance.npy', 'abs_performance': 'abs_performance.npy'}
+
+# Non-vehicle keys inside the per-condition sections of the ISO data layout
+_SURFACE_META_KEYS = ('surface_mu', 'test_speed_kmh')
+_ABS_META_KEYS = ('initial_speed_kmh', 'left_surface_mu', 'right_surface_mu', 'test_standard', 'test_method')
+
+
+def _as_metric_matrix(data: MetricInput, metric_names: Tuple[str, ...]) -> np.ndarray:
+    """
+    Convert a structured array, field mapping or (N, M) array into an (N, M) float matrix
+    """
+    if isinstance(data, np.ndarray) and data.dtype.names is None:
+        matrix = np.asarray(data, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[1] != len(metric_names):
+            raise ValueError(f"Expected an (N, {len(metric_names)}) array of {', '.join(metric_names)}")
+        return matrix
+    
+    missing = [name for name in metric_names if name not in (
+        data.dtype.names if isinstance(data, np.ndarray) else data)]
+    if missing:
+        raise KeyError(f"Missing baseline fields: {', '.join(missing)}")
+    return np.column_stack([np.asarray(data[name], dtype=np.float64) for name in metric_names])
+
+
+def _folding_factors(consciousness_level, proven_improvement) -> Tuple:
+    """
+    (tesla_brake_factor, consciousness_modulation_factor); inputs may be scalars or broadcastable arrays
+    """
+    tesla_brake_factor = proven_improvement / 100 * 0.3  # 30% of mining success for brakes
+    consciousness_modulation_factor = consciousness_level * 0.08  # 8% max modulation improvement
+    return tesla_brake_factor, consciousness_modulation_factor
+
+
+def _component_factors(consciousness_level, proven_improvement) -> Tuple:
+    """
+    (consciousness_factor, tesla_factor) for component optimization; scalars or broadcastable arrays
+    """
+    consciousness_factor = consciousness_level * 0.12  # 12% max component improvement
+    tesla_factor = proven_improvement / 100 * 0.15  # 15% Tesla enhancement
+    return consciousness_factor, tesla_factor
+
+
+def _component_fields(system_specs: Mapping, consciousness_factor, tesla_factor) -> Dict[str, Dict]:
+    """
+    Numeric component optimization fields; factors may be scalars or broadcastable arrays
+    """
+    return {
+        'hydraulic_system': {
+            'baseline_pressure_bar': system_specs['hydraulic_pressure_bar'],
+            'mhm_optimized_pressure_bar': system_specs['hydraulic_pressure_bar'] * (1 + tesla_factor),
+            'pressure_improvement_percent': tesla_factor * 100,
+            'response_time_improvement_ms': consciousness_factor * 50  # Milliseconds faster
+        },
+        'pad_friction_optimization': {
+            'baseline_friction_coefficient': system_specs['pad_friction_coefficient'],
+            'mhm_optimized_friction_coefficient': system_specs['pad_friction_coefficient'] * (1 + consciousness_factor),
+            'friction_improvement_percent': consciousness_factor * 100,
+            'temperature_stability_improvement_c': tesla_factor * 100  # Better high-temp performance
+        },
+        'abs_control_enhancement': {
+            'baseline_frequency_hz': system_specs['abs_control_frequency_hz'],
+            'mhm_optimized_frequency_hz': system_specs['abs_control_frequency_hz'] * (1 + tesla_factor * 2),
+            'frequency_improvement_percent': tesla_factor * 200,
+            'reaction_time_improvement_ms': consciousness_factor * 25  # Faster intervention
+        },
+        'esc_integration': {
+            'baseline_threshold_g': system_specs['esc_intervention_threshold_g'],
+            'mhm_optimized_threshold_g': system_specs['esc_intervention_threshold_g'] * (1 - consciousness_factor),
+            'sensitivity_improvement_percent': consciousness_factor * 100
+        }
+    }
+
+
+def _brake_multipliers(tesla_brake_factor, consciousness_modulation_factor) -> np.ndarray:
+    """
+    Per-metric Tesla Folding multipliers for straight-line braking, stacked on the last axis
+    """
+    return np.stack(np.broadcast_arrays(
+        1 - np.asarray(tesla_brake_factor, dtype=np.float64),  # Shorter stopping distance
+        1 + np.asarray(tesla_brake_factor, dtype=np.float64) * 0.5,  # Higher deceleration
+        1 - np.asarray(consciousness_modulation_factor, dtype=np.float64),  # Lighter pedal
+        1 - np.asarray(tesla_brake_factor, dtype=np.float64) * 0.2  # Cooler brakes
+    ), axis=-1)
+
+
+def _abs_multipliers(tesla_brake_factor, consciousness_modulation_factor) -> np.ndarray:
+    """
+    Per-metric Tesla Folding multipliers for ABS split-μ braking, stacked on the last axis
+    """
+    return np.stack(np.broadcast_arrays(
+        1 - np.asarray(consciousness_modulation_factor, dtype=np.float64) * 1.5,  # Stopping distance
+        1 - np.asarray(tesla_brake_factor, dtype=np.float64) * 2.0,  # Yaw rate
+        1 - np.asarray(consciousness_modulation_factor, dtype=np.float64) * 2.5,  # Lateral drift
+        1 + np.asarray(tesla_brake_factor, dtype=np.float64) * 1.5  # ABS cycling
+    ), axis=-1)
+
+
+class MetricValues(MappingABC):
+    """
+    Read-only metric name -> float view over one row of a result array
+    """
+    
+    __slots__ = ('_names', '_row')
+    
+    def __init__(self, names: Tuple[str, ...], row: np.ndarray):
+        self._names = names
+        self._row = row
+    
+    def __getitem__(self, name: str) -> float:
+        try:
+            return float(self._row[self._names.index(name)])
+        except ValueError:
+            raise KeyError(name) from None
+    
+    def __iter__(self):
+        return iter(self._names)
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def __repr__(self) -> str:
+        return f"MetricValues({self.to_dict()!r})"
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Materialize the row as a plain dict"""
+        return dict(zip(self._names, self._row.tolist()))
+
+
+class VehicleResult(MappingABC):
+    """
+    Lazy per-vehicle view of FoldedMetrics with the legacy section keys
+    
+    result['improvements']['distance_reduction_percent'] reads straight from the
+    arrays; nothing is copied until to_dict().
+    """
+    
+    __slots__ = ('_folded', '_index')
+    
+    def __init__(self, folded: 'FoldedMetrics', index: int):
+        self._folded = folded
+        self._index = index
+    
+    @property
+    def vehicle(self) -> str:
+        return self._folded.vehicles[self._index]
+    
+    @property
+    def baseline(self) -> MetricValues:
+        return MetricValues(self._folded.metric_names, self._folded.baseline[self._index])
+    
+    @property
+    def optimized(self) -> MetricValues:
+        return MetricValues(self._folded.metric_names, self._folded.optimized[self._index])
+    
+    @property
+    def improvements(self) -> MetricValues:
+        return MetricValues(self._folded.improvement_names, self._folded.improvements[self._index])
+    
+    def __getitem__(self, section: str) -> MetricValues:
+        baseline_key, optimized_key = self._folded.section_names
+        if section == baseline_key:
+            return self.baseline
+        if section == optimized_key:
+            return self.optimized
+        if section == 'improvements':
+            return self.improvements
+        raise KeyError(section)
+    
+    def __iter__(self):
+        return iter(self._folded.section_names + ('improvements',))
+    
+    def __len__(self) -> int:
+        return 3
+    
+    def __repr__(self) -> str:
+        return f"VehicleResult({self.vehicle!r})"
+    
+    def to_dict(self) -> Dict:
+        """Materialize the legacy nested dict for this vehicle"""
+        return {section: values.to_dict() for section, values in self.items()}
+
+
+class FoldedMetrics(MappingABC):
+    """
+    Baseline, optimized and improvement arrays for one braking test over N vehicles
+    
+    Also a read-only mapping of vehicle -> VehicleResult, so code written against
+    the legacy dict view works without building it.
+    """
+    
+    __slots__ = ('vehicles', 'metric_names', 'improvement_names', 'section_names',
+                 'baseline', 'optimized', 'improvements', '_vehicle_index')
+    
+    def __init__(self, vehicles: Sequence[str], metric_names: Tuple[str, ...],
+                 improvement_names: Tuple[str, ...], section_names: Tuple[str, str],
+                 baseline: np.ndarray, optimized: np.ndarray, improvements: np.ndarray):
+        self.vehicles = list(vehicles)
+        self.metric_names = metric_names
+        self.improvement_names = improvement_names
+        self.section_names = section_names  # (baseline key, optimized key) in the dict view
+        self.baseline = baseline
+        self.optimized = optimized
+        self.improvements = improvements
+        self._vehicle_index = None
+    
+    def __len__(self) -> int:
+        return len(self.vehicles)
+    
+    def __iter__(self):
+        return iter(self.vehicles)
+    
+    def __getitem__(self, vehicle: str) -> VehicleResult:
+        if self._vehicle_index is None:
+            self._vehicle_index = {name: i for i, name in enumerate(self.vehicles)}
+        return VehicleResult(self, self._vehicle_index[vehicle])
+    
+    def __contains__(self, vehicle) -> bool:
+        return vehicle in self.vehicles if self._vehicle_index is None else vehicle in self._vehicle_index
+    
+    def values(self):
+        """VehicleResult views in vehicle order, without name lookups"""
+        return [VehicleResult(self, i) for i in range(len(self.vehicles))]
+    
+    def items(self):
+        """(vehicle, VehicleResult) pairs in vehicle order"""
+        return list(zip(self.vehicles, self.values()))
+    
+    def metric(self, name: str, which: str = 'optimized') -> np.ndarray:
+        """Column of one metric from 'baseline', 'optimized' or 'improvements'"""
+        names = self.improvement_names if which == 'improvements' else self.metric_names
+        return getattr(self, which)[:, names.index(name)]
+    
+    def to_dict(self) -> Dict:
+        """Build the legacy per-vehicle nested dict view"""
+        baseline_key, optimized_key = self.section_names
+        baseline = self.baseline.tolist()
+        optimized = self.optimized.tolist()
+        improvements = self.improvements.tolist()
+        
+        return {
+            vehicle: {
+                baseline_key: dict(zip(self.metric_names, baseline[i])),
+                optimized_key: dict(zip(self.metric_names, optimized[i])),
+                'improvements': dict(zip(self.improvement_names, improvements[i]))
+            }
+            for i, vehicle in enumerate(self.vehicles)
+        }
+
+
+class TeslaFoldingBatchResult:
+    """
+    Array-backed output of apply_tesla_folding_batch; dict view built on demand
+    """
+    
+    __slots__ = ('dry_asphalt', 'abs_split_mu', 'tesla_folding_factors')
+    
+    def __init__(self, dry_asphalt: Optional[FoldedMetrics], abs_split_mu: Optional[FoldedMetrics],
+                 tesla_folding_factors: Dict):
+        self.dry_asphalt = dry_asphalt
+        self.abs_split_mu = abs_split_mu
+        self.tesla_folding_factors = tesla_folding_factors
+    
+    def to_dict(self) -> Dict:
+        """Build the result layout returned by apply_tesla_folding_to_brake_performance"""
+        results = {}
+        if self.dry_asphalt is not None:
+            results['dry_asphalt_optimization'] = self.dry_asphalt.to_dict()
+        if self.abs_split_mu is not None:
+            results['abs_optimization'] = self.abs_split_mu.to_dict()
+        results['tesla_folding_factors'] = dict(self.tesla_folding_factors)
+        return results
+
+
+class LabelledCube:
+    """
+    N-dimensional array with named dimensions and coordinate labels
+    """
+    
+    __slots__ = ('values', 'dims', 'coords', '_index')
+    
+    def __init__(self, values: np.ndarray, dims: Sequence[str], coords: Mapping[str, Sequence]):
+        self.values = values
+        self.dims = tuple(dims)
+        self.coords = {dim: list(coords[dim]) for dim in self.dims}
+        if values.shape != tuple(len(self.coords[dim]) for dim in self.dims):
+            raise ValueError(f"values shape {values.shape} does not match coordinates of {self.dims}")
+        self._index = {dim: {label: i for i, label in enumerate(labels)} for dim, labels in self.coords.items()}
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.values.shape
+    
+    def index(self, dim: str, label) -> int:
+        """Position of a coordinate label along a dimension"""
+        try:
+            return self._index[dim][label]
+        except KeyError:
+            raise KeyError(f"{label!r} is not a coordinate of dimension {dim!r}") from None
+    
+    def sel(self, **labels) -> Union['LabelledCube', float]:
+        """
+        Select by coordinate label; a scalar label drops the dimension, a list keeps it
+        """
+        unknown = set(labels) - set(self.dims)
+        if unknown:
+            raise KeyError(f"Unknown dimensions: {', '.join(sorted(unknown))}")
         
-        print(f"  ✅ Loaded: {iso_brake_data['standard_info']['title']}")
-        print(f"     Test Vehicles: {len(iso_brake_data['test_vehicles'])}")
-        print(f"     Test Conditions: {len(iso_brake_data['baseline_performance'])}")
-        print(f"     ABS Scenarios: {len(iso_brake_data['abs_performance'])}")
+        indexer, dims, coords = [], [], {}
+        for dim in self.dims:
+            if dim not in labels:
+                indexer.append(slice(None))
+                dims.append(dim)
+                coords[dim] = self.coords[dim]
+            elif isinstance(labels[dim], (list, tuple, np.ndarray)):
+                indexer.append([self.index(dim, label) for label in labels[dim]])
+                dims.append(dim)
+                coords[dim] = list(labels[dim])
+            else:
+                indexer.append(self.index(dim, labels[dim]))
         
-        return iso_brake_data
+        # Apply one axis at a time so list selections never trigger fancy-index broadcasting
+        values = self.values
+        axis = 0
+        for item in indexer:
+            values = values[(slice(None),) * axis + (item,)]
+            if not isinstance(item, int):
+                axis += 1
+        
+        if not dims:
+            return float(values)
+        return LabelledCube(values, dims, coords)
+
+
+class ParameterSweepResult:
+    """
+    Labelled result cubes of MHMBrakePerformanceOptimizer.sweep_parameters
     
-    def apply_tesla_folding_to_brake_performance(self, iso_data: Dict) -> Dict:
+    braking: (consciousness_level, proven_improvement, vehicle, surface, field)
+    abs_split_mu: (consciousness_level, proven_improvement, vehicle, scenario, field)
+    components: (consciousness_level, proven_improvement, field), or None without brake_system_specs
+    
+    Braking and ABS fields are the optimized metrics followed by the improvement percentages.
+    """
+    
+    __slots__ = ('braking', 'abs_split_mu', 'components', 'vehicle_classes')
+    
+    def __init__(self, braking: LabelledCube, abs_split_mu: LabelledCube, components: Optional[LabelledCube],
+                 vehicle_classes: Optional[Mapping[str, str]] = None):
+        self.braking = braking
+        self.abs_split_mu = abs_split_mu
+        self.components = components
+        self.vehicle_classes = vehicle_classes
+    
+    def statistics(self, group_by=None,
+                   percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, AggregateStatistics]:
+        """
+        Statistics of every improvement metric over the whole grid, per test
+        
+        group_by is None, 'vehicle_class', a cube dimension ('consciousness_level',
+        'proven_improvement', 'vehicle', 'surface' / 'scenario') or a mapping of
+        vehicle -> group.
+        """
+        tests = (('braking', self.braking, BRAKE_METRICS, BRAKE_IMPROVEMENTS),
+                 ('abs_split_mu', self.abs_split_mu, ABS_METRICS, ABS_IMPROVEMENTS))
+        return {
+            test: _aggregate_improvements(cube.values[..., len(metric_names):], cube.dims[:-1], cube.coords,
+                                          improvement_names, group_by, self.vehicle_classes, percentiles)
+            for test, cube, metric_names, improvement_names in tests
+        }
+
+
+class SurfaceCondition:
+    """
+    Straight-line braking condition metadata (one surface / test speed column of the store)
+    """
+    
+    __slots__ = ('name', 'surface_mu', 'test_speed_kmh')
+    
+    def __init__(self, name: str, surface_mu: float, test_speed_kmh: float):
+        self.name = name
+        self.surface_mu = surface_mu
+        self.test_speed_kmh = test_speed_kmh
+    
+    def __repr__(self) -> str:
+        return f"SurfaceCondition({self.name!r}, surface_mu={self.surface_mu}, test_speed_kmh={self.test_speed_kmh})"
+
+
+class ABSScenario:
+    """
+    Split-μ ABS scenario metadata (one scenario column of the store)
+    """
+    
+    __slots__ = ('name', 'initial_speed_kmh', 'left_surface_mu', 'right_surface_mu', 'test_standard', 'test_method')
+    
+    def __init__(self, name: str, initial_speed_kmh: float, left_surface_mu: float, right_surface_mu: float,
+                 test_standard: str = '', test_method: str = ''):
+        self.name = name
+        self.initial_speed_kmh = initial_speed_kmh
+        self.left_surface_mu = left_surface_mu
+        self.right_surface_mu = right_surface_mu
+        self.test_standard = test_standard
+        self.test_method = test_method
+    
+    def __repr__(self) -> str:
+        return (f"ABSScenario({self.name!r}, left_surface_mu={self.left_surface_mu}, "
+                f"right_surface_mu={self.right_surface_mu})")
+
+
+def _materialize(value):
+    """Replace lazy result views (anything with to_dict) with plain dicts, recursively"""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: _materialize(item) for key, item in value.items()}
+    return value
+
+
+def _aggregate_improvements(improvements: np.ndarray, dims: Tuple[str, ...], coords: Mapping[str, Sequence],
+                            improvement_names: Tuple[str, ...], group_by, vehicle_classes: Optional[Mapping],
+                            percentiles: Sequence[float]) -> AggregateStatistics:
+    """
+    Aggregate an improvements array shaped dims + (metric,) by one grouping
+    
+    group_by is None (everything pooled), 'vehicle_class', the name of one of dims,
+    or a mapping of vehicle name -> group label.
+    """
+    if group_by is None:
+        return aggregate(improvements, None, ('all',), improvement_names, percentiles)
+    
+    if group_by == 'vehicle_class' or isinstance(group_by, Mapping):
+        mapping = (vehicle_classes or {}) if group_by == 'vehicle_class' else group_by
+        axis = dims.index('vehicle')
+        groups, codes = group_codes([mapping.get(vehicle, vehicle) for vehicle in coords['vehicle']])
+    elif group_by in dims:
+        axis = dims.index(group_by)
+        groups, codes = list(coords[group_by]), np.arange(len(coords[group_by]))
+    else:
+        raise ValueError(f"Cannot group by {group_by!r}; use None, 'vehicle_class', a vehicle mapping "
+                         f"or one of {', '.join(dims)}")
+    
+    shape = [1] * len(dims)
+    shape[axis] = -1
+    return aggregate(improvements, codes.reshape(shape), groups, improvement_names, percentiles)
+
+
+def json_default(value):
+    """json.dump fallback: lazy result views become dicts, anything else its str()"""
+    return value.to_dict() if hasattr(value, 'to_dict') else str(value)
+
+
+# Conditions that also fill the pre-existing single-condition result sections
+_LEGACY_SURFACE_SECTION = ('dry_asphalt_100_0', 'dry_asphalt_optimization')
+_LEGACY_ABS_SECTION = ('split_mu_braking', 'abs_optimization')
+
+
+def folded_conditions(results: Mapping) -> Dict[str, Dict[str, Mapping]]:
+    """
+    {'braking': {surface: vehicle results}, 'abs': {scenario: vehicle results}} of a folding result
+    
+    Accepts the apply_tesla_folding_to_brake_performance layout, lazy or plain. The
+    legacy dry_asphalt_optimization / abs_optimization sections are merged back in
+    as their conditions, first.
+    """
+    conditions = {}
+    for test, (condition, section), generic in (('braking', _LEGACY_SURFACE_SECTION, 'surface_optimization'),
+                                                ('abs', _LEGACY_ABS_SECTION, 'abs_scenario_optimization')):
+        conditions[test] = {condition: results[section]} if section in results else {}
+        conditions[test].update(results.get(generic, {}))
+    return conditions
+
+
+class ConditionFoldingResult(MappingABC):
+    """
+    Tesla Folding over every surface and ABS scenario of a store, folded in one pass
+    
+    braking and abs_split_mu are (baseline, optimized, improvements) arrays shaped
+    (vehicles, surfaces, metrics) and (vehicles, abs_scenarios, metrics); vehicles
+    without data for a condition are NaN rows. As a mapping it reads like the
+    apply_tesla_folding_to_brake_performance dict, with lazy views as leaves.
+    """
+    
+    __slots__ = ('vehicles', 'surfaces', 'abs_scenarios', 'braking', 'abs_split_mu', 'tesla_folding_factors',
+                 'vehicle_classes', '_folded')
+    
+    def __init__(self, vehicles: Sequence[str], surfaces: Sequence[SurfaceCondition],
+                 abs_scenarios: Sequence[ABSScenario], braking: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                 abs_split_mu: Tuple[np.ndarray, np.ndarray, np.ndarray], tesla_folding_factors: Dict,
+                 vehicle_classes: Optional[Mapping[str, str]] = None):
+        self.vehicles = list(vehicles)
+        self.surfaces = list(surfaces)
+        self.abs_scenarios = list(abs_scenarios)
+        self.braking = braking
+        self.abs_split_mu = abs_split_mu
+        self.tesla_folding_factors = tesla_folding_factors
+        self.vehicle_classes = vehicle_classes
+        self._folded = {}  # (test, condition) -> FoldedMetrics, built on first access
+    
+    @staticmethod
+    def _condition(vehicles, arrays, column, metric_names, improvement_names, section_names) -> FoldedMetrics:
+        baseline, optimized, improvements = (values[:, column] for values in arrays)
+        present = ~np.isnan(baseline).all(axis=1)
+        return FoldedMetrics([v for v, keep in zip(vehicles, present) if keep], metric_names, improvement_names,
+                             section_names, baseline[present], optimized[present], improvements[present])
+    
+    def surface(self, name: str) -> FoldedMetrics:
+        """Straight-line braking results for one surface, skipping vehicles without data"""
+        key = ('braking', name)
+        if key not in self._folded:
+            column = [surface.name for surface in self.surfaces].index(name)
+            self._folded[key] = self._condition(self.vehicles, self.braking, column, BRAKE_METRICS,
+                                                BRAKE_IMPROVEMENTS,
+                                                ('baseline_performance', 'mhm_optimized_performance'))
+        return self._folded[key]
+    
+    def abs_scenario(self, name: str) -> FoldedMetrics:
+        """ABS results for one split-μ scenario, skipping vehicles without data"""
+        key = ('abs_split_mu', name)
+        if key not in self._folded:
+            column = [scenario.name for scenario in self.abs_scenarios].index(name)
+            self._folded[key] = self._condition(self.vehicles, self.abs_split_mu, column, ABS_METRICS,
+                                                ABS_IMPROVEMENTS,
+                                                ('baseline_abs_performance', 'mhm_optimized_abs_performance'))
+        return self._folded[key]
+    
+    def sections(self) -> Dict:
         """
-        Apply Tesla Folding Engine optimization to brake performance
+        The apply_tesla_folding_to_brake_performance layout with lazy FoldedMetrics leaves
+        
+        dry_asphalt_100_0 and split_mu_braking fill their legacy sections; every other
+        condition appears under surface_optimization / abs_scenario_optimization, so
+        no condition is stored twice (folded_conditions merges them back).
         """
-        print(f"\n⚡ Applying Tesla Folding ({self.proven_improvement}% proven) to Brake Performance...")
+        surfaces = {surface.name: self.surface(surface.name) for surface in self.surfaces}
+        scenarios = {scenario.name: self.abs_scenario(scenario.name) for scenario in self.abs_scenarios}
         
         results = {}
+        for conditions, (condition, section) in ((surfaces, _LEGACY_SURFACE_SECTION),
+                                                 (scenarios, _LEGACY_ABS_SECTION)):
+            if condition in conditions:
+                results[section] = conditions.pop(condition)
+        results['surface_optimization'] = surfaces
+        results['abs_scenario_optimization'] = scenarios
+        results['tesla_folding_factors'] = dict(self.tesla_folding_factors)
+        return results
+    
+    def statistics(self, group_by=None,
+                   percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, AggregateStatistics]:
+        """
+        Statistics of every improvement metric over vehicles × conditions, per test
+        
+        group_by is None, 'vehicle_class', 'vehicle', 'condition' or a mapping of
+        vehicle -> group; vehicles without data for a condition are skipped.
+        """
+        tests = (('braking', self.braking, self.surfaces, BRAKE_IMPROVEMENTS),
+                 ('abs_split_mu', self.abs_split_mu, self.abs_scenarios, ABS_IMPROVEMENTS))
+        return {
+            test: _aggregate_improvements(arrays[2], ('vehicle', 'condition'),
+                                          {'vehicle': self.vehicles,
+                                           'condition': [condition.name for condition in conditions]},
+                                          improvement_names, group_by, self.vehicle_classes, percentiles)
+            for test, arrays, conditions, improvement_names in tests
+        }
+    
+    def __getitem__(self, section: str):
+        return self.sections()[section]
+    
+    def __iter__(self):
+        return iter(self.sections())
+    
+    def __len__(self) -> int:
+        return len(self.sections())
+    
+    def to_dict(self) -> Dict:
+        """Materialize sections() as the legacy nested dicts"""
+        return _materialize(self.sections())
+
+
+class RecomputationReport:
+    """
+    What an incremental run recomputed, keyed by (test, condition, vehicle)
+    
+    test is 'braking' or 'abs_split_mu'; dropped lists cached results whose
+    vehicle or condition no longer exists in the dataset.
+    """
+    
+    __slots__ = ('recomputed', 'reused', 'dropped', 'components_recomputed')
+    
+    def __init__(self, recomputed: Sequence[Tuple[str, str, str]], reused: int,
+                 dropped: Sequence[Tuple[str, str, str]], components_recomputed: bool = False):
+        self.recomputed = list(recomputed)
+        self.reused = reused
+        self.dropped = list(dropped)
+        self.components_recomputed = components_recomputed
+    
+    def to_dict(self) -> Dict:
+        """JSON-friendly summary stored under 'recomputation' in incremental results"""
+        return {
+            'recomputed': [list(key) for key in self.recomputed],
+            'recomputed_count': len(self.recomputed),
+            'reused_count': self.reused,
+            'dropped': [list(key) for key in self.dropped],
+            'components_recomputed': self.components_recomputed
+        }
+
+
+def _content_digest(salt: bytes, payload: bytes) -> str:
+    """Content hash identifying one cached result's inputs"""
+    return hashlib.blake2b(salt + payload, digest_size=16).hexdigest()
+
+
+class ISOBaselineStore:
+    """
+    Columnar ISO baseline data: vehicle × surface × metric arrays with O(1) index lookup
+    
+    performance has shape (vehicles, surfaces, len(BRAKE_METRICS)) and abs_performance
+    has shape (vehicles, abs_scenarios, len(ABS_METRICS)). Vehicles missing from a
+    condition are stored as NaN rows.
+    """
+    
+    __slots__ = ('vehicles', 'surfaces', 'abs_scenarios', 'performance', 'abs_performance',
+                 'metadata', 'section_order', '_vehicle_index', '_surface_index', '_abs_index')
+    
+    def __init__(self, vehicles: Sequence[str], surfaces: Sequence[SurfaceCondition],
+                 abs_scenarios: Sequence[ABSScenario], performance: np.ndarray, abs_performance: np.ndarray,
+                 metadata: Optional[Dict] = None, section_order: Optional[Sequence[str]] = None):
+        self.vehicles = tuple(vehicles)
+        self.surfaces = tuple(surfaces)
+        self.abs_scenarios = tuple(abs_scenarios)
+        self.performance = performance
+        self.abs_performance = abs_performance
+        self.metadata = metadata if metadata is not None else {}
+        self.section_order = tuple(section_order) if section_order is not None else (
+            tuple(self.metadata) + ('baseline_performance', 'abs_performance'))
         
-        # Tesla Folding enhancement factors
-        tesla_brake_factor = self.proven_improvement / 100 * 0.3  # 30% of mining success for brakes
-        consciousness_modulation_factor = self.consciousness_level * 0.08  # 8% max modulation improvement
+        expected = (len(self.vehicles), len(self.surfaces), len(BRAKE_METRICS))
+        if performance.shape != expected:
+            raise ValueError(f"performance has shape {performance.shape}, expected {expected}")
+        expected = (len(self.vehicles), len(self.abs_scenarios), len(ABS_METRICS))
+        if abs_performance.shape != expected:
+            raise ValueError(f"abs_performance has shape {abs_performance.shape}, expected {expected}")
         
-        # Optimize dry asphalt performance
-        print("  🛑 Optimizing dry asphalt braking...")
-        dry_results = {}
+        self._vehicle_index = {name: i for i, name in enumerate(self.vehicles)}
+        self._surface_index = {surface.name: i for i, surface in enumerate(self.surfaces)}
+        self._abs_index = {scenario.name: i for i, scenario in enumerate(self.abs_scenarios)}
+    
+    @classmethod
+    def from_iso_dict(cls, iso_data: Mapping) -> 'ISOBaselineStore':
+        """
+        Build a store from the nested layout returned by load_real_iso_brake_data
         
-        for vehicle_type, vehicle_data in iso_data['baseline_performance']['dry_asphalt_100_0'].items():
-            if vehicle_type in ['surface_mu', 'test_speed_kmh']:
-                continue
-                
-            print(f"    Optimizing {vehicle_type.replace('_', ' ')}...")
-            
-            # Baseline values
-            baseline_distance = vehicle_data['stopping_distance_m']
-            baseline_deceleration = vehicle_data['deceleration_g']
-            baseline_pedal_force = vehicle_data['pedal_force_n']
-            baseline_temperature = vehicle_data['brake_temperature_c']
-            
-            # Tesla Folding optimization
-            # Better brake modulation reduces stopping distance
-            mhm_distance = baseline_distance * (1 - tesla_brake_factor)
-            # Improved deceleration through better control
-            mhm_deceleration = baseline_deceleration * (1 + tesla_brake_factor * 0.5)
-            # More efficient pedal feel
-            mhm_pedal_force = baseline_pedal_force * (1 - consciousness_modulation_factor)
-            # Better thermal management
-            mhm_temperature = baseline_temperature * (1 - tesla_brake_factor * 0.2)
-            
-            # Calculate improvements
-            distance_improvement = (baseline_distance - mhm_distance) / baseline_distance * 100
-            deceleration_improvement = (mhm_deceleration - baseline_deceleration) / baseline_deceleration * 100
-            pedal_improvement = (baseline_pedal_force - mhm_pedal_force) / baseline_pedal_force * 100
-            thermal_improvement = (baseline_temperature - mhm_temperature) / baseline_temperature * 100
-            
-            dry_results[vehicle_type] = {
-                'baseline_performance': {
-                    'stopping_distance_m': baseline_distance,
-                    'deceleration_g': baseline_deceleration,
-                    'pedal_force_n': baseline_pedal_force,
-                    'brake_temperature_c': baseline_temperature
-                },
-                'mhm_optimized_performance': {
-                    'stopping_distance_m': mhm_distance,
-                    'deceleration_g': mhm_deceleration,
-                    'pedal_force_n': mhm_pedal_force,
-                    'brake_temperature_c': mhm_temperature
-                },
-                'improvements': {
-                    'distance_reduction_percent': distance_improvement,
-                    'deceleration_improvement_percent': deceleration_improvement,
-                    'pedal_force_reduction_percent': pedal_improvement,
-                    'thermal_improvement_percent': thermal_improvement
-                }
-            }
+        A lazy ISODataView hands back its cached store instead of tabulating its sections.
+        """
+        if isinstance(iso_data, ISODataView):
+            return iso_data.store
+        baseline_sections = iso_data.get('baseline_performance', {})
+        abs_sections = iso_data.get('abs_performance', {})
         
-        results['dry_asphalt_optimization'] = dry_results
+        # Ordered union of vehicle names across all sections (dict keys keep first-seen order)
+        vehicle_names = dict.fromkeys(iso_data.get('test_vehicles', {}))
+        for sections, meta_keys in ((baseline_sections, _SURFACE_META_KEYS), (abs_sections, _ABS_META_KEYS)):
+            for section in sections.values():
+                vehicle_names.update((v, None) for v in section if v not in meta_keys)
+        vehicles = list(vehicle_names)
+        vehicle_index = {name: i for i, name in enumerate(vehicles)}
         
-        # Optimize ABS performance
-        print("  🔄 Optimizing ABS split-μ performance...")
-        abs_results = {}
+        def tabulate(sections, metric_names):
+            table = np.full((len(vehicles), len(sections), len(metric_names)), np.nan)
+            for j, section in enumerate(sections.values()):
+                for vehicle, values in section.items():
+                    if vehicle in vehicle_index and isinstance(values, Mapping):
+                        table[vehicle_index[vehicle], j] = [values[name] for name in metric_names]
+            return table
         
-        split_mu_data = iso_data['abs_performance']['split_mu_braking']
+        surfaces = [SurfaceCondition(name, section['surface_mu'], section['test_speed_kmh'])
+                    for name, section in baseline_sections.items()]
+        abs_scenarios = [ABSScenario(name, section['initial_speed_kmh'], section['left_surface_mu'],
+                                     section['right_surface_mu'], section.get('test_standard', ''),
+                                     section.get('test_method', ''))
+                         for name, section in abs_sections.items()]
+        metadata = {key: value for key, value in iso_data.items()
+                    if key not in ('baseline_performance', 'abs_performance')}
         
-        for vehicle_type, vehicle_data in split_mu_data.items():
-            if vehicle_type in ['initial_speed_kmh', 'left_surface_mu', 'right_surface_mu', 'test_standard', 'test_method']:
-                continue
-                
-            print(f"    Optimizing {vehicle_type.replace('_', ' ')} ABS...")
-            
-            # Baseline ABS values
-            baseline_distance = vehicle_data['stopping_distance_m']
-            baseline_yaw_rate = vehicle_data['max_yaw_rate_deg_s']
-            baseline_lateral_disp = vehicle_data['lateral_displacement_m']
-            baseline_abs_cycles = vehicle_data['abs_cycles_per_second']
-            
-            # Tesla Folding ABS optimization
-            # Consciousness-enhanced modulation
-            mhm_distance = baseline_distance * (1 - consciousness_modulation_factor * 1.5)
-            # Better yaw control through Tesla Folding
-            mhm_yaw_rate = baseline_yaw_rate * (1 - tesla_brake_factor * 2.0)
-            # Reduced lateral displacement
-            mhm_lateral_disp = baseline_lateral_disp * (1 - consciousness_modulation_factor * 2.5)
-            # Faster ABS cycling
-            mhm_abs_cycles = baseline_abs_cycles * (1 + tesla_brake_factor * 1.5)
-            
-            # Calculate improvements
-            distance_improvement = (baseline_distance - mhm_distance) / baseline_distance * 100
-            yaw_improvement = (baseline_yaw_rate - mhm_yaw_rate) / baseline_yaw_rate * 100
-            lateral_improvement = (baseline_lateral_disp - mhm_lateral_disp) / baseline_lateral_disp * 100
-            abs_improvement = (mhm_abs_cycles - baseline_abs_cycles) / baseline_abs_cycles * 100
+        return cls(vehicles, surfaces, abs_scenarios,
+                   tabulate(baseline_sections, BRAKE_METRICS), tabulate(abs_sections, ABS_METRICS),
+                   metadata, list(iso_data))
+    
+    def vehicle_index(self, vehicle: str) -> int:
+        """Row index of a vehicle"""
+        return self._vehicle_index[vehicle]
+    
+    def surface_index(self, surface: str) -> int:
+        """Column index of a straight-line braking condition"""
+        return self._surface_index[surface]
+    
+    def abs_index(self, scenario: str) -> int:
+        """Column index of an ABS scenario"""
+        return self._abs_index[scenario]
+    
+    def surface(self, name: str) -> SurfaceCondition:
+        """Metadata for a straight-line braking condition"""
+        return self.surfaces[self._surface_index[name]]
+    
+    def baseline(self, vehicle: str, surface: str) -> np.ndarray:
+        """BRAKE_METRICS row for one vehicle on one surface"""
+        return self.performance[self._vehicle_index[vehicle], self._surface_index[surface]]
+    
+    def abs_baseline(self, vehicle: str, scenario: str) -> np.ndarray:
+        """ABS_METRICS row for one vehicle in one ABS scenario"""
+        return self.abs_performance[self._vehicle_index[vehicle], self._abs_index[scenario]]
+    
+    def surface_table(self, surface: str) -> Tuple[List[str], np.ndarray]:
+        """(vehicles, (N, M) matrix) for a surface, skipping vehicles without data"""
+        table = self.performance[:, self._surface_index[surface]]
+        present = ~np.isnan(table).all(axis=1)
+        return [v for v, keep in zip(self.vehicles, present) if keep], table[present]
+    
+    def abs_table(self, scenario: str) -> Tuple[List[str], np.ndarray]:
+        """(vehicles, (N, M) matrix) for an ABS scenario, skipping vehicles without data"""
+        table = self.abs_performance[:, self._abs_index[scenario]]
+        present = ~np.isnan(table).all(axis=1)
+        return [v for v, keep in zip(self.vehicles, present) if keep], table[present]
+    
+    def with_surfaces(self, surfaces: Sequence[SurfaceCondition], performance: np.ndarray) -> 'ISOBaselineStore':
+        """
+        Copy of the store with extra straight-line conditions, e.g. snow or ice baselines
+        
+        performance is shaped (vehicles, len(surfaces), len(BRAKE_METRICS)) in this
+        store's vehicle order; NaN rows mark vehicles without data.
+        """
+        surfaces = list(surfaces)
+        duplicates = [surface.name for surface in surfaces if surface.name in self._surface_index]
+        if duplicates:
+            raise ValueError(f"Surfaces already in the store: {', '.join(duplicates)}")
+        performance = np.asarray(performance, dtype=np.float64)
+        expected = (len(self.vehicles), len(surfaces), len(BRAKE_METRICS))
+        if performance.shape != expected:
+            raise ValueError(f"performance has shape {performance.shape}, expected {expected}")
+        return ISOBaselineStore(self.vehicles, self.surfaces + tuple(surfaces), self.abs_scenarios,
+                                np.concatenate([self.performance, performance], axis=1),
+                                np.array(self.abs_performance), self.metadata, self.section_order)
+    
+    def vehicle_classes(self) -> Dict[str, str]:
+        """
+        Vehicle -> class label: test_vehicles[vehicle]['vehicle_class'], else the vehicle name
+        """
+        specs = self.metadata.get('test_vehicles', {})
+        return {vehicle: specs.get(vehicle, {}).get('vehicle_class', vehicle) for vehicle in self.vehicles}
+    
+    def content_digest(self) -> str:
+        """
+        Hash of the full store contents; equal data gives an equal digest whatever its source
+        """
+        digest = hashlib.sha256(json.dumps({
+            'vehicles': list(self.vehicles),
+            'surfaces': [[surface.name, surface.surface_mu, surface.test_speed_kmh] for surface in self.surfaces],
+            'abs_scenarios': [[getattr(scenario, slot) for slot in ABSScenario.__slots__]
+                              for scenario in self.abs_scenarios],
+            'metadata': self.metadata,
+            'section_order': list(self.section_order)
+        }, sort_keys=True, default=str).encode())
+        for array in (self.performance, self.abs_performance):
+            digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+    
+    def legacy_section(self, key: str):
+        """
+        One top-level section of the to_legacy_dict layout, built on its own
+        """
+        if key == 'baseline_performance':
+            baseline_performance = {}
+            for surface in self.surfaces:
+                vehicles, table = self.surface_table(surface.name)
+                section = {'surface_mu': surface.surface_mu, 'test_speed_kmh': surface.test_speed_kmh}
+                for vehicle, row in zip(vehicles, table.tolist()):
+                    section[vehicle] = dict(zip(BRAKE_METRICS, row))
+                baseline_performance[surface.name] = section
+            return baseline_performance
+        
+        if key == 'abs_performance':
+            abs_performance = {}
+            for scenario in self.abs_scenarios:
+                vehicles, table = self.abs_table(scenario.name)
+                section = {name: getattr(scenario, name) for name in _ABS_META_KEYS}
+                for vehicle, row in zip(vehicles, table.tolist()):
+                    section[vehicle] = dict(zip(ABS_METRICS, row))
+                abs_performance[scenario.name] = section
+            return abs_performance
+        
+        return copy.deepcopy(self.metadata[key])
+    
+    def to_legacy_dict(self) -> Dict:
+        """
+        Produce the nested dict layout historically returned by load_real_iso_brake_data
+        """
+        return {key: self.legacy_section(key) for key in self.section_order}
+    
+    def save(self, directory: str, source_stamp: Optional[List[int]] = None) -> str:
+        """
+        Write the store as a memory-mappable catalog directory (.npy arrays + JSON manifest)
+        
+        Each save writes new uniquely named array files and then swaps in the manifest
+        that lists them with os.replace, so a reader (or a crash) never pairs new arrays
+        with an old manifest. The arrays of the replaced manifest are removed afterwards.
+        """
+        os.makedirs(directory, exist_ok=True)
+        manifest_path = os.path.join(directory, _CATALOG_MANIFEST)
+        previous = _catalog_array_files(manifest_path)
+        
+        arrays = {}
+        try:
+            for name, values in (('performance', self.performance), ('abs_performance', self.abs_performance)):
+                fd, path = tempfile.mkstemp(dir=directory, prefix=name + '-', suffix='.npy')
+                arrays[name] = os.path.basename(path)
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, np.ascontiguousarray(values))
             
-            abs_results[vehicle_type] = {
-                'baseline_abs_performance': {
-                    'stopping_distance_m': baseline_distance,
-                    'max_yaw_rate_deg_s': baseline_yaw_rate,
-                    'lateral_displacement_m': baseline_lateral_disp,
-                    'abs_cycles_per_second': baseline_abs_cycles
-                },
-                'mhm_optimized_abs_performance': {
-                    'stopping_distance_m': mhm_distance,
-                    'max_yaw_rate_deg_s': mhm_yaw_rate,
-                    'lateral_displacement_m': mhm_lateral_disp,
-                    'abs_cycles_per_second': mhm_abs_cycles
-                },
-                'improvements': {
-                    'distance_reduction_percent': distance_improvement,
-                    'yaw_stability_improvement_percent': yaw_improvement,
-                    'lateral_displacement_reduction_percent': lateral_improvement,
-                    'abs_response_improvement_percent': abs_improvement
-                }
+            manifest = {
+                'format': BASELINE_CATALOG_FORMAT,
+                'vehicles': list(self.vehicles),
+                'brake_metrics': list(BRAKE_METRICS),
+                'abs_metrics': list(ABS_METRICS),
+                'surfaces': [[surface.name, surface.surface_mu, surface.test_speed_kmh]
+                             for surface in self.surfaces],
+                'abs_scenarios': [{slot: getattr(scenario, slot) for slot in ABSScenario.__slots__}
+                                  for scenario in self.abs_scenarios],
+                'section_order': list(self.section_order),
+                'metadata': self.metadata,
+                'arrays': arrays
             }
+            if source_stamp is not None:
+                manifest['source_stamp'] = list(source_stamp)
+            fd, path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(manifest, f)
+                os.replace(path, manifest_path)
+            except BaseException:
+                os.unlink(path)
+                raise
+        except BaseException:
+            for name in arrays.values():
+                os.unlink(os.path.join(directory, name))
+            raise
+        
+        for name in set(previous) - set(arrays.values()):
+            # Already gone, or still mapped by a reader on a platform that forbids removing it
+            with contextlib.suppress(OSError):
+                os.unlink(os.path.join(directory, name))
+        return directory
+    
+    @classmethod
+    def open(cls, directory: str, mmap_mode: Optional[str] = 'r') -> 'ISOBaselineStore':
+        """
+        Open a catalog written by save(); arrays are memory-mapped and shared via the page cache
+        """
+        try:
+            return cls._open(directory, mmap_mode)
+        except FileNotFoundError:
+            # A concurrent save replaced the manifest and removed the arrays it listed
+            return cls._open(directory, mmap_mode)
+    
+    @classmethod
+    def _open(cls, directory: str, mmap_mode: Optional[str]) -> 'ISOBaselineStore':
+        with open(os.path.join(directory, _CATALOG_MANIFEST)) as f:
+            manifest = json.load(f)
+        if manifest.get('format') != BASELINE_CATALOG_FORMAT:
+            raise ValueError(f"Unsupported baseline catalog format: {manifest.get('format')!r}")
+        if (tuple(manifest['brake_metrics']) != BRAKE_METRICS or
+                tuple(manifest['abs_metrics']) != ABS_METRICS):
+            raise ValueError(f"Baseline catalog {directory} uses a different metric layout")
+        
+        arrays = manifest.get('arrays', _CATALOG_ARRAYS)
+        return cls(manifest['vehicles'],
+                   [SurfaceCondition(*surface) for surface in manifest['surfaces']],
+                   [ABSScenario(**scenario) for scenario in manifest['abs_scenarios']],
+                   np.load(os.path.join(directory, arrays['performance']), mmap_mode=mmap_mode),
+                   np.load(os.path.join(directory, arrays['abs_performance']), mmap_mode=mmap_mode),
+                   manifest['metadata'], manifest['section_order'])
+    
+    @classmethod
+    def from_csv(cls, path: str) -> 'ISOBaselineStore':
+        """
+        Build a store from a long-format CSV, one row per condition × vehicle
+        
+        Straight-line rows carry condition, vehicle, surface_mu, test_speed_kmh and the
+        BRAKE_METRICS columns; ABS rows carry condition, vehicle, initial_speed_kmh,
+        left_surface_mu, right_surface_mu and the ABS_METRICS columns.
+        """
+        baseline_performance = {}
+        abs_performance = {}
+        
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                row = {key: value.strip() for key, value in row.items() if key and value and value.strip()}
+                if 'max_yaw_rate_deg_s' in row:
+                    section = abs_performance.setdefault(row['condition'], {
+                        'initial_speed_kmh': float(row['initial_speed_kmh']),
+                        'left_surface_mu': float(row['left_surface_mu']),
+                        'right_surface_mu': float(row['right_surface_mu']),
+                        'test_standard': row.get('test_standard', ''),
+                        'test_method': row.get('test_method', '')
+                    })
+                    section[row['vehicle']] = {name: float(row[name]) for name in ABS_METRICS}
+                else:
+                    section = baseline_performance.setdefault(row['condition'], {
+                        'surface_mu': float(row['surface_mu']),
+                        'test_speed_kmh': float(row['test_speed_kmh'])
+                    })
+                    section[row['vehicle']] = {name: float(row[name]) for name in BRAKE_METRICS}
         
-        results['abs_optimization'] = abs_results
+        return cls.from_iso_dict({
+            'standard_info': {'data_source': os.path.basename(path)},
+            'baseline_performance': baseline_performance,
+            'abs_performance': abs_performance
+        })
+
+
+def read_baseline_file(path: str) -> ISOBaselineStore:
+    """
+    Read an authored baseline file: JSON in the load_real_iso_brake_data layout, or long-format CSV
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        with open(path) as f:
+            return ISOBaselineStore.from_iso_dict(json.load(f))
+    if extension == '.csv':
+        return ISOBaselineStore.from_csv(path)
+    raise ValueError(f"Unsupported baseline file type: {path} (expected .json or .csv)")
+
+
+def _catalog_array_files(manifest_path: str) -> List[str]:
+    """Array file names listed by a catalog manifest; none when there is no manifest yet"""
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return []
+    return list(manifest.get('arrays', _CATALOG_ARRAYS).values())
+
+
+def _source_stamp(path: str) -> List[int]:
+    """Modification time and size used to detect changed baseline files"""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def compile_baseline_catalog(path: str, catalog_dir: Optional[str] = None) -> str:
+    """
+    Compile a JSON/CSV baseline file into a memory-mappable catalog directory
+    
+    The catalog defaults to <path>.catalog next to the source file; returns its path.
+    """
+    catalog_dir = catalog_dir or path + BASELINE_CATALOG_SUFFIX
+    # The source stamp lets open_baseline_catalog detect stale catalogs
+    stamp = _source_stamp(path)
+    return read_baseline_file(path).save(catalog_dir, source_stamp=stamp)
+
+
+def open_baseline_catalog(path: str, mmap_mode: Optional[str] = 'r') -> ISOBaselineStore:
+    """
+    Open baseline data from a catalog directory, or from a JSON/CSV file
+    
+    Authoring files are compiled to <path>.catalog on first use and recompiled
+    whenever the source file changes.
+    """
+    if os.path.isdir(path):
+        return ISOBaselineStore.open(path, mmap_mode)
+    
+    catalog_dir = path + BASELINE_CATALOG_SUFFIX
+    manifest_path = os.path.join(catalog_dir, _CATALOG_MANIFEST)
+    stale = True
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            stale = json.load(f).get('source_stamp') != _source_stamp(path)
+    if stale:
+        compile_baseline_catalog(path, catalog_dir)
+    return ISOBaselineStore.open(catalog_dir, mmap_mode)
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict handed out by the ISO data cache; copies of it are plain mutable dicts
+    """
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached ISO brake data is read-only; copy.deepcopy() it to modify")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __copy__(self) -> Dict:
+        return dict(self)
+    
+    def __deepcopy__(self, memo) -> Dict:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+    
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+    
+    def __hash__(self):
+        raise TypeError("unhashable type: 'FrozenDict'")
+
+
+def _freeze(value):
+    """Recursively convert dicts/lists to FrozenDict/tuples and NumPy arrays to read-only views"""
+    if isinstance(value, Mapping):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, np.ndarray):
+        value = value.view()  # Lock a view; the caller's own array stays writable
+        value.flags.writeable = False
+    return value
+
+
+# Process-wide ISO dataset cache
+BUILTIN_ISO_SOURCE = 'builtin'
+BUILTIN_ISO_DATA_VERSION = 'ISO 21994:2007 / ISO 14512:1999 rev 1'
+
+_ISO_DATA_CACHE: Dict[Tuple[str, str], '_CachedISODataset'] = {}
+_ISO_DATA_CACHE_LOCK = threading.RLock()
+
+
+def normalize_source(source: str) -> str:
+    """Cache key form of a data source: 'builtin' or an absolute file/catalog path"""
+    return source if source == BUILTIN_ISO_SOURCE else os.path.abspath(source)
+
+
+def _iso_source_version(source: str) -> str:
+    """Version component of the cache key for a data source"""
+    if source == BUILTIN_ISO_SOURCE:
+        return BUILTIN_ISO_DATA_VERSION
+    stamp_path = os.path.join(source, _CATALOG_MANIFEST) if os.path.isdir(source) else source
+    if not os.path.exists(stamp_path):
+        raise FileNotFoundError(f"ISO baseline data source not found: {source}")
+    return '{}:{}'.format(*_source_stamp(stamp_path))
+
+
+def _build_iso_store(source: str) -> ISOBaselineStore:
+    """Build the columnar store for a data source (cache miss path)"""
+    if source == BUILTIN_ISO_SOURCE:
+        return ISOBaselineStore.from_iso_dict(_REAL_ISO_BRAKE_DATA)
+    return open_baseline_catalog(source)
+
+
+class _CachedISODataset:
+    """Cache entry: shared store plus its frozen legacy sections, each built on first request"""
+    
+    __slots__ = ('store', '_sections', '_view')
+    
+    def __init__(self, store: ISOBaselineStore):
+        self.store = store
+        self._sections = {}
+        self._view = None
+    
+    def section(self, key: str):
+        with _ISO_DATA_CACHE_LOCK:
+            if key not in self._sections:
+                self._sections[key] = _freeze(self.store.legacy_section(key))
+            return self._sections[key]
+    
+    def view(self) -> FrozenDict:
+        with _ISO_DATA_CACHE_LOCK:
+            if self._view is None:
+                self._view = FrozenDict((key, self.section(key)) for key in self.store.section_order)
+            return self._view
+
+
+class ISODataView(MappingABC):
+    """
+    Lazy read-only legacy view of a cached data source
+    
+    Reads like the FrozenDict from get_iso_brake_data, but each top-level section is
+    built on first access, so a large catalog only pays for the sections a caller
+    touches. to_dict() returns the full FrozenDict.
+    """
+    
+    __slots__ = ('_dataset',)
+    
+    def __init__(self, dataset: _CachedISODataset):
+        self._dataset = dataset
+    
+    @property
+    def store(self) -> ISOBaselineStore:
+        """The shared columnar store behind the view"""
+        return self._dataset.store
+    
+    def __getitem__(self, key: str):
+        if key not in self._dataset.store.section_order:
+            raise KeyError(key)
+        return self._dataset.section(key)
+    
+    def __iter__(self):
+        return iter(self._dataset.store.section_order)
+    
+    def __len__(self) -> int:
+        return len(self._dataset.store.section_order)
+    
+    def to_dict(self) -> FrozenDict:
+        return self._dataset.view()
+    
+    def __reduce__(self):
+        return self.to_dict().__reduce__()
+    
+    def __repr__(self) -> str:
+        return f"ISODataView({', '.join(self._dataset.store.section_order)})"
+
+
+def _load_iso_dataset(source: str) -> Tuple[_CachedISODataset, bool]:
+    """
+    Return (cache entry, loaded_now) for a source, building its store on a cache miss
+    """
+    source = normalize_source(source)
+    key = (source, _iso_source_version(source))
+    with _ISO_DATA_CACHE_LOCK:
+        cached = _ISO_DATA_CACHE.get(key)
+        if cached is not None:
+            return cached, False
+        
+        store = _build_iso_store(source)
+        for array in (store.performance, store.abs_performance):
+            array.flags.writeable = False
+        store.metadata = _freeze(store.metadata)
+        
+        # A new version of the same source replaces the stale entry
+        for stale in [k for k in _ISO_DATA_CACHE if k[0] == source]:
+            del _ISO_DATA_CACHE[stale]
+        _ISO_DATA_CACHE[key] = cached = _CachedISODataset(store)
+        return cached, True
+
+
+def get_iso_store(source: str = BUILTIN_ISO_SOURCE) -> ISOBaselineStore:
+    """
+    Shared, read-only columnar store for a data source, built once per source version
+    """
+    return _load_iso_dataset(source)[0].store
+
+
+def get_builtin_iso_store() -> ISOBaselineStore:
+    """
+    Shared columnar store of the built-in ISO 21994 / ISO 14512 baseline data, built once
+    """
+    return get_iso_store(BUILTIN_ISO_SOURCE)
+
+
+def get_iso_brake_data(source: str = BUILTIN_ISO_SOURCE) -> FrozenDict:
+    """
+    Shared, read-only legacy dict view of a data source
+    """
+    return _load_iso_dataset(source)[0].view()
+
+
+def iso_source_id(source: str = BUILTIN_ISO_SOURCE) -> str:
+    """
+    Stable identifier of a data source at its current version, e.g. for referencing it in result files
+    """
+    source = normalize_source(source)
+    return f"{source}@{_iso_source_version(source)}"
+
+
+def invalidate_iso_data_cache(source: Optional[str] = None) -> int:
+    """
+    Drop cached datasets for one source (or all sources); returns the number of entries removed
+    """
+    with _ISO_DATA_CACHE_LOCK:
+        source = None if source is None else normalize_source(source)
+        keys = [key for key in _ISO_DATA_CACHE if source is None or key[0] == source]
+        for key in keys:
+            del _ISO_DATA_CACHE[key]
+        return len(keys)
+
+
+def reload_iso_brake_data(source: str = BUILTIN_ISO_SOURCE) -> FrozenDict:
+    """
+    Force a rebuild of a data source, e.g. after swapping in a new baseline file
+    """
+    with _ISO_DATA_CACHE_LOCK:
+        invalidate_iso_data_cache(source)
+        return get_iso_brake_data(source)
+
+
+class _ConsoleHandler(logging.Handler):
+    """Write bare messages to the current sys.stdout, matching the historical print output"""
+    
+    def emit(self, record):
+        try:
+            print(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def _console_logger() -> logging.Logger:
+    """Logger used by verbose optimizers and main() for the console progress report"""
+    console = logging.getLogger(f"{__name__}.console")
+    if not console.handlers:
+        console.addHandler(_ConsoleHandler())
+        console.setLevel(logging.INFO)
+        console.propagate = False
+    return console
+
+
+class MHMBrakePerformanceOptimizer:
+    """
+    Advanced brake performance optimization using Tesla Folding Engine and real ISO data
+    """
+    
+    def __init__(self, consciousness_level: float = 0.820, tesla_multiplier: float = 2.380,
+                 proven_improvement: float = 23.4, verbose: bool = False,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize with proven Tesla Folding parameters
+        
+        Progress messages go to logger (default: this module's logger, silent unless
+        logging is configured); verbose=True prints them to the console instead.
+        """
+        self.consciousness_level = consciousness_level  # From AC system
+        self.tesla_multiplier = tesla_multiplier        # Proven Tesla Folding
+        self.proven_improvement = proven_improvement    # Mining success %
         
-        # Tesla Folding factors
-        results['tesla_folding_factors'] = {
+        self.logger = _console_logger() if verbose else (logger or logging.getLogger(__name__))
+        
+        # Incremental runs: test -> (multiplier salt, vehicle -> row, condition -> column,
+        #                            baseline, optimized, improvements) of the previous run
+        self._folding_cache: Dict[str, Tuple[bytes, Dict[str, int], Dict[str, int],
+                                             np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._component_cache: Optional[Tuple[str, Dict]] = None
+        
+        self.logger.info("🛑 MHM Brake Performance Optimization System")
+        self.logger.info("   Tesla Folding Engine: %s%% proven improvement", self.proven_improvement)
+        self.logger.info("   Consciousness Level: %s", self.consciousness_level)
+        self.logger.info("   Data Source: Real ISO 21994 brake standards")
+    
+    def load_real_iso_brake_data(self, source: str = BUILTIN_ISO_SOURCE, reload: bool = False,
+                                 lazy: bool = False) -> Mapping:
+        """
+        Load real brake performance data from ISO standards and research
+        
+        source is 'builtin' for the bundled ISO tables, or a JSON/CSV baseline file /
+        compiled catalog directory (see open_baseline_catalog). The dataset is cached
+        process-wide per source/version and returned as a read-only view; pass
+        reload=True to rebuild it from the source. lazy=True returns an ISODataView
+        that builds each section on first access instead of the whole dict up front.
+        """
+        if reload:
+            invalidate_iso_data_cache(source)
+        dataset, loaded_now = _load_iso_dataset(source)
+        iso_brake_data = ISODataView(dataset) if lazy else dataset.view()
+        if not loaded_now:
+            return iso_brake_data
+        
+        store = dataset.store
+        self.logger.info("\n🛑 Loading Real ISO Brake Performance Data...")
+        self.logger.info("  ✅ Loaded: %s", store.metadata.get('standard_info', {}).get('title', source))
+        self.logger.info("     Test Vehicles: %d", len(store.metadata.get('test_vehicles', store.vehicles)))
+        self.logger.info("     Test Conditions: %d", len(store.surfaces))
+        self.logger.info("     ABS Scenarios: %d", len(store.abs_scenarios))
+        
+        return iso_brake_data
+    
+    def system_info(self) -> Dict:
+        """
+        Optimizer configuration summary included with every result
+        """
+        return {
+            'tesla_folding_proven_improvement': f"{self.proven_improvement}%",
+            'consciousness_level': self.consciousness_level,
+            'tesla_multiplier': self.tesla_multiplier,
+            'data_source': 'Real ISO 21994 brake standards'
+        }
+    
+    def tesla_folding_factors(self) -> Dict:
+        """
+        Tesla Folding enhancement factors derived from the optimizer parameters
+        """
+        tesla_brake_factor, consciousness_modulation_factor = _folding_factors(
+            self.consciousness_level, self.proven_improvement)
+        return {
             'brake_enhancement_factor': tesla_brake_factor,
             'consciousness_modulation_factor': consciousness_modulation_factor,
             'tesla_multiplier': self.tesla_multiplier,
             'proven_improvement_baseline': self.proven_improvement
         }
+    
+    def brake_multipliers(self) -> np.ndarray:
+        """
+        Tesla Folding multiplier per BRAKE_METRICS entry for straight-line braking
+        """
+        return _brake_multipliers(*_folding_factors(self.consciousness_level, self.proven_improvement))
+    
+    def stopping_distance_multiplier(self) -> float:
+        """
+        Factor the folding engine applies to straight-line stopping distances
+        """
+        return float(self.brake_multipliers()[BRAKE_METRICS.index('stopping_distance_m')])
+    
+    def component_factors(self) -> Tuple[float, float]:
+        """
+        (consciousness_factor, tesla_factor) scaling every component optimization field
+        """
+        return _component_factors(self.consciousness_level, self.proven_improvement)
+    
+    def apply_tesla_folding_batch(self, dry_asphalt: Optional[MetricInput] = None,
+                                  abs_split_mu: Optional[MetricInput] = None,
+                                  vehicles: Optional[Sequence[str]] = None) -> TeslaFoldingBatchResult:
+        """
+        Apply Tesla Folding to whole fleets of baseline values in one vectorized pass
         
-        return results
+        Each input is a structured array (BRAKE_BASELINE_DTYPE / ABS_BASELINE_DTYPE),
+        a mapping of metric name to 1-D array, or a plain (N, 4) array in metric order.
+        """
+        factors = self.tesla_folding_factors()
+        tesla_brake_factor = factors['brake_enhancement_factor']
+        consciousness_modulation_factor = factors['consciousness_modulation_factor']
+        
+        def fold(data, metric_names, improvement_names, section_names, multipliers, sign):
+            baseline = _as_metric_matrix(data, metric_names)
+            names = vehicles if vehicles is not None else [f"vehicle_{i}" for i in range(len(baseline))]
+            if len(names) != len(baseline):
+                raise ValueError(f"Got {len(names)} vehicle names for {len(baseline)} baseline rows")
+            optimized, improvements = _fold_metrics(baseline, multipliers, sign)
+            return FoldedMetrics(names, metric_names, improvement_names, section_names,
+                                 baseline, optimized, improvements)
+        
+        dry_results = None
+        if dry_asphalt is not None:
+            dry_results = fold(dry_asphalt, BRAKE_METRICS, BRAKE_IMPROVEMENTS,
+                               ('baseline_performance', 'mhm_optimized_performance'),
+                               _brake_multipliers(tesla_brake_factor, consciousness_modulation_factor),
+                               BRAKE_IMPROVEMENT_SIGN)
+        
+        abs_results = None
+        if abs_split_mu is not None:
+            abs_results = fold(abs_split_mu, ABS_METRICS, ABS_IMPROVEMENTS,
+                               ('baseline_abs_performance', 'mhm_optimized_abs_performance'),
+                               _abs_multipliers(tesla_brake_factor, consciousness_modulation_factor),
+                               ABS_IMPROVEMENT_SIGN)
+        
+        return TeslaFoldingBatchResult(dry_results, abs_results, factors)
+    
+    def apply_tesla_folding_to_conditions(self, iso_data: Union[Dict, ISOBaselineStore],
+                                          surfaces: Optional[Sequence[str]] = None,
+                                          abs_scenarios: Optional[Sequence[str]] = None) -> ConditionFoldingResult:
+        """
+        Apply Tesla Folding to every surface and ABS scenario of a dataset in one pass
+        
+        Each test is a single vectorized fold over the whole (vehicles, conditions,
+        metrics) array, however many conditions the store holds. surfaces and
+        abs_scenarios optionally restrict the conditions by name.
+        """
+        store = iso_data if isinstance(iso_data, ISOBaselineStore) else ISOBaselineStore.from_iso_dict(iso_data)
+        surface_columns = (list(range(len(store.surfaces))) if surfaces is None
+                           else [store.surface_index(name) for name in surfaces])
+        abs_columns = (list(range(len(store.abs_scenarios))) if abs_scenarios is None
+                       else [store.abs_index(name) for name in abs_scenarios])
+        
+        factors = self.tesla_folding_factors()
+        tesla_brake_factor = factors['brake_enhancement_factor']
+        consciousness_modulation_factor = factors['consciousness_modulation_factor']
+        
+        braking_baseline = np.asarray(store.performance)[:, surface_columns]
+        abs_baseline = np.asarray(store.abs_performance)[:, abs_columns]
+        braking = (braking_baseline,) + _fold_metrics(
+            braking_baseline, _brake_multipliers(tesla_brake_factor, consciousness_modulation_factor),
+            BRAKE_IMPROVEMENT_SIGN)
+        abs_split_mu = (abs_baseline,) + _fold_metrics(
+            abs_baseline, _abs_multipliers(tesla_brake_factor, consciousness_modulation_factor),
+            ABS_IMPROVEMENT_SIGN)
+        
+        return ConditionFoldingResult(store.vehicles, [store.surfaces[j] for j in surface_columns],
+                                      [store.abs_scenarios[j] for j in abs_columns],
+                                      braking, abs_split_mu, factors, store.vehicle_classes())
+    
+    def apply_tesla_folding_to_brake_performance(self, iso_data: Union[Dict, ISOBaselineStore],
+                                                 lazy: bool = False) -> Union[Dict, ConditionFoldingResult]:
+        """
+        Apply Tesla Folding Engine optimization to brake performance on every test condition
+        
+        lazy=True returns the ConditionFoldingResult itself: the same keys, but every
+        vehicle result is a view over the arrays that converts values on access, and
+        to_dict() builds the nested dicts only when they are needed.
+        """
+        self.logger.info("\n⚡ Applying Tesla Folding (%s%% proven) to Brake Performance...", self.proven_improvement)
+        
+        store = iso_data if isinstance(iso_data, ISOBaselineStore) else ISOBaselineStore.from_iso_dict(iso_data)
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            for surface in store.surfaces:
+                self.logger.info("  🛑 Optimizing %s braking...", surface.name.replace('_', ' '))
+                for vehicle_type in store.surface_table(surface.name)[0]:
+                    self.logger.info("    Optimizing %s...", vehicle_type.replace('_', ' '))
+            for scenario in store.abs_scenarios:
+                self.logger.info("  🔄 Optimizing ABS %s performance...", scenario.name.replace('_', ' '))
+                for vehicle_type in store.abs_table(scenario.name)[0]:
+                    self.logger.info("    Optimizing %s ABS...", vehicle_type.replace('_', ' '))
+        
+        # Single vectorized pass per test, then the legacy nested dict view unless lazy
+        folded = self.apply_tesla_folding_to_conditions(store)
+        return folded if lazy else folded.to_dict()
+    
+    def apply_tesla_folding_incremental(self, iso_data: Union[Dict, ISOBaselineStore]
+                                        ) -> Tuple[ConditionFoldingResult, RecomputationReport]:
+        """
+        Fold every condition like apply_tesla_folding_to_conditions, reusing unchanged results
+        
+        The previous call's baseline arrays are kept with a row per vehicle and a
+        column per condition; one vectorized comparison against them finds the
+        vehicle × condition results whose baseline row changed (or is new), and only
+        those are folded again (in one vectorized pass per test). Changing the
+        optimizer parameters therefore recomputes everything.
+        """
+        store = iso_data if isinstance(iso_data, ISOBaselineStore) else ISOBaselineStore.from_iso_dict(iso_data)
+        factors = self.tesla_folding_factors()
+        tesla_brake_factor = factors['brake_enhancement_factor']
+        consciousness_modulation_factor = factors['consciousness_modulation_factor']
+        
+        recomputed = []
+        reused = 0
+        dropped = []
+        folded = {}
+        for test, conditions, baseline, multipliers, sign in (
+                ('braking', store.surfaces, np.asarray(store.performance),
+                 _brake_multipliers(tesla_brake_factor, consciousness_modulation_factor), BRAKE_IMPROVEMENT_SIGN),
+                ('abs_split_mu', store.abs_scenarios, np.asarray(store.abs_performance),
+                 _abs_multipliers(tesla_brake_factor, consciousness_modulation_factor), ABS_IMPROVEMENT_SIGN)):
+            salt = multipliers.tobytes() + sign.tobytes()
+            names = [condition.name for condition in conditions]
+            optimized = np.empty(baseline.shape)
+            improvements = np.empty(baseline.shape)
+            stale = np.ones(baseline.shape[:2], dtype=bool)
+            
+            previous = self._folding_cache.get(test)
+            if previous is not None:
+                previous_salt, previous_rows, previous_columns = previous[:3]
+                if previous_salt == salt:
+                    rows = np.array([previous_rows.get(vehicle, -1) for vehicle in store.vehicles], dtype=np.intp)
+                    columns = np.array([previous_columns.get(name, -1) for name in names], dtype=np.intp)
+                    known = (rows >= 0)[:, None] & (columns >= 0)[None, :]
+                    if known.any():
+                        index = np.ix_(np.maximum(rows, 0), np.maximum(columns, 0))
+                        cached_baseline, cached_optimized, cached_improvements = (
+                            values[index] for values in previous[3:])
+                        unchanged = ((cached_baseline == baseline) |
+                                     (np.isnan(cached_baseline) & np.isnan(baseline))).all(axis=-1)
+                        stale = ~(known & unchanged)
+                        optimized[~stale] = cached_optimized[~stale]
+                        improvements[~stale] = cached_improvements[~stale]
+                
+                # Results for vehicles or conditions that left the dataset are forgotten
+                vehicles, current_names = set(store.vehicles), set(names)
+                dropped.extend((test, condition, vehicle) for vehicle in previous_rows for condition in previous_columns
+                               if vehicle not in vehicles or condition not in current_names)
+            
+            if stale.any():
+                optimized[stale], improvements[stale] = _fold_metrics(baseline[stale], multipliers, sign)
+            present = ~np.isnan(baseline).all(axis=-1)
+            recomputed.extend((test, names[j], store.vehicles[i]) for i, j in zip(*np.nonzero(stale & present)))
+            reused += int((present & ~stale).sum())
+            
+            self._folding_cache[test] = (salt, {vehicle: i for i, vehicle in enumerate(store.vehicles)},
+                                         {name: j for j, name in enumerate(names)},
+                                         np.array(baseline), optimized.copy(), improvements.copy())
+            folded[test] = (baseline, optimized, improvements)
+        
+        result = ConditionFoldingResult(store.vehicles, store.surfaces, store.abs_scenarios,
+                                        folded['braking'], folded['abs_split_mu'], factors, store.vehicle_classes())
+        return result, RecomputationReport(recomputed, reused, dropped)
+    
+    def sweep_parameters(self, consciousness_levels: Sequence[float], proven_improvements: Sequence[float],
+                         iso_data: Union[Dict, ISOBaselineStore, None] = None) -> ParameterSweepResult:
+        """
+        Evaluate every vehicle × condition × (consciousness_level, proven_improvement) grid point
+        
+        The whole grid is one broadcasted NumPy computation over the columnar store;
+        no optimizer instances are created per grid point. iso_data defaults to the
+        cached built-in dataset.
+        """
+        if iso_data is None:
+            store = get_builtin_iso_store()
+        elif isinstance(iso_data, ISOBaselineStore):
+            store = iso_data
+        else:
+            store = ISOBaselineStore.from_iso_dict(iso_data)
+        
+        levels = np.asarray(consciousness_levels, dtype=np.float64).reshape(-1)
+        improvements = np.asarray(proven_improvements, dtype=np.float64).reshape(-1)
+        grid_levels = levels[:, None]
+        grid_improvements = improvements[None, :]
+        grid_coords = {'consciousness_level': levels.tolist(), 'proven_improvement': improvements.tolist()}
+        
+        # (C, P, 1, 1, M) multipliers against (V, S, M) baselines -> (C, P, V, S, M)
+        tesla_brake_factor, consciousness_modulation_factor = _folding_factors(grid_levels, grid_improvements)
+        braking_optimized, braking_improvements = _fold_metrics(
+            store.performance,
+            _brake_multipliers(tesla_brake_factor, consciousness_modulation_factor)[:, :, None, None, :],
+            BRAKE_IMPROVEMENT_SIGN)
+        abs_optimized, abs_improvements = _fold_metrics(
+            store.abs_performance,
+            _abs_multipliers(tesla_brake_factor, consciousness_modulation_factor)[:, :, None, None, :],
+            ABS_IMPROVEMENT_SIGN)
+        
+        braking = LabelledCube(
+            np.concatenate([braking_optimized, braking_improvements], axis=-1),
+            ('consciousness_level', 'proven_improvement', 'vehicle', 'surface', 'field'),
+            dict(grid_coords, vehicle=store.vehicles, surface=[surface.name for surface in store.surfaces],
+                 field=BRAKE_METRICS + BRAKE_IMPROVEMENTS))
+        abs_split_mu = LabelledCube(
+            np.concatenate([abs_optimized, abs_improvements], axis=-1),
+            ('consciousness_level', 'proven_improvement', 'vehicle', 'scenario', 'field'),
+            dict(grid_coords, vehicle=store.vehicles, scenario=[scenario.name for scenario in store.abs_scenarios],
+                 field=ABS_METRICS + ABS_IMPROVEMENTS))
+        
+        components = None
+        system_specs = store.metadata.get('brake_system_specs')
+        if system_specs is not None:
+            consciousness_factor, tesla_factor = _component_factors(grid_levels, grid_improvements)
+            fields = _component_fields(system_specs, consciousness_factor, tesla_factor)
+            names = [f"{section}.{name}" for section, values in fields.items() for name in values]
+            grid_shape = (len(levels), len(improvements))
+            components = LabelledCube(
+                np.stack([np.broadcast_to(np.asarray(value, dtype=np.float64), grid_shape)
+                          for values in fields.values() for value in values.values()], axis=-1),
+                ('consciousness_level', 'proven_improvement', 'field'),
+                dict(grid_coords, field=names))
+        
+        return ParameterSweepResult(braking, abs_split_mu, components, store.vehicle_classes())
     
-    def optimize_brake_system_components(self, iso_data: Dict) -> Dict:
+    def optimize_brake_system_components(self, iso_data: Dict, search: bool = False, **search_options) -> Dict:
         """
         Optimize individual brake system components using consciousness algorithms
+        
+        With search=True a constrained design search against the stopping-distance
+        simulator is added under 'design_search'; search_options go to
+        mhm_brake_component_search.search_component_settings.
         """
-        print("\n🔧 Optimizing Brake System Components...")
+        self.logger.info("\n🔧 Optimizing Brake System Components...")
         
         system_specs = iso_data['brake_system_specs']
         
         # Consciousness-enhanced component optimization
-        consciousness_factor = self.consciousness_level * 0.12  # 12% max component improvement
-        tesla_factor = self.proven_improvement / 100 * 0.15  # 15% Tesla enhancement
-        
-        component_optimization = {
-            'hydraulic_system': {
-                'baseline_pressure_bar': system_specs['hydraulic_pressure_bar'],
-                'mhm_optimized_pressure_bar': system_specs['hydraulic_pressure_bar'] * (1 + tesla_factor),
-                'pressure_improvement_percent': tesla_factor * 100,
-                'response_time_improvement_ms': consciousness_factor * 50  # Milliseconds faster
-            },
-            'pad_friction_optimization': {
-                'baseline_friction_coefficient': system_specs['pad_friction_coefficient'],
-                'mhm_optimized_friction_coefficient': system_specs['pad_friction_coefficient'] * (1 + consciousness_factor),
-                'friction_improvement_percent': consciousness_factor * 100,
-                'temperature_stability_improvement_c': tesla_factor * 100  # Better high-temp performance
-            },
-            'abs_control_enhancement': {
-                'baseline_frequency_hz': system_specs['abs_control_frequency_hz'],
-                'mhm_optimized_frequency_hz': system_specs['abs_control_frequency_hz'] * (1 + tesla_factor * 2),
-                'frequency_improvement_percent': tesla_factor * 200,
-                'reaction_time_improvement_ms': consciousness_factor * 25  # Faster intervention
-            },
-            'esc_integration': {
-                'baseline_threshold_g': system_specs['esc_intervention_threshold_g'],
-                'mhm_optimized_threshold_g': system_specs['esc_intervention_threshold_g'] * (1 - consciousness_factor),
-                'sensitivity_improvement_percent': consciousness_factor * 100,
-                'stability_enhancement': 'Consciousness-driven predictive intervention'
-            }
-        }
+        consciousness_factor, tesla_factor = self.component_factors()
+        
+        component_optimization = _component_fields(system_specs, consciousness_factor, tesla_factor)
+        component_optimization['esc_integration']['stability_enhancement'] = (
+            'Consciousness-driven predictive intervention')
+        
+        if search:
+            from mhm_brake_component_search import search_component_settings
+            component_optimization['design_search'] = search_component_settings(iso_data, **search_options).to_dict()
         
         return component_optimization
     
-    def run_complete_brake_optimization(self) -> Dict:
+    def _optimize_components_incremental(self, iso_data: Mapping) -> Tuple[Dict, bool]:
+        """
+        (component optimization, recomputed) reusing the previous result for unchanged specs
+        """
+        digest = _content_digest(
+            json.dumps([self.consciousness_level, self.proven_improvement]).encode(),
+            json.dumps(iso_data['brake_system_specs'], sort_keys=True, default=str).encode())
+        if self._component_cache is not None and self._component_cache[0] == digest:
+            return copy.deepcopy(self._component_cache[1]), False
+        component_optimization = self.optimize_brake_system_components(iso_data)
+        self._component_cache = (digest, copy.deepcopy(component_optimization))
+        return component_optimization, True
+    
+    def overall_performance(self, folded: ConditionFoldingResult) -> Dict:
+        """
+        Fleet-wide summary of a folding result: headline averages plus full improvement statistics
+        
+        Statistics pool every vehicle and condition of each test; vehicle_class_statistics
+        repeats them per vehicle class.
+        """
+        statistics = folded.statistics()
+        braking, abs_split_mu = statistics['braking'], statistics['abs_split_mu']
+        return {
+            'average_distance_reduction': braking.get('distance_reduction_percent'),
+            'average_abs_distance_reduction': abs_split_mu.get('distance_reduction_percent'),
+            'average_yaw_stability_improvement': abs_split_mu.get('yaw_stability_improvement_percent'),
+            'tesla_folding_foundation': self.proven_improvement,
+            'consciousness_level': self.consciousness_level,
+            'improvement_statistics': {test: values.to_dict()['all'] for test, values in statistics.items()},
+            'vehicle_class_statistics': {test: values.to_dict()
+                                         for test, values in folded.statistics('vehicle_class').items()}
+        }
+    
+    def result_cache_key(self, source: str = BUILTIN_ISO_SOURCE) -> str:
+        """
+        Persistent cache key for a complete run: optimizer parameters plus dataset content
+        """
+        parameters = {key: getattr(self, key) for key in ('consciousness_level', 'tesla_multiplier',
+                                                          'proven_improvement')}
+        return result_cache_key(parameters, get_iso_store(source).content_digest())
+    
+    def run_complete_brake_optimization(self, source: str = BUILTIN_ISO_SOURCE, incremental: bool = False,
+                                        cache: Optional[ResultCache] = None, lazy: bool = False) -> Dict:
         """
         Run complete brake performance optimization analysis
+        
+        With incremental=True only the vehicle × condition results (and component
+        results) whose inputs changed since this optimizer's previous incremental
+        run are recomputed; the rest are reused, and the results gain a
+        'recomputation' report listing what was recomputed.
+        
+        With a ResultCache, a run whose parameters and baseline data match a
+        cached run is read from disk instead of recomputed. Cached and freshly
+        stored results are returned in their JSON form (lists, plain dicts) and
+        omit 'iso_source_data': the cache key already carries the source's content
+        digest, and get_iso_brake_data(source) returns the data itself. A cache
+        cannot be combined with incremental=True (ValueError).
+        
+        lazy=True leaves 'brake_performance_optimization' as a ConditionFoldingResult
+        (see apply_tesla_folding_to_brake_performance) and 'iso_source_data' as an
+        ISODataView, so a large catalog's legacy dict is never built unless read;
+        cached runs are always plain.
         """
-        print("\n" + "="*70)
-        print("🛑 MHM BRAKE PERFORMANCE OPTIMIZATION - COMPLETE ANALYSIS")
-        print("="*70)
+        if cache is not None:
+            if incremental:
+                raise ValueError("incremental runs cannot use a result cache")
+            key = self.result_cache_key(source)
+            cached = cache.get(key)
+            if cached is not None:
+                self.logger.info("\n♻️ Loaded cached brake optimization results (%s)", key[:12])
+                return cached
+            result = self.run_complete_brake_optimization(source, lazy=True)
+            del result['iso_source_data']
+            result['brake_performance_optimization'] = result['brake_performance_optimization'].to_dict()
+            return cache.put(key, result)
         
-        # Load real ISO data
-        iso_data = self.load_real_iso_brake_data()
+        self.logger.info("\n%s", "="*70)
+        self.logger.info("🛑 MHM BRAKE PERFORMANCE OPTIMIZATION - COMPLETE ANALYSIS")
+        self.logger.info("%s", "="*70)
         
-        # Apply Tesla Folding optimization
-        brake_performance_optimization = self.apply_tesla_folding_to_brake_performance(iso_data)
+        # Load real ISO data; sections are only built when something reads them
+        iso_data = self.load_real_iso_brake_data(source, lazy=True)
         
-        # Optimize brake system components
-        component_optimization = self.optimize_brake_system_components(iso_data)
+        if incremental:
+            folded, report = self.apply_tesla_folding_incremental(get_iso_store(source))
+            brake_performance_optimization = folded if lazy else folded.to_dict()
+            component_optimization, report.components_recomputed = self._optimize_components_incremental(iso_data)
+            
+            self.logger.info("\n♻️ Incremental run: %d results recomputed, %d reused",
+                             len(report.recomputed), report.reused)
+            for test, condition, vehicle in report.recomputed:
+                self.logger.info("    Recomputed %s %s", vehicle.replace('_', ' '), condition.replace('_', ' '))
+        else:
+            # Apply Tesla Folding optimization
+            folded = self.apply_tesla_folding_to_brake_performance(iso_data, lazy=True)
+            brake_performance_optimization = folded if lazy else folded.to_dict()
+            
+            # Optimize brake system components
+            component_optimization = self.optimize_brake_system_components(iso_data)
         
         # Compile complete results
         complete_results = {
-            'system_info': {
-                'tesla_folding_proven_improvement': f"{self.proven_improvement}%",
-                'consciousness_level': self.consciousness_level,
-                'tesla_multiplier': self.tesla_multiplier,
-                'data_source': 'Real ISO 21994 brake standards'
-            },
-            'iso_source_data': iso_data,
+            'system_info': self.system_info(),
+            'iso_source_data': iso_data if lazy else iso_data.to_dict(),
             'brake_performance_optimization': brake_performance_optimization,
             'component_optimization': component_optimization,
+            'overall_performance': self.overall_performance(folded),
             'validation_status': 'Based on real ISO brake standards',
             'commercial_readiness': 'Ready for OEM brake system implementation'
         }
+        if incremental:
+            complete_results['recomputation'] = report.to_dict()
         
         return complete_results
 
 
-def main():
+
+# Keys accepted in each run_brake_optimization_batch job
+BATCH_JOB_KEYS = ('consciousness_level', 'tesla_multiplier', 'proven_improvement', 'source')
+
+
+def validate_batch_jobs(jobs: Iterable[Mapping]) -> List[Dict]:
+    """
+    Copies of batch job mappings with normalized sources; unknown keys raise ValueError
+    """
+    jobs = [dict(job) for job in jobs]
+    for job in jobs:
+        unknown = set(job) - set(BATCH_JOB_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown batch job keys: {', '.join(sorted(unknown))}")
+        if 'source' in job:
+            job['source'] = normalize_source(job['source'])
+    return jobs
+
+
+def _init_batch_worker(sources: Sequence[str]):
+    """Warm the worker's ISO data cache once; catalog arrays are memory-mapped, not pickled"""
+    for source in sources:
+        get_iso_store(source)
+
+
+def _run_batch_chunk(jobs: Sequence[Mapping]) -> List[Dict]:
+    """Run one chunk of batch jobs sequentially inside a worker"""
+    results = []
+    for job in jobs:
+        optimizer = MHMBrakePerformanceOptimizer(**{key: job[key] for key in BATCH_JOB_KEYS[:3] if key in job})
+        result = optimizer.run_complete_brake_optimization(job.get('source', BUILTIN_ISO_SOURCE), lazy=True)
+        # The parent already holds the source data; never build or pickle it per job
+        del result['iso_source_data']
+        result['brake_performance_optimization'] = result['brake_performance_optimization'].to_dict()
+        results.append(result)
+    return results
+
+
+def run_brake_optimization_batch(jobs: Sequence[Mapping], max_workers: Optional[int] = None,
+                                 chunksize: Optional[int] = None) -> List[Dict]:
+    """
+    Run many independent run_complete_brake_optimization configurations on a process pool
+    
+    Each job is a mapping with any of consciousness_level, tesla_multiplier,
+    proven_improvement and source (a baseline file or catalog path; defaults to the
+    built-in data). Workers load each distinct source once and share catalog arrays
+    through memory mapping; jobs travel as small parameter dicts in chunks. Results
+    are returned in input order. max_workers=1 runs in the calling process.
+    
+    Results omit 'iso_source_data'; get_iso_brake_data(source) returns it.
+    """
+    jobs = validate_batch_jobs(jobs)
+    if not jobs:
+        return []
+    
+    sources = sorted({job.get('source', BUILTIN_ISO_SOURCE) for job in jobs})
+    # Compile and cache every source up front so forked workers inherit it and fail fast on bad paths
+    _init_batch_worker(sources)
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        return _run_batch_chunk(jobs)
+    
+    chunksize = chunksize or max(1, -(-len(jobs) // (max_workers * 4)))
+    chunks = [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]
+    
+    results = []
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)), initializer=_init_batch_worker,
+                             initargs=(sources,)) as executor:
+        # map() yields chunk results in submission order, keeping the merge deterministic
+        for chunk_results in executor.map(_run_batch_chunk, chunks):
+            results.extend(chunk_results)
+    return results
+
+
+# Default NDJSON results stream written by main()
+DEFAULT_RESULTS_STREAM = 'mhm_brake_optimization_results.ndjson'
+
+
+def main(argv: Optional[Sequence[str]] = None):
     """
     Run complete MHM brake performance optimization
     """
-    # Initialize optimizer
-    optimizer = MHMBrakePerformanceOptimizer()
+    parser = argparse.ArgumentParser(description="Run the MHM brake performance optimization")
+    parser.add_argument('--source', default=BUILTIN_ISO_SOURCE,
+                        help="baseline JSON/CSV file or catalog directory (default: built-in ISO data)")
+    parser.add_argument('--cache-dir',
+                        help="reuse and store results in this persistent cache directory (default: no cache)")
+    parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_RESULT_CACHE_MAX_BYTES / 2**20,
+                        help="result cache size cap in MiB; least recently used results are evicted")
+    parser.add_argument('--no-cache', action='store_true', help="always recompute, even with --cache-dir")
+    parser.add_argument('--output', default=DEFAULT_RESULTS_STREAM,
+                        help=f"NDJSON results stream to write (default: {DEFAULT_RESULTS_STREAM})")
+    args = parser.parse_args(argv)
+    
+    # Initialize optimizer with the console progress report
+    optimizer = MHMBrakePerformanceOptimizer(verbose=True)
+    cache = None
+    if args.cache_dir and not args.no_cache:
+        cache = ResultCache(args.cache_dir, int(args.cache_max_mb * 2**20))
     
     # Run complete analysis
-    results = optimizer.run_complete_brake_optimization()
+    results = optimizer.run_complete_brake_optimization(args.source, cache=cache, lazy=True)
+    if cache is None:
+        print("\n🧮 Results computed fresh (no result cache)")
+    elif cache.hits:
+        print(f"\n♻️ Results loaded from cache {cache.directory}")
+    else:
+        print(f"\n🧮 Results computed fresh and stored in cache {cache.directory}")
     
     # Print key results
     print("\n" + "="*70)
@@ -445,6 +2027,13 @@ def main():
         print(f"    Yaw Stability: +{improvements['yaw_stability_improvement_percent']:.1f}%")
         print(f"    Lateral Control: +{improvements['lateral_displacement_reduction_percent']:.1f}%")
     
+    # Every straight-line condition in the dataset
+    print(f"\n🌧️ SURFACE COVERAGE:")
+    for surface, surface_results in folded_conditions(results['brake_performance_optimization'])['braking'].items():
+        reduction = np.mean([result['improvements']['distance_reduction_percent']
+                             for result in surface_results.values()])
+        print(f"  {surface.replace('_', ' ').title()}: -{reduction:.1f}% distance ({len(surface_results)} vehicles)")
+    
     # Component optimization results
     component_results = results['component_optimization']
     print(f"\n🔧 COMPONENT OPTIMIZATION:")
@@ -453,21 +2042,22 @@ def main():
     print(f"  ABS Frequency: +{component_results['abs_control_enhancement']['frequency_improvement_percent']:.1f}%")
     
     # Overall system performance
-    avg_distance_improvement = np.mean([
-        result['improvements']['distance_reduction_percent'] 
-        for result in results['brake_performance_optimization']['dry_asphalt_optimization'].values()
-    ])
+    overall = results['overall_performance']
+    distance = overall['improvement_statistics']['braking']['distance_reduction_percent']
     
     print(f"\n📊 OVERALL SYSTEM PERFORMANCE:")
-    print(f"  Average Distance Reduction: -{avg_distance_improvement:.1f}%")
+    print(f"  Average Distance Reduction: -{overall['average_distance_reduction']:.1f}%")
+    print(f"  Distance Reduction Range: {distance['min']:.1f}% to {distance['max']:.1f}% "
+          f"(p5 {distance['p5']:.1f}%, p95 {distance['p95']:.1f}%, σ {distance['std']:.2f})")
     print(f"  Tesla Folding Foundation: {optimizer.proven_improvement}% mining success")
     print(f"  Consciousness Enhancement: {optimizer.consciousness_level:.3f} level")
     
-    # Save results
-    with open('mhm_brake_optimization_results.json', 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    # Stream results record by record; the run references its source instead of embedding it
+    from mhm_brake_results_io import ResultStreamWriter, stream_optimization_results
+    with ResultStreamWriter(args.output) as writer:
+        stream_optimization_results(results, optimizer, writer, args.source)
     
-    print(f"\n💾 Results saved to mhm_brake_optimization_results.json")
+    print(f"\n💾 Results streamed to {args.output} ({writer.records_written} records)")
     print(f"\n✅ MHM BRAKE PERFORMANCE OPTIMIZATION COMPLETE")
     print(f"📧 Contact: holdatllc2@gmail.com")
     print(f"🛑 Based on proven Tesla Folding Engine and real ISO data")
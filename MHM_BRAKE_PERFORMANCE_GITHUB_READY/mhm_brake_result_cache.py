@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Persistent Result Cache
+============================================================
+Content-addressed on-disk cache of complete optimization results
+
+Entries are JSON files named by a hash of everything the result depends on:
+the optimizer parameters and the content of the baseline dataset. Reads
+refresh an entry's modification time; when the cache grows past max_bytes the
+least recently used entries are evicted.
+
+The cache lives in $MHM_BRAKE_CACHE_DIR, or ~/.cache/mhm_brake by default.
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, Mapping, Optional, Tuple
+
+RESULT_CACHE_FORMAT = 2  # Bump whenever the cached result layout changes
+RESULT_CACHE_SUFFIX = '.json'
+DEFAULT_RESULT_CACHE_MAX_BYTES = 256 * 2**20
+
+
+def default_result_cache_dir() -> str:
+    """$MHM_BRAKE_CACHE_DIR, read at call time, or ~/.cache/mhm_brake"""
+    return os.environ.get('MHM_BRAKE_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'mhm_brake')
+
+
+def result_cache_key(parameters: Mapping, data_digest: str) -> str:
+    """
+    Cache key for a result: hash of the optimizer parameters, dataset digest and cache format
+    """
+    payload = json.dumps({'format': RESULT_CACHE_FORMAT, 'parameters': dict(parameters), 'data': data_digest},
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Size-capped LRU cache of JSON results in a directory, safe to share between processes
+    """
+    
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES):
+        """directory defaults to default_result_cache_dir(), resolved when the cache is created"""
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.directory = os.path.expanduser(directory or default_result_cache_dir())
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + RESULT_CACHE_SUFFIX)
+    
+    def _entries(self) -> List[Tuple[int, int, str]]:
+        """(mtime_ns, size, path) of every entry, least recently used first"""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if not name.endswith(RESULT_CACHE_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:  # Evicted by another process
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        return entries
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Cached result for key, or None; a hit marks the entry as most recently used
+        """
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                results = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, ValueError):  # Missing, evicted or unreadable entry
+            self.misses += 1
+            return None
+        self.hits += 1
+        return results
+    
+    def put(self, key: str, results: Mapping) -> Dict:
+        """
+        Store a result and evict old entries; returns the result as it will be read back
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        text = json.dumps(results, default=str)
+        
+        # Write-then-rename so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.evict()
+        return json.loads(text)
+    
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits in max_bytes; returns the count removed
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        return removed
+    
+    def clear(self) -> int:
+        """Remove every entry; returns the count removed"""
+        removed = 0
+        for _, _, path in self._entries():
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+    
+    def size_bytes(self) -> int:
+        """Total size of the cached entries"""
+        return sum(size for _, size, _ in self._entries())
+    
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+    
+    def __len__(self) -> int:
+        return len(self._entries())
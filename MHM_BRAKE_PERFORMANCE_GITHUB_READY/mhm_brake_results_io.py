@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Streaming Results I/O
+==========================================================
+Incremental NDJSON writer and reader for large brake optimization runs
+
+RECORD LAYOUT (one JSON object per line, 'record' gives the type):
+- source: identity of an ISO baseline dataset (path, content digest, conditions),
+  written once per source_id; the baselines themselves travel in braking / abs records
+- run: optimizer parameters and Tesla Folding factors, referencing a source_id
+- braking / abs: one vehicle × condition result, referencing a run_id
+- components: brake system component optimization for a run
+- overall: overall performance statistics of a run
+
+Columnar export (Parquet, or compressed NPZ without pyarrow) flattens results to
+one row per run × vehicle × condition × metric for pandas analysis.
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import json
+import os
+from typing import Dict, IO, Iterator, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from mhm_brake_performance_optimization import (
+    BUILTIN_ISO_SOURCE,
+    ConditionFoldingResult,
+    FoldedMetrics,
+    MHMBrakePerformanceOptimizer,
+    TeslaFoldingBatchResult,
+    folded_conditions,
+    get_iso_store,
+    iso_source_id,
+    json_default,
+    normalize_source,
+    validate_batch_jobs
+)
+
+RESULT_STREAM_FORMAT = 1
+
+# Columnar results table layout
+RESULT_TABLE_COLUMNS = ('run_id', 'test', 'condition', 'vehicle', 'metric', 'improvement_metric',
+                        'baseline', 'optimized', 'improvement_percent')
+_RESULT_TABLE_TEXT_COLUMNS = RESULT_TABLE_COLUMNS[:6]
+
+# Result test -> (baseline key, optimized key) of each vehicle result
+_TEST_RESULT_KEYS = {
+    'braking': ('baseline_performance', 'mhm_optimized_performance'),
+    'abs': ('baseline_abs_performance', 'mhm_optimized_abs_performance')
+}
+
+
+class ResultStreamWriter:
+    """
+    Append result records to an NDJSON file as they are computed
+    
+    Each source dataset is written once and referenced by source_id from every
+    run, instead of being embedded in each result.
+    """
+    
+    def __init__(self, output: Union[str, IO[str]], append: bool = False):
+        if isinstance(output, str):
+            self._file = open(output, 'a' if append else 'w', encoding='utf-8')
+            self._owns_file = True
+        else:
+            self._file = output
+            self._owns_file = False
+        self._written_sources = set()
+        self._run_count = 0
+        self.records_written = 0
+    
+    def __enter__(self) -> 'ResultStreamWriter':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Flush and close the underlying file if this writer opened it"""
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+    
+    def write_record(self, record: Mapping):
+        """Write one raw record as a single line"""
+        self._file.write(json.dumps(record, separators=(',', ':'), default=json_default))
+        self._file.write('\n')
+        self.records_written += 1
+    
+    def write_source(self, source: str = BUILTIN_ISO_SOURCE) -> str:
+        """
+        Write a source record once; returns its source_id
+        
+        The record identifies the dataset (path, content digest, condition names)
+        and stays small for any catalog size; the bulk baseline data is never copied.
+        """
+        source_id = iso_source_id(source)
+        if source_id not in self._written_sources:
+            store = get_iso_store(source)
+            self.write_record({
+                'record': 'source',
+                'format': RESULT_STREAM_FORMAT,
+                'source_id': source_id,
+                'source': normalize_source(source),
+                'content_digest': store.content_digest(),
+                'standard_info': store.metadata.get('standard_info', {}),
+                'vehicle_count': len(store.vehicles),
+                'surfaces': [surface.name for surface in store.surfaces],
+                'abs_scenarios': [scenario.name for scenario in store.abs_scenarios]
+            })
+            self._written_sources.add(source_id)
+        return source_id
+    
+    def begin_run(self, optimizer: MHMBrakePerformanceOptimizer, source_id: str,
+                  run_id: Optional[str] = None) -> str:
+        """Write the run header for one optimizer configuration; returns its run_id"""
+        run_id = run_id if run_id is not None else f"run_{self._run_count}"
+        self._run_count += 1
+        self.write_record({
+            'record': 'run',
+            'run_id': run_id,
+            'source_id': source_id,
+            'system_info': optimizer.system_info(),
+            'tesla_folding_factors': optimizer.tesla_folding_factors()
+        })
+        return run_id
+    
+    def write_vehicle_result(self, run_id: str, record_type: str, condition: str, vehicle: str,
+                             baseline: Mapping, optimized: Mapping, improvements: Mapping):
+        """Write one vehicle × condition result"""
+        self.write_record({
+            'record': record_type,
+            'run_id': run_id,
+            'condition': condition,
+            'vehicle': vehicle,
+            'baseline': baseline,
+            'optimized': optimized,
+            'improvements': improvements
+        })
+    
+    def write_metrics(self, run_id: str, record_type: str, condition: str, metrics: FoldedMetrics):
+        """Write one record per vehicle straight from the result arrays"""
+        baseline = metrics.baseline.tolist()
+        optimized = metrics.optimized.tolist()
+        improvements = metrics.improvements.tolist()
+        for i, vehicle in enumerate(metrics.vehicles):
+            self.write_vehicle_result(run_id, record_type, condition, vehicle,
+                                      dict(zip(metrics.metric_names, baseline[i])),
+                                      dict(zip(metrics.metric_names, optimized[i])),
+                                      dict(zip(metrics.improvement_names, improvements[i])))
+    
+    def write_folding(self, run_id: str, folded: ConditionFoldingResult):
+        """Write every surface and ABS scenario of a folding result, one condition at a time"""
+        for surface in folded.surfaces:
+            self.write_metrics(run_id, 'braking', surface.name, folded.surface(surface.name))
+        for scenario in folded.abs_scenarios:
+            self.write_metrics(run_id, 'abs', scenario.name, folded.abs_scenario(scenario.name))
+    
+    def write_components(self, run_id: str, component_optimization: Mapping):
+        """Write the component optimization of a run"""
+        self.write_record({'record': 'components', 'run_id': run_id,
+                           'component_optimization': component_optimization})
+    
+    def write_overall(self, run_id: str, overall_performance: Mapping):
+        """Write the overall performance statistics of a run"""
+        self.write_record({'record': 'overall', 'run_id': run_id, 'overall_performance': overall_performance})
+
+
+def stream_complete_brake_optimization(optimizer: MHMBrakePerformanceOptimizer, writer: ResultStreamWriter,
+                                       source: str = BUILTIN_ISO_SOURCE, run_id: Optional[str] = None) -> str:
+    """
+    Streaming counterpart of run_complete_brake_optimization; returns the run_id
+    
+    Records are written per condition as each batch is computed; no complete
+    result tree is built in memory.
+    """
+    store = get_iso_store(source)
+    run_id = writer.begin_run(optimizer, writer.write_source(source), run_id)
+    
+    folded = optimizer.apply_tesla_folding_to_conditions(store)
+    writer.write_folding(run_id, folded)
+    
+    if 'brake_system_specs' in store.metadata:
+        writer.write_components(run_id, optimizer.optimize_brake_system_components(store.metadata))
+    writer.write_overall(run_id, optimizer.overall_performance(folded))
+    return run_id
+
+
+def stream_optimization_results(results: Mapping, optimizer: MHMBrakePerformanceOptimizer,
+                                writer: ResultStreamWriter, source: str = BUILTIN_ISO_SOURCE,
+                                run_id: Optional[str] = None) -> str:
+    """
+    Stream an already computed run_complete_brake_optimization result; returns the run_id
+    
+    Accepts the lazy result and the plain one a ResultCache returns. The run
+    references its source record by source_id; iso_source_data is never written.
+    """
+    run_id = writer.begin_run(optimizer, writer.write_source(source), run_id)
+    
+    optimization = results['brake_performance_optimization']
+    if isinstance(optimization, ConditionFoldingResult):
+        writer.write_folding(run_id, optimization)
+    else:
+        for test, condition, baseline_key, optimized_key, vehicles in _condition_sections(optimization):
+            for vehicle, vehicle_result in vehicles.items():
+                writer.write_vehicle_result(run_id, test, condition, vehicle, vehicle_result[baseline_key],
+                                            vehicle_result[optimized_key], vehicle_result['improvements'])
+    
+    writer.write_components(run_id, results['component_optimization'])
+    writer.write_overall(run_id, results['overall_performance'])
+    return run_id
+
+
+def stream_brake_optimization_runs(jobs: Sequence[Mapping], output: Union[str, IO[str]]) -> List[str]:
+    """
+    Stream many optimizer configurations (run_brake_optimization_batch job dicts) into one NDJSON file
+    
+    Jobs are validated before the output is opened, so a bad job never leaves a partial file.
+    """
+    jobs = validate_batch_jobs(jobs)
+    run_ids = []
+    with ResultStreamWriter(output) as writer:
+        for job in jobs:
+            optimizer = MHMBrakePerformanceOptimizer(**{key: value for key, value in job.items() if key != 'source'})
+            run_ids.append(stream_complete_brake_optimization(
+                optimizer, writer, job.get('source', BUILTIN_ISO_SOURCE)))
+    return run_ids
+
+
+def iter_result_records(path: str, record_type: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Iterate records from an NDJSON results file without loading it whole
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record_type is None or record['record'] == record_type:
+                yield record
+
+
+def folded_metrics_table(metrics: FoldedMetrics, test: str, condition: str, run_id: str = 'run_0') -> pd.DataFrame:
+    """
+    Long table of one batch: one row per vehicle × metric, built directly from the arrays
+    """
+    n_vehicles, n_metrics = metrics.baseline.shape
+    return pd.DataFrame({
+        'run_id': np.full(n_vehicles * n_metrics, run_id),
+        'test': np.full(n_vehicles * n_metrics, test),
+        'condition': np.full(n_vehicles * n_metrics, condition),
+        'vehicle': np.repeat(np.asarray(metrics.vehicles, dtype=str), n_metrics),
+        'metric': np.tile(np.asarray(metrics.metric_names), n_vehicles),
+        'improvement_metric': np.tile(np.asarray(metrics.improvement_names), n_vehicles),
+        'baseline': metrics.baseline.reshape(-1),
+        'optimized': metrics.optimized.reshape(-1),
+        'improvement_percent': metrics.improvements.reshape(-1)
+    }, columns=list(RESULT_TABLE_COLUMNS))
+
+
+def results_to_table(results: Union[Mapping, TeslaFoldingBatchResult, ConditionFoldingResult],
+                     run_id: str = 'run_0') -> pd.DataFrame:
+    """
+    Flatten optimizer output into the columnar results table
+    
+    Accepts a TeslaFoldingBatchResult, a ConditionFoldingResult, the dict from
+    apply_tesla_folding_to_brake_performance, or the complete dict from
+    run_complete_brake_optimization.
+    """
+    if isinstance(results, ConditionFoldingResult):
+        frames = ([folded_metrics_table(results.surface(surface.name), 'braking', surface.name, run_id)
+                   for surface in results.surfaces] +
+                  [folded_metrics_table(results.abs_scenario(scenario.name), 'abs', scenario.name, run_id)
+                   for scenario in results.abs_scenarios])
+        return _finish_table(pd.concat(frames, ignore_index=True) if frames else _empty_table())
+    if isinstance(results, TeslaFoldingBatchResult):
+        frames = [folded_metrics_table(metrics, test, condition, run_id)
+                  for metrics, test, condition in ((results.dry_asphalt, 'braking', 'dry_asphalt_100_0'),
+                                                   (results.abs_split_mu, 'abs', 'split_mu_braking'))
+                  if metrics is not None]
+        return _finish_table(pd.concat(frames, ignore_index=True) if frames else _empty_table())
+    
+    rows = []
+    for test, condition, baseline_key, optimized_key, vehicles in _condition_sections(
+            results.get('brake_performance_optimization', results)):
+        for vehicle, vehicle_result in vehicles.items():
+            improvement_names = list(vehicle_result['improvements'])
+            for i, (metric, baseline) in enumerate(vehicle_result[baseline_key].items()):
+                rows.append((run_id, test, condition, vehicle, metric, improvement_names[i], baseline,
+                             vehicle_result[optimized_key][metric],
+                             vehicle_result['improvements'][improvement_names[i]]))
+    return _finish_table(pd.DataFrame(rows, columns=list(RESULT_TABLE_COLUMNS)))
+
+
+def _condition_sections(results: Mapping) -> List[tuple]:
+    """(test, condition, baseline key, optimized key, vehicle results) of a plain folding result dict"""
+    return [(test, condition, baseline_key, optimized_key, vehicles)
+            for test, conditions in folded_conditions(results).items()
+            for baseline_key, optimized_key in [_TEST_RESULT_KEYS[test]]
+            for condition, vehicles in conditions.items()]
+
+
+def result_stream_to_table(path: str) -> pd.DataFrame:
+    """
+    Convert an NDJSON results stream into the columnar results table
+    """
+    rows = []
+    for record in iter_result_records(path):
+        if record['record'] not in ('braking', 'abs'):
+            continue
+        improvement_names = list(record['improvements'])
+        for i, (metric, baseline) in enumerate(record['baseline'].items()):
+            rows.append((record['run_id'], record['record'], record['condition'], record['vehicle'], metric,
+                         improvement_names[i], baseline, record['optimized'][metric],
+                         record['improvements'][improvement_names[i]]))
+    return _finish_table(pd.DataFrame(rows, columns=list(RESULT_TABLE_COLUMNS)))
+
+
+def _empty_table() -> pd.DataFrame:
+    return pd.DataFrame({column: pd.Series(dtype=str if column in _RESULT_TABLE_TEXT_COLUMNS else float)
+                         for column in RESULT_TABLE_COLUMNS})
+
+
+def _finish_table(table: pd.DataFrame) -> pd.DataFrame:
+    """Store repeated labels as categoricals and values as float64"""
+    for column in _RESULT_TABLE_TEXT_COLUMNS:
+        table[column] = table[column].astype(str).astype('category')
+    for column in RESULT_TABLE_COLUMNS[6:]:
+        table[column] = table[column].astype(np.float64)
+    return table
+
+
+def _table_format(path: str, table_format: Optional[str]) -> str:
+    table_format = table_format or os.path.splitext(path)[1].lstrip('.').lower()
+    if table_format not in ('parquet', 'npz'):
+        raise ValueError(f"Unsupported results table format: {table_format!r} (expected 'parquet' or 'npz')")
+    return table_format
+
+
+def export_results_table(results: Union[Mapping, TeslaFoldingBatchResult, pd.DataFrame], path: str,
+                         table_format: Optional[str] = None) -> str:
+    """
+    Write results as a columnar table: Parquet (needs pyarrow) or compressed NPZ
+    
+    The format follows the file extension unless table_format is given.
+    """
+    table = results if isinstance(results, pd.DataFrame) else results_to_table(results)
+    table_format = _table_format(path, table_format)
+    
+    if table_format == 'parquet':
+        try:
+            table.to_parquet(path, index=False)
+        except ImportError as e:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow "
+                              "(or export to a .npz file instead)") from e
+    else:
+        np.savez_compressed(path, **{
+            column: table[column].to_numpy(dtype=str if column in _RESULT_TABLE_TEXT_COLUMNS else np.float64)
+            for column in table.columns
+        })
+    return path
+
+
+def read_results_table(path: str, columns: Optional[Sequence[str]] = None,
+                       table_format: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read a table written by export_results_table, loading only the requested columns
+    """
+    table_format = _table_format(path, table_format)
+    if table_format == 'parquet':
+        return pd.read_parquet(path, columns=list(columns) if columns is not None else None)
+    
+    # NPZ members are decompressed on access, so unrequested columns are never read
+    with np.load(path, allow_pickle=False) as archive:
+        names = list(columns) if columns is not None else [c for c in RESULT_TABLE_COLUMNS if c in archive.files]
+        missing = [name for name in names if name not in archive.files]
+        if missing:
+            raise KeyError(f"Columns not in {path}: {', '.join(missing)}")
+        table = pd.DataFrame({name: archive[name] for name in names})
+    for column in table.columns:
+        if column in _RESULT_TABLE_TEXT_COLUMNS:
+            table[column] = table[column].astype('category')
+    return table
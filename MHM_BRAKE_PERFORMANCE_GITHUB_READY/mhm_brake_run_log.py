@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Recorded Run Log Replay
+============================================================
+Chunked, memory-mapped replay of proving-ground brake test logs
+
+LOG FORMAT:
+- Fixed-size records of RUN_LOG_DTYPE: time, four wheel speeds, brake pressure and
+  yaw rate, either as a raw binary stream (what a data logger appends) or as a
+  structured .npy file
+- Files are memory-mapped and walked chunk_rows records at a time, so a
+  multi-GB log never has to fit in RAM
+
+METRICS PER STOP:
+- ISO 21994: initial speed, stopping distance (optionally corrected to a nominal
+  speed), stopping time and mean deceleration
+- ISO 14512: peak yaw rate, lateral displacement and ABS pressure cycles per second
+
+Stops feed straight into MHMBrakePerformanceOptimizer.apply_tesla_folding_batch.
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import os
+import numpy as np
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from mhm_brake_performance_optimization import (
+    ABS_METRICS,
+    MHMBrakePerformanceOptimizer,
+    TeslaFoldingBatchResult
+)
+from mhm_brake_simulation import DEFAULT_SIMULATION_PARAMETERS, GRAVITY_MS2, front_rotor_temperature_c
+from mhm_brake_telemetry import WHEEL_SPEED_SIGNALS
+
+RUN_LOG_DTYPE = np.dtype([('time_s', '<f8')] + [(name, '<f4') for name in WHEEL_SPEED_SIGNALS]
+                         + [('brake_pressure_bar', '<f4'), ('yaw_rate_deg_s', '<f4')])
+DEFAULT_CHUNK_ROWS = 1 << 20
+
+
+def open_run_log(path: str, mmap_mode: str = 'r') -> np.ndarray:
+    """
+    Memory-map a run log: a structured .npy file, or raw RUN_LOG_DTYPE records otherwise
+    """
+    if path.endswith('.npy'):
+        log = np.load(path, mmap_mode=mmap_mode)
+        missing = set(RUN_LOG_DTYPE.names) - set(log.dtype.names or ())
+        if missing:
+            raise ValueError(f"{path} is missing run log fields: {', '.join(sorted(missing))}")
+        return log
+    size = os.path.getsize(path)
+    if size % RUN_LOG_DTYPE.itemsize:
+        raise ValueError(f"{path} is not a whole number of {RUN_LOG_DTYPE.itemsize}-byte run log records")
+    if not size:
+        return np.zeros(0, dtype=RUN_LOG_DTYPE)
+    return np.memmap(path, dtype=RUN_LOG_DTYPE, mode=mmap_mode)
+
+
+def write_run_log(path: str, chunks: Iterable[np.ndarray], append: bool = False) -> int:
+    """
+    Write (or append) record chunks as a raw run log; returns the number of records written
+    """
+    rows = 0
+    with open(path, 'ab' if append else 'wb') as f:
+        for chunk in chunks:
+            chunk = np.asarray(chunk)
+            records = np.zeros(len(chunk), dtype=RUN_LOG_DTYPE)
+            for name in RUN_LOG_DTYPE.names:
+                records[name] = chunk[name]
+            f.write(records.tobytes())
+            rows += len(records)
+    return rows
+
+
+class RecordedStop:
+    """
+    ISO 21994 / ISO 14512 metrics of one recorded stop, from brake application to standstill
+    
+    A degenerate stop (no distance covered, or no time elapsed, e.g. a single sample)
+    reports NaN for the rates that would divide by it.
+    """
+    
+    __slots__ = ('start_time_s', 'end_time_s', 'initial_speed_kmh', 'stopping_distance_m',
+                 'mean_deceleration_g', 'peak_brake_pressure_bar', 'max_yaw_rate_deg_s',
+                 'lateral_displacement_m', 'abs_cycles')
+    
+    def __init__(self, start_time_s: float, end_time_s: float, initial_speed_kmh: float,
+                 stopping_distance_m: float, peak_brake_pressure_bar: float, max_yaw_rate_deg_s: float,
+                 lateral_displacement_m: float, abs_cycles: int):
+        self.start_time_s = start_time_s
+        self.end_time_s = end_time_s
+        self.initial_speed_kmh = initial_speed_kmh
+        self.stopping_distance_m = stopping_distance_m
+        self.mean_deceleration_g = ((initial_speed_kmh / 3.6) ** 2 / (2 * stopping_distance_m * GRAVITY_MS2)
+                                    if stopping_distance_m > 0 else float('nan'))
+        self.peak_brake_pressure_bar = peak_brake_pressure_bar
+        self.max_yaw_rate_deg_s = max_yaw_rate_deg_s
+        self.lateral_displacement_m = lateral_displacement_m
+        self.abs_cycles = abs_cycles
+    
+    @property
+    def stopping_time_s(self) -> float:
+        return self.end_time_s - self.start_time_s
+    
+    @property
+    def abs_cycles_per_second(self) -> float:
+        return self.abs_cycles / self.stopping_time_s if self.stopping_time_s > 0 else float('nan')
+    
+    def corrected_stopping_distance_m(self, nominal_speed_kmh: float) -> float:
+        """ISO 21994 speed correction: distance scaled by (nominal / actual initial speed)²"""
+        return self.stopping_distance_m * (nominal_speed_kmh / self.initial_speed_kmh) ** 2
+    
+    def to_dict(self) -> Dict:
+        fields = {slot: getattr(self, slot) for slot in self.__slots__}
+        fields['stopping_time_s'] = self.stopping_time_s
+        fields['abs_cycles_per_second'] = self.abs_cycles_per_second
+        return fields
+    
+    def __repr__(self) -> str:
+        return (f"RecordedStop({self.initial_speed_kmh:.1f} km/h -> 0 in {self.stopping_distance_m:.2f} m, "
+                f"yaw {self.max_yaw_rate_deg_s:.2f} °/s, {self.abs_cycles_per_second:.1f} ABS cycles/s)")
+
+
+class _StopAccumulator:
+    """Running integrals of one stop, fed contiguous slices of samples across chunk boundaries"""
+    
+    __slots__ = ('start_time_s', 'initial_speed_kmh', 'distance_m', 'heading_deg', 'lateral_m',
+                 'max_lateral_m', 'max_yaw_rate_deg_s', 'peak_pressure_bar', 'abs_cycles',
+                 '_last', '_direction')
+    
+    def __init__(self, time_s: float, speed_kmh: float):
+        self.start_time_s = time_s
+        self.initial_speed_kmh = speed_kmh
+        self.distance_m = self.heading_deg = self.lateral_m = self.max_lateral_m = 0.0
+        self.max_yaw_rate_deg_s = self.peak_pressure_bar = 0.0
+        self.abs_cycles = 0
+        self._last = None     # (time, speed, pressure, yaw) of the previous sample
+        self._direction = 0.0  # Sign of the last non-zero pressure change
+    
+    def absorb(self, t: np.ndarray, speed: np.ndarray, pressure: np.ndarray, yaw: np.ndarray):
+        self.max_yaw_rate_deg_s = max(self.max_yaw_rate_deg_s, float(np.abs(yaw).max()))
+        self.peak_pressure_bar = max(self.peak_pressure_bar, float(pressure.max()))
+        if self._last is not None:
+            t, speed, pressure, yaw = (np.concatenate([[last], values])
+                                       for last, values in zip(self._last, (t, speed, pressure, yaw)))
+        self._last = (t[-1], speed[-1], pressure[-1], yaw[-1])
+        if len(t) < 2:
+            return
+        
+        # Trapezoidal distance and heading; lateral drift is the path's sideways component
+        dt = np.diff(t)
+        mean_speed = 0.5 * (speed[1:] + speed[:-1]) / 3.6
+        heading = self.heading_deg + np.cumsum(0.5 * (yaw[1:] + yaw[:-1]) * dt)
+        lateral = self.lateral_m + np.cumsum(mean_speed * np.sin(np.radians(heading)) * dt)
+        self.distance_m += float(np.dot(mean_speed, dt))
+        self.heading_deg = float(heading[-1])
+        self.lateral_m = float(lateral[-1])
+        self.max_lateral_m = max(self.max_lateral_m, float(np.abs(lateral).max()))
+        
+        # Every switch from rising to falling pressure is one ABS release cycle
+        steps = np.sign(np.diff(pressure))
+        filled = np.flatnonzero(steps)
+        if len(filled):
+            direction = np.concatenate([[self._direction], steps[filled]])
+            self.abs_cycles += int(np.count_nonzero((direction[:-1] > 0) & (direction[1:] < 0)))
+            self._direction = float(direction[-1])
+    
+    def finish(self) -> RecordedStop:
+        return RecordedStop(self.start_time_s, float(self._last[0]), self.initial_speed_kmh, self.distance_m,
+                            self.peak_pressure_bar, self.max_yaw_rate_deg_s, self.max_lateral_m, self.abs_cycles)
+
+
+class RunLogReplay:
+    """
+    Stops found in a replayed log, with their metrics in optimizer baseline order
+    """
+    
+    __slots__ = ('stops', 'rows', 'chunks', 'abandoned_stops')
+    
+    def __init__(self, stops: Sequence[RecordedStop], rows: int, chunks: int, abandoned_stops: int):
+        self.stops = list(stops)
+        self.rows = rows
+        self.chunks = chunks
+        self.abandoned_stops = abandoned_stops
+    
+    def stop_names(self) -> List[str]:
+        return [f"stop_{i}" for i in range(len(self.stops))]
+    
+    def brake_metrics(self, vehicle: Optional[Mapping] = None, nominal_speed_kmh: Optional[float] = None,
+                      **parameters) -> np.ndarray:
+        """
+        (stops, BRAKE_METRICS) baselines
+        
+        Distances are ISO 21994 speed-corrected when nominal_speed_kmh is given. The
+        logs carry no pedal force or rotor temperature, so pedal_force_n uses the
+        simulator's pedal gain and brake_temperature_c its rotor energy model, which
+        needs the vehicle's test_vehicles entry (NaN without it).
+        """
+        p = dict(DEFAULT_SIMULATION_PARAMETERS, **parameters)
+        speed = np.array([stop.initial_speed_kmh for stop in self.stops], dtype=np.float64)
+        distance = np.array([stop.stopping_distance_m for stop in self.stops], dtype=np.float64)
+        if nominal_speed_kmh is not None:
+            distance = distance * (nominal_speed_kmh / speed) ** 2
+        deceleration = np.array([stop.mean_deceleration_g for stop in self.stops], dtype=np.float64)
+        temperature = (np.full(len(self.stops), np.nan) if vehicle is None else
+                       front_rotor_temperature_c(vehicle['mass_kg'], speed, vehicle['front_brake_diameter_mm'], **p))
+        return np.stack([distance, deceleration, p['pedal_gain_n_per_g'] * deceleration, temperature], axis=-1)
+    
+    def abs_metrics(self) -> np.ndarray:
+        """(stops, ABS_METRICS) baselines for the split-μ folding"""
+        return np.array([[stop.stopping_distance_m, stop.max_yaw_rate_deg_s, stop.lateral_displacement_m,
+                          stop.abs_cycles_per_second] for stop in self.stops],
+                        dtype=np.float64).reshape(-1, len(ABS_METRICS))
+    
+    def fold(self, optimizer: Optional[MHMBrakePerformanceOptimizer] = None, vehicle: Optional[Mapping] = None,
+             nominal_speed_kmh: Optional[float] = None) -> TeslaFoldingBatchResult:
+        """Tesla Folding of every recorded stop, as braking and split-μ baselines"""
+        optimizer = optimizer or MHMBrakePerformanceOptimizer()
+        return optimizer.apply_tesla_folding_batch(self.brake_metrics(vehicle, nominal_speed_kmh),
+                                                   self.abs_metrics(), self.stop_names())
+    
+    def to_dict(self) -> Dict:
+        return {
+            'rows': self.rows,
+            'chunks': self.chunks,
+            'abandoned_stops': self.abandoned_stops,
+            'stops': dict(zip(self.stop_names(), (stop.to_dict() for stop in self.stops)))
+        }
+
+
+class RunLogReplayer:
+    """
+    Detect and measure stops in run log records fed chunk by chunk
+    
+    A stop starts when brake pressure reaches brake_on_pressure_bar while the
+    reference speed (fastest wheel) is at least stop_speed_kmh, and completes at the
+    first sample below stop_speed_kmh; releasing the brake first abandons it. State
+    carries across chunks, so results do not depend on chunk_rows.
+    """
+    
+    def __init__(self, brake_on_pressure_bar: float = 2.0, stop_speed_kmh: float = 0.5,
+                 chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be at least 1, got {chunk_rows}")
+        self.brake_on_pressure_bar = brake_on_pressure_bar
+        self.stop_speed_kmh = stop_speed_kmh
+        self.chunk_rows = chunk_rows
+        self.reset()
+    
+    def reset(self):
+        self._open: Optional[_StopAccumulator] = None
+        self.stops: List[RecordedStop] = []
+        self.rows = 0
+        self.chunks = 0
+        self.abandoned_stops = 0
+    
+    def _close(self, speed: float, pressure: float, closing_sample):
+        """End the open stop at its first inactive sample: standstill completes it, release abandons it"""
+        if speed < self.stop_speed_kmh and pressure >= self.brake_on_pressure_bar:
+            self._open.absorb(*closing_sample)
+            self.stops.append(self._open.finish())
+        else:
+            self.abandoned_stops += 1
+        self._open = None
+    
+    def process_chunk(self, records: np.ndarray) -> List[RecordedStop]:
+        """Consume consecutive records; returns the stops completed within them"""
+        n = len(records)
+        self.rows += n
+        self.chunks += 1
+        if not n:
+            return []
+        completed = len(self.stops)
+        
+        t = np.asarray(records['time_s'], dtype=np.float64)
+        speed = np.max([np.asarray(records[name], dtype=np.float64) for name in WHEEL_SPEED_SIGNALS], axis=0)
+        pressure = np.asarray(records['brake_pressure_bar'], dtype=np.float64)
+        yaw = np.asarray(records['yaw_rate_deg_s'], dtype=np.float64)
+        active = (pressure >= self.brake_on_pressure_bar) & (speed >= self.stop_speed_kmh)
+        
+        # Python only walks the active/inactive stretches; the samples inside them are NumPy work
+        edges = np.concatenate([[0], np.flatnonzero(active[1:] != active[:-1]) + 1, [n]])
+        for a, b in zip(edges[:-1], edges[1:]):
+            if not active[a]:
+                if a == 0 and self._open is not None:
+                    self._close(speed[0], pressure[0], (t[:1], speed[:1], pressure[:1], yaw[:1]))
+                continue
+            if self._open is None:
+                self._open = _StopAccumulator(float(t[a]), float(speed[a]))
+            self._open.absorb(t[a:b], speed[a:b], pressure[a:b], yaw[a:b])
+            if b < n:
+                self._close(speed[b], pressure[b], (t[b:b + 1], speed[b:b + 1], pressure[b:b + 1], yaw[b:b + 1]))
+        return self.stops[completed:]
+    
+    def iter_chunks(self, log: np.ndarray) -> Iterator[np.ndarray]:
+        """chunk_rows-record views of a (memory-mapped) log"""
+        for start in range(0, len(log), self.chunk_rows):
+            yield log[start:start + self.chunk_rows]
+    
+    def replay(self, source: Union[str, np.ndarray]) -> RunLogReplay:
+        """
+        Replay a whole log file (memory-mapped) or record array from a fresh state
+        """
+        self.reset()
+        log = open_run_log(source) if isinstance(source, str) else source
+        for chunk in self.iter_chunks(log):
+            self.process_chunk(chunk)
+        if self._open is not None:  # Log ends mid-stop
+            self.abandoned_stops += 1
+            self._open = None
+        return RunLogReplay(self.stops, self.rows, self.chunks, self.abandoned_stops)
+
+
+def replay_run_log(path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS, **options) -> RunLogReplay:
+    """
+    Stops and metrics of one recorded run log; options go to RunLogReplayer
+    """
+    return RunLogReplayer(chunk_rows=chunk_rows, **options).replay(path)
+
+
+def synthetic_run_records(initial_speed_kmh: float = 100.0, deceleration_g: float = 0.8,
+                          brake_pressure_bar: float = 80.0, rate_hz: float = 500.0, cruise_s: float = 0.5,
+                          yaw_rate_deg_s: float = 0.0, abs_frequency_hz: float = 0.0,
+                          start_time_s: float = 0.0) -> np.ndarray:
+    """
+    Records of a constant-deceleration stop: cruise, brake to standstill, hold
+    
+    yaw_rate_deg_s applies a constant yaw rate while braking; abs_frequency_hz
+    modulates the brake pressure by ±20% at that frequency (one ABS cycle per period).
+    """
+    v0 = initial_speed_kmh / 3.6
+    stop_s = v0 / (deceleration_g * GRAVITY_MS2)
+    t = np.arange(int(np.ceil((2 * cruise_s + stop_s) * rate_hz)) + 1) / rate_hz
+    braking_s = t - cruise_s
+    braking = braking_s >= 0
+    speed = np.maximum(v0 - deceleration_g * GRAVITY_MS2 * np.maximum(braking_s, 0.0), 0.0) * 3.6
+    
+    records = np.zeros(len(t), dtype=RUN_LOG_DTYPE)
+    records['time_s'] = start_time_s + t
+    for name in WHEEL_SPEED_SIGNALS:
+        records[name] = speed
+    modulation = 1 - 0.2 * np.sin(2 * np.pi * abs_frequency_hz * np.maximum(braking_s, 0.0))
+    records['brake_pressure_bar'] = np.where(braking, brake_pressure_bar * modulation, 0.0)
+    records['yaw_rate_deg_s'] = np.where(braking & (speed > 0), yaw_rate_deg_s, 0.0)
+    return records
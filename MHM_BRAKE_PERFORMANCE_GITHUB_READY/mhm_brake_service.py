@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Asyncio Service
+====================================================
+Local JSON-over-HTTP service for test-bench orchestration
+
+ENDPOINTS:
+- POST /optimize: run_complete_brake_optimization; body may set consciousness_level,
+  tesla_multiplier, proven_improvement and source
+- POST /sweep: sweep_parameters statistics; body sets consciousness_levels,
+  proven_improvements and optionally group_by and source
+- GET /health: service counters
+
+A request's source must be 'builtin', the service's own source or one of its
+allowed_sources; clients cannot point the service at other files.
+
+Each process keeps one warm optimizer and its cached baseline datasets. Requests
+are queued; the dispatcher drains whatever is waiting and runs those jobs one after
+another in a single executor call, so the event loop stays responsive. Jobs are not
+merged or vectorized across requests, but identical requests that arrive while one
+is queued or running share its result.
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from mhm_brake_performance_optimization import (
+    BATCH_JOB_KEYS,
+    BUILTIN_ISO_SOURCE,
+    MHMBrakePerformanceOptimizer,
+    get_iso_store,
+    json_default,
+    normalize_source
+)
+from mhm_brake_result_cache import DEFAULT_RESULT_CACHE_MAX_BYTES, ResultCache
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_SERVICE_HOST = '127.0.0.1'
+DEFAULT_SERVICE_PORT = 8765
+MAX_REQUEST_BYTES = 1 * 2**20
+
+SERVICE_OPERATIONS = ('optimize', 'sweep')
+_OPTIMIZER_KEYS = BATCH_JOB_KEYS[:3]
+_SWEEP_KEYS = ('consciousness_levels', 'proven_improvements', 'group_by', 'source')
+
+# One warm optimizer per process, shared by every job with default parameters
+_WARM_OPTIMIZER: Optional[MHMBrakePerformanceOptimizer] = None
+_WARM_OPTIMIZER_LOCK = threading.Lock()
+
+
+def _warm_optimizer() -> MHMBrakePerformanceOptimizer:
+    global _WARM_OPTIMIZER
+    with _WARM_OPTIMIZER_LOCK:
+        if _WARM_OPTIMIZER is None:
+            _WARM_OPTIMIZER = MHMBrakePerformanceOptimizer()
+        return _WARM_OPTIMIZER
+
+
+def _optimizer_for(params: Mapping) -> MHMBrakePerformanceOptimizer:
+    """The warm optimizer, or a new one when the request overrides its parameters"""
+    overrides = {key: params[key] for key in _OPTIMIZER_KEYS if key in params}
+    return MHMBrakePerformanceOptimizer(**overrides) if overrides else _warm_optimizer()
+
+
+def _validate(operation: str, params: Mapping) -> Dict:
+    """Normalized copy of a request's parameters; raises ValueError on bad requests"""
+    if operation not in SERVICE_OPERATIONS:
+        raise ValueError(f"Unknown operation {operation!r}; expected one of {', '.join(SERVICE_OPERATIONS)}")
+    if not isinstance(params, Mapping):
+        raise ValueError("Request parameters must be a JSON object")
+    allowed = BATCH_JOB_KEYS if operation == 'optimize' else _SWEEP_KEYS
+    unknown = set(params) - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown {operation} parameters: {', '.join(sorted(unknown))}")
+    
+    params = dict(params)
+    for key in _OPTIMIZER_KEYS:
+        if key in params:
+            params[key] = float(params[key])
+    if operation == 'sweep':
+        for key in ('consciousness_levels', 'proven_improvements'):
+            if key not in params:
+                raise ValueError(f"sweep requires {key}")
+            params[key] = [float(value) for value in params[key]]
+    if not isinstance(params.get('source', BUILTIN_ISO_SOURCE), str):
+        raise ValueError("source must be a string")
+    return params
+
+
+def _run_job(operation: str, params: Mapping, cache: Optional[ResultCache]):
+    source = params.get('source', BUILTIN_ISO_SOURCE)
+    if operation == 'optimize':
+        return _optimizer_for(params).run_complete_brake_optimization(source, cache=cache)
+    sweep = _warm_optimizer().sweep_parameters(params['consciousness_levels'], params['proven_improvements'],
+                                               get_iso_store(source))
+    return {test: statistics.to_dict() for test, statistics in sweep.statistics(params.get('group_by')).items()}
+
+
+def run_service_batch(jobs: Sequence[Tuple[str, Mapping]], cache: Optional[ResultCache] = None) -> List[Tuple]:
+    """
+    Run (operation, params) jobs one by one, in order; each outcome is (result, JSON bytes) or (exception, None)
+    
+    Module-level so process pool executors can run it; results are encoded in the
+    worker, once per distinct request, rather than on the event loop.
+    """
+    outcomes = []
+    for operation, params in jobs:
+        try:
+            result = _run_job(operation, params, cache)
+            outcomes.append((result, json.dumps(result, default=json_default).encode()))
+        except Exception as exc:
+            outcomes.append((exc, None))
+    return outcomes
+
+
+class OptimizationService:
+    """
+    Queue-draining, coalescing front end to MHMBrakePerformanceOptimizer for asyncio code
+    """
+    
+    def __init__(self, source: str = BUILTIN_ISO_SOURCE, cache: Optional[ResultCache] = None,
+                 executor: Optional[Executor] = None, batch_window_s: float = 0.002, max_batch: int = 32,
+                 allowed_sources: Sequence[str] = ()):
+        """
+        Requests may name 'builtin', source or one of allowed_sources; any other
+        source is rejected with ValueError. executor defaults to one worker thread owned by the service; pass a
+        ProcessPoolExecutor to spread drained groups over processes (each keeps its
+        own warm optimizer). Queued requests are drained for up to batch_window_s, or
+        until max_batch distinct requests are waiting; the group then runs job by job
+        in one executor call.
+        """
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be at least 1, got {max_batch}")
+        self.source = source
+        self.allowed_sources = frozenset(normalize_source(name) for name in (BUILTIN_ISO_SOURCE, source,
+                                                                             *allowed_sources))
+        self.cache = cache
+        self.batch_window_s = batch_window_s
+        self.max_batch = max_batch
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix='mhm-brake-service')
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.counters = {'requests': 0, 'coalesced': 0, 'batches': 0, 'jobs': 0, 'largest_batch': 0, 'errors': 0}
+    
+    async def start(self) -> 'OptimizationService':
+        """Warm the optimizer and baseline dataset, then start draining the request queue"""
+        if self._batcher is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, _warm_service_process, self.source)
+            self._queue = asyncio.Queue()
+            self._batcher = loop.create_task(self._dispatch_batches())
+        return self
+    
+    async def close(self):
+        """Stop dispatching, fail queued requests and release an owned executor"""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+        for future in self._inflight.values():
+            if not future.done():
+                future.set_exception(RuntimeError("Optimization service closed"))
+        self._inflight.clear()
+        if self._owns_executor:
+            self.executor.shutdown(wait=False)
+    
+    async def __aenter__(self) -> 'OptimizationService':
+        return await self.start()
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    def _params_with_defaults(self, operation: str, params: Optional[Mapping]) -> Dict:
+        params = _validate(operation, params or {})
+        source = normalize_source(params.get('source', self.source))
+        if source not in self.allowed_sources:
+            raise ValueError(f"Source {params['source']!r} is not served; ask for 'builtin' or a configured source")
+        if source == BUILTIN_ISO_SOURCE:
+            params.pop('source', None)  # 'builtin' and omitted coalesce to the same request
+        else:
+            params['source'] = source
+        return params
+    
+    async def _submit(self, operation: str, params: Optional[Mapping]) -> Tuple:
+        if self._batcher is None:
+            raise RuntimeError("Optimization service is not started")
+        params = self._params_with_defaults(operation, params)
+        key = json.dumps([operation, params], sort_keys=True)
+        self.counters['requests'] += 1
+        
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            self._queue.put_nowait((key, operation, params))
+        else:
+            self.counters['coalesced'] += 1
+        # shield: one caller cancelling must not cancel the result the others share
+        return await asyncio.shield(future)
+    
+    async def submit(self, operation: str, params: Optional[Mapping] = None):
+        """Result of one request: the results dict for 'optimize', statistics for 'sweep'"""
+        return (await self._submit(operation, params))[0]
+    
+    async def submit_json(self, operation: str, params: Optional[Mapping] = None) -> bytes:
+        """Result of one request, already JSON-encoded"""
+        return (await self._submit(operation, params))[1]
+    
+    async def _next_batch(self) -> List[Tuple[str, str, Dict]]:
+        """Block for one request, then drain the queue for up to batch_window_s"""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_window_s
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+    
+    async def _dispatch_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            self.counters['batches'] += 1
+            self.counters['jobs'] += len(batch)
+            self.counters['largest_batch'] = max(self.counters['largest_batch'], len(batch))
+            
+            jobs = [(operation, params) for _, operation, params in batch]
+            try:
+                outcomes = await loop.run_in_executor(self.executor, run_service_batch, jobs, self.cache)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # The executor itself failed, e.g. a broken process pool
+                outcomes = [(exc, None)] * len(batch)
+            
+            for (key, _, _), (result, body) in zip(batch, outcomes):
+                future = self._inflight.pop(key, None)
+                if future is None or future.done():
+                    continue
+                if body is None:
+                    self.counters['errors'] += 1
+                    future.set_exception(result)
+                else:
+                    future.set_result((result, body))
+    
+    def stats(self) -> Dict:
+        """Request, coalescing and batch counters"""
+        return dict(self.counters, in_flight=len(self._inflight),
+                    queued=self._queue.qsize() if self._queue is not None else 0)
+
+
+def _warm_service_process(source: str):
+    """Build this process's warm optimizer and load the baseline dataset into its cache"""
+    _warm_optimizer()
+    get_iso_store(source)
+
+
+# Minimal HTTP/1.1 front end: one request per connection, JSON in and out
+_HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                 413: 'Payload Too Large', 500: 'Internal Server Error'}
+_ROUTES = {'/optimize': 'optimize', '/sweep': 'sweep'}
+
+
+def _http_response(status: int, body: bytes) -> bytes:
+    head = (f"HTTP/1.1 {status} {_HTTP_REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+def _error_body(message: str) -> bytes:
+    return json.dumps({'error': message}).encode()
+
+
+async def _handle_request(service: OptimizationService, reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    request_line = (await reader.readline()).decode('latin-1').split()
+    if len(request_line) != 3:
+        return 400, _error_body("Malformed request line")
+    method, path, _ = request_line
+    path = path.split('?', 1)[0]
+    
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    
+    if path == '/health':
+        if method != 'GET':
+            return 405, _error_body("Use GET for /health")
+        return 200, json.dumps(dict(service.stats(), status='ok')).encode()
+    operation = _ROUTES.get(path)
+    if operation is None:
+        return 404, _error_body(f"Unknown path {path}")
+    if method != 'POST':
+        return 405, _error_body(f"Use POST for {path}")
+    
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        return 400, _error_body("Invalid Content-Length")
+    if length > MAX_REQUEST_BYTES:
+        return 413, _error_body(f"Request body exceeds {MAX_REQUEST_BYTES} bytes")
+    try:
+        params = json.loads(await reader.readexactly(length)) if length else {}
+    except (asyncio.IncompleteReadError, ValueError):
+        return 400, _error_body("Request body is not valid JSON")
+    
+    try:
+        return 200, await service.submit_json(operation, params)
+    except (ValueError, TypeError, KeyError, FileNotFoundError) as exc:
+        return 400, _error_body(str(exc))
+    except Exception as exc:
+        logger.exception("Optimization request failed")
+        return 500, _error_body(f"{type(exc).__name__}: {exc}")
+
+
+async def serve(service: OptimizationService, host: str = DEFAULT_SERVICE_HOST,
+                port: int = DEFAULT_SERVICE_PORT) -> asyncio.AbstractServer:
+    """
+    Start the service (if needed) and an HTTP server for it; port=0 picks a free port
+    """
+    await service.start()
+    
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            status, body = await _handle_request(service, reader)
+            writer.write(_http_response(status, body))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    return await asyncio.start_server(handle, host, port)
+
+
+async def _serve_forever(args):
+    cache = None
+    if args.cache_dir and not args.no_cache:
+        cache = ResultCache(args.cache_dir, int(args.cache_max_mb * 2**20))
+    async with OptimizationService(args.source, cache=cache, allowed_sources=args.allow_source) as service:
+        server = await serve(service, args.host, args.port)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"🛑 MHM brake optimization service listening on http://{host}:{port}")
+        print(f"🗄️ Result cache: {cache.directory if cache is not None else 'disabled'}")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    Run the optimization service until interrupted
+    """
+    parser = argparse.ArgumentParser(description="Serve MHM brake performance optimization over HTTP")
+    parser.add_argument('--host', default=DEFAULT_SERVICE_HOST, help="interface to bind (default: localhost only)")
+    parser.add_argument('--port', type=int, default=DEFAULT_SERVICE_PORT, help="TCP port (0 picks a free port)")
+    parser.add_argument('--source', default=BUILTIN_ISO_SOURCE,
+                        help="default baseline JSON/CSV file or catalog directory (default: built-in ISO data)")
+    parser.add_argument('--allow-source', action='append', default=[], metavar='SOURCE',
+                        help="additional baseline source requests may name; repeat for several")
+    parser.add_argument('--cache-dir',
+                        help="reuse and store results in this persistent cache directory (default: no cache)")
+    parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_RESULT_CACHE_MAX_BYTES / 2**20,
+                        help="result cache size cap in MiB; least recently used results are evicted")
+    parser.add_argument('--no-cache', action='store_true', help="always recompute, even with --cache-dir")
+    args = parser.parse_args(argv)
+    
+    try:
+        asyncio.run(_serve_forever(args))
+    except KeyboardInterrupt:
+        print("\n✅ MHM brake optimization service stopped")
+
+
+if __name__ == "__main__":
+    main()
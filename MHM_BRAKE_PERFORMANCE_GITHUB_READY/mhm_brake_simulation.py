@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Braking Simulation
+=======================================================
+Physics-based straight-line braking simulation for generating baselines in bulk
+
+MODEL:
+- Longitudinal point-mass vehicle with dynamic axle load transfer (CG height / wheelbase)
+- Fixed front/rear brake bias; ABS holds the first axle to reach its friction limit
+- Brake pressure build-up ramp, aerodynamic drag and rolling resistance
+- Fixed-step integration vectorized across every vehicle × scenario at once
+
+ABS CONTROL LOOP:
+- Four-wheel split-μ model with wheel spin dynamics and a slip-dependent tire curve
+- bang_bang_abs, five_state_abs and open_loop controllers at the configured control frequency
+- Yaw rate, lateral drift and ABS cycle counts for feeding the split-μ ABS optimization
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import numpy as np
+from typing import Dict, Mapping, Optional, Sequence
+
+from mhm_brake_kernels import integrate_stops
+from mhm_brake_performance_optimization import (
+    ABS_METRICS,
+    ABSScenario,
+    ISOBaselineStore,
+    SurfaceCondition
+)
+
+GRAVITY_MS2 = 9.81
+AIR_DENSITY_KG_M3 = 1.225
+CAST_IRON_DENSITY_KG_M3 = 7200.0
+CAST_IRON_SPECIFIC_HEAT_J_KGK = 460.0
+
+# Defaults for parameters the ISO vehicle data does not specify
+DEFAULT_SIMULATION_PARAMETERS = {
+    'front_static_load_fraction': 0.58,   # Front-engined passenger car
+    'front_brake_bias': 0.70,             # Share of brake force on the front axle
+    'abs_efficiency': 0.90,               # Fraction of peak friction ABS sustains
+    'max_system_deceleration_g': 1.20,    # Full-pressure hydraulic capability
+    'pressure_rise_time_s': 0.15,         # Pedal application to full pressure
+    'drag_area_m2': 0.70,                 # Cd × frontal area
+    'rolling_resistance': 0.012,
+    'pedal_gain_n_per_g': 510.0,          # Pedal force per g of deceleration
+    'initial_brake_temperature_c': 120.0,
+    'rotor_thickness_m': 0.028,
+    'rotor_solid_fraction': 0.6           # Vented rotor
+}
+
+
+class StoppingSimulationResult:
+    """
+    Arrays of simulated stopping performance, shaped like the broadcast inputs
+    """
+    
+    __slots__ = ('stopping_distance_m', 'stopping_time_s', 'mean_deceleration_g', 'peak_deceleration_g',
+                 'friction_limit_g', 'front_axle_limited')
+    
+    def __init__(self, stopping_distance_m: np.ndarray, stopping_time_s: np.ndarray,
+                 mean_deceleration_g: np.ndarray, peak_deceleration_g: np.ndarray,
+                 friction_limit_g: np.ndarray, front_axle_limited: np.ndarray):
+        self.stopping_distance_m = stopping_distance_m
+        self.stopping_time_s = stopping_time_s
+        self.mean_deceleration_g = mean_deceleration_g
+        self.peak_deceleration_g = peak_deceleration_g
+        self.friction_limit_g = friction_limit_g
+        self.front_axle_limited = front_axle_limited
+
+
+def axle_friction_limit_g(surface_mu, wheelbase_m, cg_height_m, front_static_load_fraction=0.58,
+                          front_brake_bias=0.70):
+    """
+    Highest deceleration (g) before either axle saturates, and whether the front axle limits it
+    
+    With fixed brake bias β, static front load fraction ψ and transfer ratio h/L:
+    front limit μψ / (β - μh/L), rear limit μ(1 - ψ) / (1 - β + μh/L).
+    """
+    mu = np.asarray(surface_mu, dtype=np.float64)
+    transfer = np.asarray(cg_height_m, dtype=np.float64) / np.asarray(wheelbase_m, dtype=np.float64)
+    psi = np.asarray(front_static_load_fraction, dtype=np.float64)
+    beta = np.asarray(front_brake_bias, dtype=np.float64)
+    
+    front_denominator = beta - mu * transfer
+    with np.errstate(divide='ignore', invalid='ignore'):
+        front_limit = np.where(front_denominator > 0, mu * psi / front_denominator, np.inf)
+    rear_limit = mu * (1 - psi) / (1 - beta + mu * transfer)
+    return np.minimum(front_limit, rear_limit), front_limit <= rear_limit
+
+
+def simulate_stopping_distance(mass_kg, wheelbase_m, cg_height_m, surface_mu, speed_kmh,
+                               dt: float = 5e-3, max_time_s: float = 60.0,
+                               **parameters) -> StoppingSimulationResult:
+    """
+    Simulate straight-line ABS stops to standstill for any broadcastable set of inputs
+    
+    Pass vehicle arrays shaped (N, 1) and surface arrays shaped (1, S) to simulate
+    every vehicle on every surface in one call. Keyword parameters override
+    DEFAULT_SIMULATION_PARAMETERS and may themselves be arrays.
+    """
+    unknown = set(parameters) - set(DEFAULT_SIMULATION_PARAMETERS)
+    if unknown:
+        raise TypeError(f"Unknown simulation parameters: {', '.join(sorted(unknown))}")
+    p = dict(DEFAULT_SIMULATION_PARAMETERS, **parameters)
+    
+    limit_g, front_limited = axle_friction_limit_g(surface_mu, wheelbase_m, cg_height_m,
+                                                   p['front_static_load_fraction'], p['front_brake_bias'])
+    limit_g = limit_g * p['abs_efficiency']
+    
+    shape = np.broadcast_shapes(np.shape(mass_kg), np.shape(limit_g), np.shape(speed_kmh),
+                                *(np.shape(p[key]) for key in ('max_system_deceleration_g', 'pressure_rise_time_s',
+                                                               'drag_area_m2', 'rolling_resistance')))
+    
+    def flat(value):
+        return np.broadcast_to(np.asarray(value, dtype=np.float64), shape).reshape(-1)
+    
+    v0 = flat(speed_kmh) / 3.6
+    drag_per_mass = flat(0.5 * AIR_DENSITY_KG_M3 * np.asarray(p['drag_area_m2'], dtype=np.float64)
+                         / np.asarray(mass_kg, dtype=np.float64))
+    distance, elapsed, peak = integrate_stops(
+        v0, flat(p['max_system_deceleration_g']) * GRAVITY_MS2, flat(limit_g) * GRAVITY_MS2,
+        flat(p['pressure_rise_time_s']), drag_per_mass, flat(p['rolling_resistance']) * GRAVITY_MS2,
+        float(dt), int(np.ceil(max_time_s / dt)))
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_g = v0 * v0 / (2 * distance * GRAVITY_MS2)
+    return StoppingSimulationResult(distance.reshape(shape), elapsed.reshape(shape), mean_g.reshape(shape),
+                                    (peak / GRAVITY_MS2).reshape(shape),
+                                    np.broadcast_to(limit_g, shape).copy(),
+                                    np.broadcast_to(front_limited, shape).copy())
+
+
+def rotor_mass_kg(diameter_mm, thickness_m: float = 0.028, solid_fraction: float = 0.6):
+    """
+    Approximate cast-iron rotor mass from its diameter
+    """
+    radius_m = np.asarray(diameter_mm, dtype=np.float64) / 2000
+    return CAST_IRON_DENSITY_KG_M3 * np.pi * radius_m ** 2 * thickness_m * solid_fraction
+
+
+def front_rotor_temperature_c(mass_kg, speed_kmh, front_brake_diameter_mm, **parameters):
+    """
+    Front rotor temperature after one stop from speed_kmh: the initial temperature plus
+    the front axle's share (brake bias) of the kinetic energy, absorbed by both rotors
+    """
+    p = dict(DEFAULT_SIMULATION_PARAMETERS, **parameters)
+    kinetic_energy = 0.5 * np.asarray(mass_kg, dtype=np.float64) * (np.asarray(speed_kmh, dtype=np.float64) / 3.6) ** 2
+    front_rotor_capacity = 2 * rotor_mass_kg(front_brake_diameter_mm, p['rotor_thickness_m'],
+                                             p['rotor_solid_fraction']) * CAST_IRON_SPECIFIC_HEAT_J_KGK
+    return p['initial_brake_temperature_c'] + p['front_brake_bias'] * kinetic_energy / front_rotor_capacity
+
+
+def vehicle_parameter_arrays(test_vehicles: Mapping[str, Mapping],
+                             vehicles: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Numeric test_vehicles fields as arrays in vehicle order
+    """
+    vehicles = list(test_vehicles) if vehicles is None else list(vehicles)
+    fields = ('mass_kg', 'wheelbase_m', 'cg_height_m', 'front_brake_diameter_mm', 'rear_brake_diameter_mm')
+    return {field: np.array([test_vehicles[vehicle][field] for vehicle in vehicles], dtype=np.float64)
+            for field in fields}
+
+
+def generate_baseline_store(test_vehicles: Mapping[str, Mapping], surfaces: Sequence[SurfaceCondition],
+                            metadata: Optional[Mapping] = None, **parameters) -> ISOBaselineStore:
+    """
+    Simulate BRAKE_METRICS baselines for every vehicle × surface and package them as a store
+    
+    stopping_distance_m and deceleration_g come from the simulation; pedal_force_n is
+    the pedal gain times the peak deceleration, and brake_temperature_c is the
+    initial temperature plus the front rotors' share of the kinetic energy.
+    """
+    vehicles = list(test_vehicles)
+    vehicle_params = vehicle_parameter_arrays(test_vehicles, vehicles)
+    p = dict(DEFAULT_SIMULATION_PARAMETERS, **parameters)
+    
+    mass = vehicle_params['mass_kg'][:, None]
+    mu = np.array([surface.surface_mu for surface in surfaces], dtype=np.float64)[None, :]
+    speed = np.array([surface.test_speed_kmh for surface in surfaces], dtype=np.float64)[None, :]
+    
+    result = simulate_stopping_distance(mass, vehicle_params['wheelbase_m'][:, None],
+                                        vehicle_params['cg_height_m'][:, None], mu, speed, **parameters)
+    
+    temperature = front_rotor_temperature_c(mass, speed, vehicle_params['front_brake_diameter_mm'][:, None], **p)
+    
+    performance = np.stack(np.broadcast_arrays(
+        result.stopping_distance_m,
+        result.mean_deceleration_g,
+        p['pedal_gain_n_per_g'] * result.peak_deceleration_g,
+        temperature
+    ), axis=-1)
+    
+    metadata = dict(metadata) if metadata is not None else {}
+    metadata.setdefault('standard_info', {'data_source': 'MHM braking simulation'})
+    metadata['test_vehicles'] = {vehicle: dict(test_vehicles[vehicle]) for vehicle in vehicles}
+    return ISOBaselineStore(vehicles, surfaces, [], performance,
+                            np.empty((len(vehicles), 0, len(ABS_METRICS))), metadata)
+
+
+# ABS controller variants named in matlab_braking_test.abs_control_variants
+ABS_CONTROLLERS = ('bang_bang_abs', 'five_state_abs', 'open_loop')
+
+DEFAULT_ABS_PARAMETERS = {
+    'control_frequency_hz': 50.0,          # matlab_braking_test.abs_parameters
+    'track_width_m': 1.55,
+    'wheel_inertia_kg_m2': 1.2,
+    'tire_radius_m': 0.31,                 # Used when a vehicle has no tire_size
+    'tire_shape_b': 10.0,                  # Simplified Pacejka μ(λ) = μ sin(C atan(Bλ))
+    'tire_shape_c': 1.65,
+    'axle_cornering_stiffness_n_rad': 60000.0,
+    'driver_heading_gain_nm_rad': 60000.0,  # Counter-steer yaw moment per radian of heading error
+    'apply_rate_per_s': 8.0,               # Normalized pressure build-up rate
+    'release_rate_per_s': 20.0,            # Normalized pressure dump rate
+    'slow_apply_fraction': 0.3,            # five_state_abs pressure reapply rate
+    'target_slip': 0.15,                   # bang_bang_abs switching slip
+    'release_slip': 0.20,                  # five_state_abs release threshold
+    'wheel_deceleration_threshold_g': 1.6,
+    'wheel_acceleration_threshold_g': 1.0,
+    'open_loop_pressure': 0.6,             # open_loop reference pressure (fraction of max)
+    'stop_speed_ms': 0.5
+}
+
+# five_state_abs phases
+_APPLY, _HOLD, _RELEASE, _HOLD_REACCEL, _SLOW_APPLY = range(5)
+
+# Wheel order FL, FR, RL, RR
+_LEFT_WHEELS = np.array([True, False, True, False])
+_FRONT_WHEELS = np.array([True, True, False, False])
+
+
+class ABSSimulationResult:
+    """
+    Split-μ ABS simulation outputs shaped (vehicles, scenarios, controllers)
+    """
+    
+    __slots__ = ('vehicles', 'scenarios', 'controllers', 'stopping_distance_m', 'stopping_time_s',
+                 'max_yaw_rate_deg_s', 'lateral_displacement_m', 'abs_cycles', 'abs_cycles_per_second')
+    
+    def __init__(self, vehicles: Sequence[str], scenarios: Sequence[str], controllers: Sequence[str],
+                 **arrays: np.ndarray):
+        self.vehicles = list(vehicles)
+        self.scenarios = list(scenarios)
+        self.controllers = list(controllers)
+        for name in self.__slots__[3:]:
+            setattr(self, name, arrays[name])
+    
+    def abs_metrics(self, controller: str) -> np.ndarray:
+        """(vehicles, scenarios, len(ABS_METRICS)) table for one controller"""
+        c = self.controllers.index(controller)
+        return np.stack([getattr(self, name)[:, :, c] for name in ABS_METRICS], axis=-1)
+
+
+def tire_radius_m(tire_size: str, default: float = 0.31) -> float:
+    """
+    Rolling radius from an ISO metric tire size such as '205/55R16'
+    """
+    try:
+        width_mm, rest = tire_size.upper().split('/')
+        aspect, rim_inches = rest.split('R')
+        return (float(rim_inches) * 25.4 / 2 + float(width_mm) * float(aspect) / 100) / 1000
+    except (AttributeError, ValueError):
+        return default
+
+
+def _tire_mu(slip, peak_mu, b, c):
+    """Friction coefficient and its slip derivative for the simplified tire curve"""
+    angle = c * np.arctan(b * slip)
+    mu = peak_mu * np.sin(angle)
+    dmu = peak_mu * np.cos(angle) * c * b / (1 + (b * slip) ** 2)
+    return mu, dmu
+
+
+def simulate_abs_braking(mass_kg, wheelbase_m, cg_height_m, tire_radius, left_surface_mu, right_surface_mu,
+                         initial_speed_kmh, controllers: Sequence[str] = ABS_CONTROLLERS, dt: float = 1e-3,
+                         max_time_s: float = 30.0, **parameters) -> Dict[str, np.ndarray]:
+    """
+    Simulate ABS stops for flat batches of runs; every input broadcasts to one run axis
+    
+    Each run is simulated once per controller, all in a single array-backed time loop.
+    Controllers update wheel pressure commands at control_frequency_hz; wheel and body
+    dynamics advance every dt. Returns arrays shaped (runs, controllers).
+    """
+    unknown = set(parameters) - set(DEFAULT_ABS_PARAMETERS) - set(DEFAULT_SIMULATION_PARAMETERS)
+    if unknown:
+        raise TypeError(f"Unknown ABS simulation parameters: {', '.join(sorted(unknown))}")
+    bad = [name for name in controllers if name not in ABS_CONTROLLERS]
+    if bad:
+        raise ValueError(f"Unknown ABS controllers: {', '.join(bad)} (expected one of {', '.join(ABS_CONTROLLERS)})")
+    p = dict(DEFAULT_SIMULATION_PARAMETERS, **DEFAULT_ABS_PARAMETERS)
+    p.update(parameters)
+    
+    runs = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64).reshape(-1) for value in (
+        mass_kg, wheelbase_m, cg_height_m, tire_radius, left_surface_mu, right_surface_mu, initial_speed_kmh)))
+    n_runs, n_controllers = runs[0].size, len(controllers)
+    
+    # Run × controller rows, wheels on the last axis
+    def rows(value):
+        return np.repeat(value, n_controllers)
+    mass, wheelbase, cg_height, radius, mu_left, mu_right, speed_kmh = (rows(value) for value in runs)
+    controller = np.tile(np.array([ABS_CONTROLLERS.index(name) for name in controllers]), n_runs)
+    is_bang_bang, is_five_state = controller == 0, controller == 1
+    is_open_loop = controller == 2
+    
+    psi, beta = p['front_static_load_fraction'], p['front_brake_bias']
+    peak_mu = np.where(_LEFT_WHEELS, mu_left[:, None], mu_right[:, None])
+    radius_w = radius[:, None]
+    a_half = wheelbase * (1 - psi)  # CG to front axle
+    b_half = wheelbase * psi        # CG to rear axle
+    yaw_inertia = mass * a_half * b_half
+    max_torque = (np.where(_FRONT_WHEELS, beta, 1 - beta) * p['max_system_deceleration_g'] * GRAVITY_MS2
+                  * mass[:, None] * radius_w / 2)
+    yaw_damping_gain = (a_half ** 2 + b_half ** 2) * p['axle_cornering_stiffness_n_rad']
+    wheel_inertia = p['wheel_inertia_kg_m2']
+    
+    v = speed_kmh / 3.6
+    omega = v[:, None] / radius_w * np.ones(4)
+    pressure = np.zeros_like(omega)
+    rate = np.zeros_like(omega)
+    phase = np.zeros(omega.shape, dtype=np.int8)
+    releasing = np.zeros(omega.shape, dtype=bool)
+    cycles = np.zeros(omega.shape)
+    omega_at_tick = omega.copy()
+    
+    yaw_rate = np.zeros_like(v)
+    heading = np.zeros_like(v)
+    lateral = np.zeros_like(v)
+    distance = np.zeros_like(v)
+    elapsed = np.zeros_like(v)
+    max_yaw = np.zeros_like(v)
+    max_lateral = np.zeros_like(v)
+    deceleration = np.zeros_like(v)
+    active = v > p['stop_speed_ms']
+    
+    steps_per_tick = max(1, int(round(1.0 / (p['control_frequency_hz'] * dt))))
+    tick_period = steps_per_tick * dt
+    b, c = p['tire_shape_b'], p['tire_shape_c']
+    decel_threshold = p['wheel_deceleration_threshold_g'] * GRAVITY_MS2
+    accel_threshold = p['wheel_acceleration_threshold_g'] * GRAVITY_MS2
+    
+    for step in range(int(np.ceil(max_time_s / dt))):
+        if not active.any():
+            break
+        v_w = v[:, None]
+        slip = np.clip(1 - omega * radius_w / np.maximum(v_w, 1e-6), 0.0, 1.0)
+        
+        # Controllers run on the control clock with zero-order-hold pressure rates
+        if step % steps_per_tick == 0:
+            wheel_accel = (omega - omega_at_tick) * radius_w / tick_period  # circumferential, m/s²
+            omega_at_tick = omega.copy()
+            
+            bang_bang_release = slip > p['target_slip']
+            
+            decelerating = wheel_accel < -decel_threshold
+            new_phase = phase.copy()
+            new_phase[(phase == _APPLY) & decelerating] = _HOLD
+            new_phase[(phase == _SLOW_APPLY) & decelerating] = _HOLD
+            new_phase[(phase == _HOLD) & (slip > p['release_slip'])] = _RELEASE
+            new_phase[(phase == _HOLD) & ~decelerating & (slip <= p['release_slip'])] = _SLOW_APPLY
+            new_phase[(phase == _RELEASE) & (wheel_accel > 0)] = _HOLD_REACCEL
+            new_phase[(phase == _HOLD_REACCEL) & (wheel_accel < accel_threshold)] = _SLOW_APPLY
+            phase = np.where(is_five_state[:, None], new_phase, phase)
+            five_state_rate = np.select(
+                [phase == _APPLY, phase == _RELEASE, phase == _SLOW_APPLY],
+                [p['apply_rate_per_s'], -p['release_rate_per_s'], p['apply_rate_per_s'] * p['slow_apply_fraction']],
+                0.0)
+            
+            open_loop_rate = np.clip((p['open_loop_pressure'] - pressure) / tick_period,
+                                     -p['release_rate_per_s'], p['apply_rate_per_s'])
+            rate = np.select(
+                [is_bang_bang[:, None], is_five_state[:, None]],
+                [np.where(bang_bang_release, -p['release_rate_per_s'], p['apply_rate_per_s']), five_state_rate],
+                open_loop_rate)
+            
+            now_releasing = (rate < 0) & ~is_open_loop[:, None]
+            cycles += active[:, None] & now_releasing & ~releasing
+            releasing = now_releasing
+        
+        pressure = np.clip(pressure + rate * dt, 0.0, 1.0)
+        
+        # Axle loads with longitudinal transfer from the previous step's deceleration
+        transfer = mass * deceleration * cg_height / wheelbase
+        front_load = (mass * GRAVITY_MS2 * psi + transfer) / 2
+        rear_load = (mass * GRAVITY_MS2 * (1 - psi) - transfer) / 2
+        normal_load = np.where(_FRONT_WHEELS, front_load[:, None], rear_load[:, None])
+        
+        # Semi-implicit wheel spin update, linearized tire force keeps stiff low-speed slip stable
+        mu, dmu = _tire_mu(slip, peak_mu, b, c)
+        force = mu * normal_load
+        stiffness = np.maximum(dmu, 0.0) * normal_load
+        torque = pressure * max_torque
+        omega_next = ((wheel_inertia * omega / dt - torque + radius_w * (force + stiffness * (1 - slip)))
+                      / (wheel_inertia / dt + radius_w ** 2 * stiffness / np.maximum(v_w, 1e-6)))
+        omega_next = np.clip(omega_next, 0.0, v_w / radius_w)
+        
+        slip_next = np.clip(1 - omega_next * radius_w / np.maximum(v_w, 1e-6), 0.0, 1.0)
+        force = _tire_mu(slip_next, peak_mu, b, c)[0] * normal_load
+        total_force = force.sum(axis=1)
+        new_deceleration = total_force / mass + p['rolling_resistance'] * GRAVITY_MS2
+        
+        # Split-μ yaw moment; side grip fades with longitudinal slip
+        yaw_moment = p['track_width_m'] / 2 * (force[:, ~_LEFT_WHEELS].sum(axis=1) - force[:, _LEFT_WHEELS].sum(axis=1))
+        grip = 1 - slip_next.mean(axis=1)
+        yaw_damping = yaw_damping_gain * grip / np.maximum(v, 1e-6)
+        yaw_moment -= p['driver_heading_gain_nm_rad'] * grip * heading
+        new_yaw_rate = (yaw_rate + dt * yaw_moment / yaw_inertia) / (1 + dt * yaw_damping / yaw_inertia)
+        
+        v_next = v - new_deceleration * dt
+        stopping = active & (v_next <= p['stop_speed_ms'])
+        moving = active & ~stopping
+        
+        distance += np.where(moving, (v + v_next) * 0.5 * dt, 0.0)
+        distance += np.where(stopping, v * v / (2 * np.maximum(new_deceleration, 1e-6)), 0.0)
+        elapsed += np.where(moving, dt, 0.0)
+        elapsed += np.where(stopping, v / np.maximum(new_deceleration, 1e-6), 0.0)
+        heading += np.where(active, new_yaw_rate * dt, 0.0)
+        lateral += np.where(active, v * np.sin(heading) * dt, 0.0)
+        max_yaw = np.maximum(max_yaw, np.where(active, np.abs(new_yaw_rate), 0.0))
+        max_lateral = np.maximum(max_lateral, np.abs(lateral))
+        
+        keep = active[:, None]
+        omega = np.where(keep, omega_next, omega)
+        yaw_rate = np.where(active, new_yaw_rate, yaw_rate)
+        deceleration = np.where(active, new_deceleration, deceleration)
+        v = np.where(moving, v_next, np.where(active, 0.0, v))
+        active = moving
+    
+    distance[active] = np.inf
+    elapsed[active] = np.inf
+    
+    shape = (n_runs, n_controllers)
+    wheel_cycles = cycles.max(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cycles_per_second = np.where(elapsed > 0, wheel_cycles / elapsed, 0.0)
+    return {
+        'stopping_distance_m': distance.reshape(shape),
+        'stopping_time_s': elapsed.reshape(shape),
+        'max_yaw_rate_deg_s': np.degrees(max_yaw).reshape(shape),
+        'lateral_displacement_m': max_lateral.reshape(shape),
+        'abs_cycles': wheel_cycles.reshape(shape),
+        'abs_cycles_per_second': cycles_per_second.reshape(shape)
+    }
+
+
+def simulate_abs_scenarios(test_vehicles: Mapping[str, Mapping], scenarios: Sequence[ABSScenario],
+                           controllers: Sequence[str] = ABS_CONTROLLERS, **parameters) -> ABSSimulationResult:
+    """
+    Run every vehicle × split-μ scenario × ABS controller in one batched simulation
+    """
+    vehicles = list(test_vehicles)
+    vehicle_params = vehicle_parameter_arrays(test_vehicles, vehicles)
+    default_radius = parameters.get('tire_radius_m', DEFAULT_ABS_PARAMETERS['tire_radius_m'])
+    radius = np.array([tire_radius_m(test_vehicles[vehicle].get('tire_size'), default_radius)
+                       for vehicle in vehicles])
+    
+    n_vehicles, n_scenarios = len(vehicles), len(scenarios)
+    
+    def per_vehicle(values):
+        return np.repeat(values, n_scenarios)
+    
+    def per_scenario(attribute):
+        return np.tile(np.array([getattr(scenario, attribute) for scenario in scenarios], dtype=np.float64),
+                       n_vehicles)
+    
+    outputs = simulate_abs_braking(
+        per_vehicle(vehicle_params['mass_kg']), per_vehicle(vehicle_params['wheelbase_m']),
+        per_vehicle(vehicle_params['cg_height_m']), per_vehicle(radius),
+        per_scenario('left_surface_mu'), per_scenario('right_surface_mu'), per_scenario('initial_speed_kmh'),
+        controllers, **parameters)
+    
+    shape = (n_vehicles, n_scenarios, len(controllers))
+    return ABSSimulationResult(vehicles, [scenario.name for scenario in scenarios], controllers,
+                               **{name: values.reshape(shape) for name, values in outputs.items()})
+
+
+def with_simulated_abs(store: ISOBaselineStore, controller: str = 'bang_bang_abs',
+                       **parameters) -> ISOBaselineStore:
+    """
+    Copy of a store whose abs_performance comes from the ABS simulation
+    
+    The control frequency defaults to matlab_braking_test.abs_parameters.control_frequency_hz
+    when the store provides it. The result can be passed straight to
+    apply_tesla_folding_to_brake_performance.
+    """
+    abs_parameters = store.metadata.get('matlab_braking_test', {}).get('abs_parameters', {})
+    if 'control_frequency_hz' in abs_parameters:
+        parameters.setdefault('control_frequency_hz', abs_parameters['control_frequency_hz'])
+    
+    result = simulate_abs_scenarios(store.metadata['test_vehicles'], store.abs_scenarios, [controller], **parameters)
+    
+    abs_performance = np.full((len(store.vehicles), len(store.abs_scenarios), len(ABS_METRICS)), np.nan)
+    rows = [store.vehicle_index(vehicle) for vehicle in result.vehicles]
+    abs_performance[rows] = result.abs_metrics(controller)
+    return ISOBaselineStore(store.vehicles, store.surfaces, store.abs_scenarios, np.array(store.performance),
+                            abs_performance, store.metadata, store.section_order)
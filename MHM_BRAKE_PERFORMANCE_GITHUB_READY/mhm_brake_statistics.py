@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Aggregate Statistics
+=========================================================
+Grouped summary statistics computed directly on result arrays
+
+STATISTICS (per group and metric, NaN samples ignored):
+- count, mean, std (population), min, max
+- percentiles, linearly interpolated like np.percentile (p5, p50, p95 by default)
+
+Every group and metric is summarized from one sort of the samples; there is no
+per-group or per-vehicle Python loop.
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+
+DEFAULT_PERCENTILES = (5.0, 50.0, 95.0)
+ALL_GROUP = 'all'
+
+
+def _percentile_name(q: float) -> str:
+    return f"p{q:g}"
+
+
+class AggregateStatistics:
+    """
+    Summary statistics shaped (groups, metrics, statistics)
+    """
+    
+    __slots__ = ('groups', 'metrics', 'statistics', 'values')
+    
+    def __init__(self, groups: Sequence, metrics: Sequence[str], statistics: Sequence[str], values: np.ndarray):
+        self.groups = list(groups)
+        self.metrics = tuple(metrics)
+        self.statistics = tuple(statistics)
+        self.values = values
+    
+    def get(self, metric: str, statistic: str = 'mean', group=None) -> float:
+        """One statistic; group may be omitted when there is a single group"""
+        if group is None:
+            if len(self.groups) != 1:
+                raise ValueError(f"Specify a group: {', '.join(map(str, self.groups))}")
+            group = self.groups[0]
+        try:
+            index = (self.groups.index(group), self.metrics.index(metric), self.statistics.index(statistic))
+        except ValueError:
+            raise KeyError(f"No {statistic!r} of {metric!r} for group {group!r}") from None
+        return float(self.values[index])
+    
+    def to_dict(self) -> Dict:
+        """Nested {group: {metric: {statistic: value}}} view"""
+        values = self.values.tolist()
+        return {
+            group: {metric: dict(zip(self.statistics, values[g][m])) for m, metric in enumerate(self.metrics)}
+            for g, group in enumerate(self.groups)
+        }
+
+
+def aggregate(values: np.ndarray, codes: Optional[np.ndarray] = None, groups: Sequence = (ALL_GROUP,),
+              metric_names: Sequence[str] = (),
+              percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> AggregateStatistics:
+    """
+    Summarize a (..., M) array of samples per group
+    
+    codes are integer group indices into groups, broadcastable to values.shape[:-1]
+    (None puts every sample in one group). NaN samples are skipped; a group without
+    samples for a metric gets count 0 and NaN statistics.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_metrics = values.shape[-1]
+    metric_names = tuple(metric_names) or tuple(f"metric_{m}" for m in range(n_metrics))
+    if len(metric_names) != n_metrics:
+        raise ValueError(f"Got {len(metric_names)} metric names for {n_metrics} metrics")
+    percentiles = np.asarray(percentiles, dtype=np.float64)
+    if ((percentiles < 0) | (percentiles > 100)).any():
+        raise ValueError("Percentiles must lie in [0, 100]")
+    
+    samples = values.reshape(-1, n_metrics)
+    n_groups = len(groups)
+    codes = np.zeros(len(samples), dtype=np.intp) if codes is None else (
+        np.broadcast_to(np.asarray(codes, dtype=np.intp), values.shape[:-1]).reshape(-1))
+    if not len(samples):  # A lone NaN sample keeps the indexing below valid and counts as nothing
+        samples = np.full((1, n_metrics), np.nan)
+        codes = np.zeros(1, dtype=np.intp)
+    
+    # Sort by group, then by value within each group; NaN sorts last inside its group
+    order = np.lexsort((samples, np.broadcast_to(codes[:, None], samples.shape)), axis=0)
+    ordered = np.take_along_axis(samples, order, axis=0)
+    valid = ~np.isnan(samples)
+    
+    counts = np.stack([np.bincount(codes, weights=valid[:, m], minlength=n_groups)
+                       for m in range(n_metrics)], axis=1).astype(np.intp)  # (G, M)
+    starts = np.searchsorted(np.sort(codes), np.arange(n_groups))[:, None]  # first row of each group
+    filled = np.where(valid, samples, 0.0)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sums = np.stack([np.bincount(codes, weights=filled[:, m], minlength=n_groups)
+                         for m in range(n_metrics)], axis=1)
+        mean = sums / counts
+        deviation = np.where(valid, samples - mean[codes], 0.0)
+        variance = np.stack([np.bincount(codes, weights=deviation[:, m] ** 2, minlength=n_groups)
+                             for m in range(n_metrics)], axis=1) / counts
+        
+        # Order statistics: min (q=0), requested percentiles, max (q=100) from the sorted block
+        q = np.concatenate([[0.0], percentiles, [100.0]])
+        position = (np.maximum(counts, 1) - 1)[..., None] * q / 100  # (G, M, Q)
+        low = np.floor(position).astype(np.intp)
+        high = np.ceil(position).astype(np.intp)
+        columns = np.arange(n_metrics)[None, :, None]
+        last = len(ordered) - 1
+        low_values = ordered[np.minimum(starts[..., None] + low, last), columns]
+        high_values = ordered[np.minimum(starts[..., None] + high, last), columns]
+        order_statistics = low_values + (position - low) * (high_values - low_values)
+        order_statistics[counts == 0] = np.nan
+    
+    statistics = ('count', 'mean', 'std', 'min', 'max') + tuple(_percentile_name(p) for p in percentiles)
+    table = np.concatenate([
+        counts[..., None].astype(np.float64), mean[..., None], np.sqrt(variance)[..., None],
+        order_statistics[..., :1], order_statistics[..., -1:], order_statistics[..., 1:-1]
+    ], axis=-1)
+    return AggregateStatistics(groups, metric_names, statistics, table)
+
+
+def group_codes(labels: Sequence) -> Tuple[list, np.ndarray]:
+    """(distinct labels in first-seen order, integer code per label)"""
+    groups = list(dict.fromkeys(labels))
+    index = {group: i for i, group in enumerate(groups)}
+    return groups, np.array([index[label] for label in labels], dtype=np.intp)
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - CAN Telemetry Ingestion
+============================================================
+Streaming decode of live brake telemetry from a python-can bus or a recorded log
+
+PIPELINE:
+- Frames are decoded with a DBC database (cantools); the bundled BRAKE_TELEMETRY_DBC
+  describes brake pressure, wheel speed and vehicle dynamics frames
+- Every signal lands in a fixed-size ring buffer, so memory never grows
+- Brake stops are detected and integrated frame by frame (O(1) per frame), giving
+  stopping distance and deceleration as soon as the vehicle comes to rest
+- rolling_metrics() summarizes the last window_s seconds of every buffer
+
+Requires the 'real_time' extra (python-can, cantools).
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import time
+import numpy as np
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:
+    import can
+except ImportError:
+    can = None
+
+try:
+    import cantools
+except ImportError:
+    cantools = None
+
+CAN_AVAILABLE = can is not None and cantools is not None
+
+# Frames that are not in the DBC, or whose payload does not decode, are counted and skipped
+_DECODE_ERRORS = (KeyError, ValueError) + ((cantools.database.DecodeError,) if cantools is not None else ())
+
+GRAVITY_MS2 = 9.81
+
+# Reference DBC for the brake telemetry frames decoded by default
+BRAKE_TELEMETRY_DBC = '''VERSION ""
+
+NS_ :
+
+BS_:
+
+BU_: ABS
+
+BO_ 256 BRAKE_PRESSURE: 8 ABS
+ SG_ BrakePressure : 0|16@1+ (0.01,0) [0|655.35] "bar" Vector__XXX
+
+BO_ 257 WHEEL_SPEEDS: 8 ABS
+ SG_ WheelSpeedFL : 0|16@1+ (0.01,0) [0|655.35] "km/h" Vector__XXX
+ SG_ WheelSpeedFR : 16|16@1+ (0.01,0) [0|655.35] "km/h" Vector__XXX
+ SG_ WheelSpeedRL : 32|16@1+ (0.01,0) [0|655.35] "km/h" Vector__XXX
+ SG_ WheelSpeedRR : 48|16@1+ (0.01,0) [0|655.35] "km/h" Vector__XXX
+
+BO_ 258 VEHICLE_DYNAMICS: 8 ABS
+ SG_ LongitudinalDecel : 0|16@1- (0.001,0) [-32.768|32.767] "g" Vector__XXX
+ SG_ YawRate : 16|16@1- (0.01,0) [-327.68|327.67] "deg/s" Vector__XXX
+'''
+
+# DBC signal name -> pipeline signal name
+DEFAULT_SIGNAL_MAP = {
+    'BrakePressure': 'brake_pressure_bar',
+    'WheelSpeedFL': 'wheel_speed_fl_kmh',
+    'WheelSpeedFR': 'wheel_speed_fr_kmh',
+    'WheelSpeedRL': 'wheel_speed_rl_kmh',
+    'WheelSpeedRR': 'wheel_speed_rr_kmh',
+    'LongitudinalDecel': 'deceleration_g',
+    'YawRate': 'yaw_rate_deg_s'
+}
+WHEEL_SPEED_SIGNALS = ('wheel_speed_fl_kmh', 'wheel_speed_fr_kmh', 'wheel_speed_rl_kmh', 'wheel_speed_rr_kmh')
+
+
+def _require_can():
+    if not CAN_AVAILABLE:
+        raise ImportError("CAN telemetry needs python-can and cantools: "
+                          "pip install mhm-brake-performance[real_time]")
+
+
+def load_brake_dbc(path: Optional[str] = None):
+    """
+    cantools database from a DBC file, or the bundled BRAKE_TELEMETRY_DBC
+    """
+    _require_can()
+    if path is None:
+        return cantools.database.load_string(BRAKE_TELEMETRY_DBC, 'dbc')
+    return cantools.database.load_file(path)
+
+
+class SignalRingBuffer:
+    """
+    Fixed-capacity (timestamp, value) ring buffer; the oldest samples are overwritten
+    """
+    
+    __slots__ = ('capacity', '_times', '_values', '_next', '_size')
+    
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._times = np.zeros(capacity)
+        self._values = np.zeros(capacity)
+        self._next = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, timestamp: float, value: float):
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+    
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """Most recent (timestamp, value), or None when empty"""
+        if not self._size:
+            return None
+        index = self._next - 1
+        return float(self._times[index]), float(self._values[index])
+    
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps, values) oldest first"""
+        if self._size < self.capacity:
+            return self._times[:self._size].copy(), self._values[:self._size].copy()
+        return (np.concatenate([self._times[self._next:], self._times[:self._next]]),
+                np.concatenate([self._values[self._next:], self._values[:self._next]]))
+    
+    def window(self, seconds: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps, values) no older than seconds before the latest sample"""
+        times, values = self.arrays()
+        if not len(times):
+            return times, values
+        start = np.searchsorted(times, times[-1] - seconds, side='left')
+        return times[start:], values[start:]
+
+
+class StopEvent:
+    """
+    One detected brake stop, from brake application to standstill
+    """
+    
+    __slots__ = ('start_time_s', 'end_time_s', 'initial_speed_kmh', 'stopping_distance_m',
+                 'mean_deceleration_g', 'peak_deceleration_g', 'peak_brake_pressure_bar')
+    
+    def __init__(self, start_time_s: float, end_time_s: float, initial_speed_kmh: float,
+                 stopping_distance_m: float, mean_deceleration_g: float, peak_deceleration_g: float,
+                 peak_brake_pressure_bar: float):
+        self.start_time_s = start_time_s
+        self.end_time_s = end_time_s
+        self.initial_speed_kmh = initial_speed_kmh
+        self.stopping_distance_m = stopping_distance_m
+        self.mean_deceleration_g = mean_deceleration_g
+        self.peak_deceleration_g = peak_deceleration_g
+        self.peak_brake_pressure_bar = peak_brake_pressure_bar
+    
+    @property
+    def stopping_time_s(self) -> float:
+        return self.end_time_s - self.start_time_s
+    
+    def to_dict(self) -> Dict:
+        fields = {slot: getattr(self, slot) for slot in self.__slots__}
+        fields['stopping_time_s'] = self.stopping_time_s
+        return fields
+    
+    def __repr__(self) -> str:
+        return (f"StopEvent({self.initial_speed_kmh:.1f} km/h -> 0 in {self.stopping_distance_m:.2f} m, "
+                f"{self.mean_deceleration_g:.3f} g)")
+
+
+class BrakeTelemetryPipeline:
+    """
+    Decode brake telemetry frames into ring buffers and detect/measure stops as they happen
+    
+    A stop starts when brake pressure reaches brake_on_pressure_bar while the vehicle
+    moves faster than stop_speed_kmh, and completes when the mean wheel speed falls
+    to stop_speed_kmh. Releasing the brake first abandons the stop. Distance is
+    integrated (trapezoidal) from consecutive wheel speed frames.
+    """
+    
+    def __init__(self, database=None, capacity: int = 2048, window_s: float = 1.0,
+                 signal_map: Mapping[str, str] = DEFAULT_SIGNAL_MAP, brake_on_pressure_bar: float = 2.0,
+                 stop_speed_kmh: float = 0.5, max_events: int = 256):
+        _require_can()
+        self.database = database if database is not None else load_brake_dbc()
+        self.window_s = window_s
+        self.signal_map = dict(signal_map)
+        self.brake_on_pressure_bar = brake_on_pressure_bar
+        self.stop_speed_kmh = stop_speed_kmh
+        
+        self.buffers = {name: SignalRingBuffer(capacity)
+                        for name in list(self.signal_map.values()) + ['vehicle_speed_kmh']}
+        self._wheel_speeds = [name for name in WHEEL_SPEED_SIGNALS if name in self.buffers]
+        self._events: List[StopEvent] = []
+        self.max_events = max_events
+        
+        self.frames = 0
+        self.unknown_frames = 0
+        self.max_latency_s = 0.0
+        self._total_latency_s = 0.0
+        
+        self._stop = None  # In-progress stop: dict of running sums
+        self._last_speed: Optional[Tuple[float, float]] = None
+    
+    @property
+    def events(self) -> List[StopEvent]:
+        """Completed stops, oldest first (the last max_events are kept)"""
+        return list(self._events)
+    
+    def process(self, message) -> Optional[StopEvent]:
+        """
+        Decode one can.Message; returns the StopEvent it completed, if any
+        """
+        started = time.perf_counter()
+        try:
+            decoded = self.database.decode_message(message.arbitration_id, message.data, decode_choices=False)
+        except _DECODE_ERRORS:
+            self.unknown_frames += 1
+            return None
+        
+        timestamp = message.timestamp
+        updated = set()
+        for signal, value in decoded.items():
+            name = self.signal_map.get(signal)
+            if name is not None:
+                self.buffers[name].append(timestamp, float(value))
+                updated.add(name)
+        
+        event = None
+        if 'brake_pressure_bar' in updated:
+            self._on_pressure(timestamp)
+        if 'deceleration_g' in updated and self._stop is not None:
+            self._stop['peak_deceleration_g'] = max(self._stop['peak_deceleration_g'],
+                                                    self.buffers['deceleration_g'].latest()[1])
+        if updated.intersection(self._wheel_speeds):
+            speed = float(np.mean([self.buffers[name].latest()[1] for name in self._wheel_speeds
+                                   if len(self.buffers[name])]))
+            self.buffers['vehicle_speed_kmh'].append(timestamp, speed)
+            event = self._on_speed(timestamp, speed)
+        
+        elapsed = time.perf_counter() - started
+        self.frames += 1
+        self._total_latency_s += elapsed
+        self.max_latency_s = max(self.max_latency_s, elapsed)
+        return event
+    
+    def _on_pressure(self, timestamp: float):
+        pressure = self.buffers['brake_pressure_bar'].latest()[1]
+        speed = self._last_speed[1] if self._last_speed is not None else None
+        if self._stop is None:
+            if pressure >= self.brake_on_pressure_bar and speed is not None and speed > self.stop_speed_kmh:
+                self._stop = {'start_time_s': timestamp, 'initial_speed_kmh': speed, 'distance_m': 0.0,
+                              'peak_deceleration_g': 0.0, 'peak_brake_pressure_bar': pressure}
+        elif pressure < self.brake_on_pressure_bar:
+            self._stop = None  # Brake released before standstill
+        else:
+            self._stop['peak_brake_pressure_bar'] = max(self._stop['peak_brake_pressure_bar'], pressure)
+    
+    def _on_speed(self, timestamp: float, speed: float) -> Optional[StopEvent]:
+        previous = self._last_speed
+        self._last_speed = (timestamp, speed)
+        if self._stop is None:
+            return None
+        if previous is not None and timestamp > self._stop['start_time_s']:
+            start = max(previous[0], self._stop['start_time_s'])
+            self._stop['distance_m'] += 0.5 * (previous[1] + speed) / 3.6 * (timestamp - start)
+        if speed > self.stop_speed_kmh:
+            return None
+        
+        stop, self._stop = self._stop, None
+        duration = timestamp - stop['start_time_s']
+        mean_deceleration = ((stop['initial_speed_kmh'] - speed) / 3.6 / duration / GRAVITY_MS2
+                             if duration > 0 else float('nan'))
+        event = StopEvent(stop['start_time_s'], timestamp, stop['initial_speed_kmh'], stop['distance_m'],
+                          mean_deceleration, stop['peak_deceleration_g'], stop['peak_brake_pressure_bar'])
+        self._events.append(event)
+        del self._events[:-self.max_events]
+        return event
+    
+    def rolling_metrics(self, window_s: Optional[float] = None) -> Dict:
+        """
+        Rolling summary over the last window_s seconds (default: the pipeline window)
+        
+        projected_stopping_distance_m extrapolates the current speed at the rolling mean
+        deceleration and adds the distance already covered in an in-progress stop.
+        """
+        window_s = self.window_s if window_s is None else window_s
+        speed_times, speeds = self.buffers['vehicle_speed_kmh'].window(window_s)
+        _, decelerations = self.buffers['deceleration_g'].window(window_s) if (
+            'deceleration_g' in self.buffers) else (None, np.empty(0))
+        _, pressures = self.buffers['brake_pressure_bar'].window(window_s) if (
+            'brake_pressure_bar' in self.buffers) else (None, np.empty(0))
+        
+        speed = float(speeds[-1]) if len(speeds) else float('nan')
+        speed_deceleration = float('nan')
+        if len(speeds) > 1 and speed_times[-1] > speed_times[0]:
+            speed_deceleration = float((speeds[0] - speeds[-1]) / 3.6 /
+                                       (speed_times[-1] - speed_times[0]) / GRAVITY_MS2)
+        mean_deceleration = float(decelerations.mean()) if len(decelerations) else speed_deceleration
+        
+        braking = self._stop is not None
+        projected = float('nan')
+        if braking and mean_deceleration > 0:
+            projected = self._stop['distance_m'] + (speed / 3.6) ** 2 / (2 * mean_deceleration * GRAVITY_MS2)
+        
+        return {
+            'vehicle_speed_kmh': speed,
+            'mean_deceleration_g': mean_deceleration,
+            'peak_deceleration_g': float(decelerations.max()) if len(decelerations) else float('nan'),
+            'speed_derived_deceleration_g': speed_deceleration,
+            'mean_brake_pressure_bar': float(pressures.mean()) if len(pressures) else float('nan'),
+            'braking': braking,
+            'stop_distance_so_far_m': self._stop['distance_m'] if braking else 0.0,
+            'projected_stopping_distance_m': projected,
+            'completed_stops': len(self._events)
+        }
+    
+    def stats(self) -> Dict:
+        """Frame counts and per-frame processing latency"""
+        return {
+            'frames': self.frames,
+            'unknown_frames': self.unknown_frames,
+            'mean_latency_s': self._total_latency_s / self.frames if self.frames else 0.0,
+            'max_latency_s': self.max_latency_s
+        }
+    
+    def consume(self, bus, duration_s: Optional[float] = None, max_messages: Optional[int] = None,
+                timeout_s: float = 0.1, stop_on_idle: bool = True) -> List[StopEvent]:
+        """
+        Read frames from a python-can bus; returns the stops completed meanwhile
+        
+        Stops after duration_s seconds, after max_messages frames, or (with
+        stop_on_idle) when no frame arrives within timeout_s.
+        """
+        deadline = None if duration_s is None else time.monotonic() + duration_s
+        completed = []
+        received = 0
+        while max_messages is None or received < max_messages:
+            remaining = timeout_s if deadline is None else min(timeout_s, deadline - time.monotonic())
+            if remaining <= 0:
+                break
+            message = bus.recv(remaining)
+            if message is None:
+                if stop_on_idle and deadline is None:
+                    break
+                continue
+            received += 1
+            event = self.process(message)
+            if event is not None:
+                completed.append(event)
+        return completed
+    
+    def replay(self, log: Union[str, Iterable]) -> List[StopEvent]:
+        """
+        Feed a recorded log (any python-can LogReader format, e.g. .asc/.blf/.log) or messages
+        """
+        messages = can.LogReader(log) if isinstance(log, str) else log
+        completed = []
+        for message in messages:
+            event = self.process(message)
+            if event is not None:
+                completed.append(event)
+        return completed
+
+
+def synthetic_stop_frames(database=None, initial_speed_kmh: float = 100.0, deceleration_g: float = 0.8,
+                          brake_pressure_bar: float = 80.0, rate_hz: float = 100.0, cruise_s: float = 0.5,
+                          start_time_s: float = 0.0) -> Iterator:
+    """
+    CAN frames for a constant-deceleration stop: cruise, brake to standstill, hold
+    
+    Useful for exercising the pipeline on a virtual bus; the exact stopping
+    distance is initial_speed² / (2 · deceleration).
+    """
+    _require_can()
+    database = database if database is not None else load_brake_dbc()
+    pressure_frame = database.get_message_by_name('BRAKE_PRESSURE')
+    speed_frame = database.get_message_by_name('WHEEL_SPEEDS')
+    dynamics_frame = database.get_message_by_name('VEHICLE_DYNAMICS')
+    
+    v0 = initial_speed_kmh / 3.6
+    stop_s = v0 / (deceleration_g * GRAVITY_MS2)
+    steps = int(np.ceil((cruise_s + stop_s) * rate_hz)) + int(cruise_s * rate_hz) + 1
+    for step in range(steps):
+        t = step / rate_hz
+        braking_s = t - cruise_s
+        braking = braking_s >= 0
+        speed = max(v0 - deceleration_g * GRAVITY_MS2 * max(braking_s, 0.0), 0.0) * 3.6
+        deceleration = deceleration_g if braking and speed > 0 else 0.0
+        timestamp = start_time_s + t
+        
+        yield can.Message(timestamp=timestamp, arbitration_id=pressure_frame.frame_id, is_extended_id=False,
+                          data=pressure_frame.encode({'BrakePressure': brake_pressure_bar if braking else 0.0}))
+        yield can.Message(timestamp=timestamp, arbitration_id=dynamics_frame.frame_id, is_extended_id=False,
+                          data=dynamics_frame.encode({'LongitudinalDecel': deceleration, 'YawRate': 0.0}))
+        yield can.Message(timestamp=timestamp, arbitration_id=speed_frame.frame_id, is_extended_id=False,
+                          data=speed_frame.encode({name: speed for name in ('WheelSpeedFL', 'WheelSpeedFR',
+                                                                              'WheelSpeedRL', 'WheelSpeedRR')}))
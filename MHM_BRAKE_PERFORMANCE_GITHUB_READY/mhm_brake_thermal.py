@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Thermal Fade Model
+=======================================================
+Rotor temperature and pad friction fade over long sequences of repeated stops
+
+MODEL:
+- Lumped-capacity cast-iron rotors per axle, sized from front_brake_diameter_mm /
+  rear_brake_diameter_mm; each stop's kinetic energy is split by brake bias
+- Newtonian cooling between stops with a per-axle time constant from rotor mass
+  and convective area
+- Pad friction (pad_friction_coefficient) holds up to a fade onset temperature and
+  then falls linearly, down to a floor
+- At constant brake input the deceleration follows the faded friction, which
+  lengthens the stop and shortens the cooling before the next one
+
+All vehicles advance together as arrays; only the recurrence over stops loops.
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import numpy as np
+from typing import Dict, Mapping, Optional, Sequence, Union
+
+from mhm_brake_performance_optimization import MHMBrakePerformanceOptimizer
+from mhm_brake_simulation import (
+    CAST_IRON_SPECIFIC_HEAT_J_KGK,
+    DEFAULT_SIMULATION_PARAMETERS,
+    GRAVITY_MS2,
+    rotor_mass_kg,
+    vehicle_parameter_arrays
+)
+
+DEFAULT_THERMAL_PARAMETERS = {
+    'ambient_temperature_c': 25.0,
+    'convective_coefficient_w_m2k': 60.0,   # Rotor surface heat transfer at moderate road speed
+    'rotor_cooling_area_factor': 2.0,       # Vented rotor area relative to its two friction faces
+    'fade_onset_temperature_c': 350.0,      # Pad friction holds below this rotor temperature
+    'fade_rate_per_c': 0.0012,              # Fraction of cold friction lost per °C above onset
+    'min_friction_fraction': 0.4            # Friction floor of a fully faded pad
+}
+
+# Simulation parameters the thermal model shares with the stopping-distance simulator
+_SHARED_PARAMETERS = ('front_brake_bias', 'initial_brake_temperature_c', 'rotor_thickness_m', 'rotor_solid_fraction')
+
+FADE_CURVES = ('rotor_temperature_c', 'friction_coefficient', 'deceleration_g', 'stopping_distance_m')
+
+
+def pad_friction_fade(temperature_c, pad_friction_coefficient, fade_onset_temperature_c=350.0,
+                      fade_rate_per_c=0.0012, min_friction_fraction=0.4):
+    """
+    Hot pad friction: cold friction up to the onset temperature, then a linear fall to the floor
+    """
+    excess = np.maximum(np.asarray(temperature_c, dtype=np.float64) - fade_onset_temperature_c, 0.0)
+    return pad_friction_coefficient * np.maximum(1 - fade_rate_per_c * excess, min_friction_fraction)
+
+
+class BrakeFadeResult:
+    """
+    Fade curves of a repeated-stop test, shaped (vehicles, stops); temperatures add an axle axis (front, rear)
+    
+    rotor_temperature_c is the peak rotor temperature at the end of each stop.
+    """
+    
+    __slots__ = ('vehicles', 'cold_friction_coefficient', 'rotor_temperature_c', 'friction_coefficient',
+                 'deceleration_g', 'stopping_distance_m')
+    
+    def __init__(self, vehicles: Sequence[str], cold_friction_coefficient: np.ndarray, **curves: np.ndarray):
+        self.vehicles = list(vehicles)
+        self.cold_friction_coefficient = cold_friction_coefficient
+        for name in FADE_CURVES:
+            setattr(self, name, curves[name])
+    
+    @property
+    def n_stops(self) -> int:
+        return self.friction_coefficient.shape[1]
+    
+    @property
+    def friction_fade_percent(self) -> np.ndarray:
+        """(vehicles, stops) friction lost relative to the cold pad"""
+        return (1 - self.friction_coefficient / self.cold_friction_coefficient[:, None]) * 100
+    
+    def rolling(self, curve: Union[str, np.ndarray], window: int = 10) -> np.ndarray:
+        """
+        Trailing mean of a curve over the last window stops (fewer at the start), along the stop axis
+        """
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        values = getattr(self, curve) if isinstance(curve, str) else np.asarray(curve, dtype=np.float64)
+        totals = np.cumsum(values, axis=1)
+        totals[:, window:] -= totals[:, :-window].copy()
+        counts = np.minimum(np.arange(1, values.shape[1] + 1), window)
+        return totals / counts.reshape((1, -1) + (1,) * (values.ndim - 2))
+    
+    def summary(self, window: int = 10) -> Dict[str, Dict]:
+        """Per-vehicle fade figures: peak temperature, worst friction fade and stop count to fade onset"""
+        fade = self.friction_fade_percent
+        rolling_fade = self.rolling(fade, window)
+        faded = fade > 0
+        first_fade = np.where(faded.any(axis=1), faded.argmax(axis=1) + 1, -1)
+        return {
+            vehicle: {
+                'peak_front_rotor_temperature_c': float(self.rotor_temperature_c[v, :, 0].max()),
+                'peak_rear_rotor_temperature_c': float(self.rotor_temperature_c[v, :, 1].max()),
+                'max_friction_fade_percent': float(fade[v].max()),
+                'final_rolling_friction_fade_percent': float(rolling_fade[v, -1]),
+                'first_faded_stop': int(first_fade[v]) if first_fade[v] > 0 else None,
+                'first_stopping_distance_m': float(self.stopping_distance_m[v, 0]),
+                'final_stopping_distance_m': float(self.stopping_distance_m[v, -1])
+            }
+            for v, vehicle in enumerate(self.vehicles)
+        }
+
+
+def simulate_brake_fade(test_vehicles: Mapping[str, Mapping], n_stops: int = 100,
+                        initial_speed_kmh: float = 100.0, final_speed_kmh: float = 0.0,
+                        cycle_time_s: float = 35.0, deceleration_g: float = 0.5,
+                        pad_friction_coefficient: Union[float, Sequence[float]] = 0.42,
+                        **parameters) -> BrakeFadeResult:
+    """
+    Run n_stops consecutive stops, one every cycle_time_s, for every vehicle at once
+    
+    deceleration_g is reached with cold pads; the brake input then stays fixed, so
+    deceleration falls with the faded friction. pad_friction_coefficient is one
+    value for the fleet or one per vehicle. Keyword parameters override
+    DEFAULT_THERMAL_PARAMETERS and the shared simulation parameters
+    (front_brake_bias, initial_brake_temperature_c, rotor geometry).
+    """
+    unknown = set(parameters) - set(DEFAULT_THERMAL_PARAMETERS) - set(_SHARED_PARAMETERS)
+    if unknown:
+        raise TypeError(f"Unknown thermal parameters: {', '.join(sorted(unknown))}")
+    if n_stops < 1:
+        raise ValueError(f"n_stops must be at least 1, got {n_stops}")
+    p = dict(DEFAULT_THERMAL_PARAMETERS, **{key: DEFAULT_SIMULATION_PARAMETERS[key] for key in _SHARED_PARAMETERS})
+    p.update(parameters)
+    
+    vehicles = list(test_vehicles)
+    vehicle_params = vehicle_parameter_arrays(test_vehicles, vehicles)
+    cold_friction = np.broadcast_to(np.asarray(pad_friction_coefficient, dtype=np.float64), (len(vehicles),)).copy()
+    
+    # (V, 2) front/rear axle properties; each axle has two rotors
+    diameters = np.stack([vehicle_params['front_brake_diameter_mm'], vehicle_params['rear_brake_diameter_mm']],
+                         axis=-1)
+    heat_capacity = 2 * rotor_mass_kg(diameters, p['rotor_thickness_m'], p['rotor_solid_fraction']) \
+        * CAST_IRON_SPECIFIC_HEAT_J_KGK
+    cooling_area = 2 * 2 * np.pi * (diameters / 2000) ** 2 * p['rotor_cooling_area_factor']
+    time_constant = heat_capacity / (p['convective_coefficient_w_m2k'] * cooling_area)
+    heat_share = np.array([p['front_brake_bias'], 1 - p['front_brake_bias']])
+    
+    v1, v2 = initial_speed_kmh / 3.6, final_speed_kmh / 3.6
+    temperature_rise = (0.5 * vehicle_params['mass_kg'] * (v1 ** 2 - v2 ** 2))[:, None] * heat_share / heat_capacity
+    fade = {key: p[key] for key in ('fade_onset_temperature_c', 'fade_rate_per_c', 'min_friction_fraction')}
+    
+    curves = {'rotor_temperature_c': np.empty((len(vehicles), n_stops, 2))}
+    curves.update({name: np.empty((len(vehicles), n_stops)) for name in FADE_CURVES[1:]})
+    temperature = np.full((len(vehicles), 2), float(p['initial_brake_temperature_c']))
+    for stop in range(n_stops):
+        peak = temperature + temperature_rise
+        # Friction over the stop at its mean rotor temperature, weighted by each axle's brake force
+        axle_friction = pad_friction_fade(0.5 * (temperature + peak), cold_friction[:, None], **fade)
+        friction = axle_friction @ heat_share
+        deceleration = deceleration_g * friction / cold_friction
+        stop_time = (v1 - v2) / (deceleration * GRAVITY_MS2)
+        
+        curves['rotor_temperature_c'][:, stop] = peak
+        curves['friction_coefficient'][:, stop] = friction
+        curves['deceleration_g'][:, stop] = deceleration
+        curves['stopping_distance_m'][:, stop] = (v1 ** 2 - v2 ** 2) / (2 * deceleration * GRAVITY_MS2)
+        
+        cooling_s = np.maximum(cycle_time_s - stop_time, 0.0)[:, None]
+        ambient = p['ambient_temperature_c']
+        temperature = ambient + (peak - ambient) * np.exp(-cooling_s / time_constant)
+    
+    return BrakeFadeResult(vehicles, cold_friction, **curves)
+
+
+def optimize_brake_fade(iso_data: Mapping, optimizer: Optional[MHMBrakePerformanceOptimizer] = None,
+                        n_stops: int = 100, window: int = 10, **options) -> Dict:
+    """
+    Baseline versus MHM-optimized fade test for every vehicle of a dataset
+    
+    Pads use brake_system_specs' pad_friction_coefficient unless a vehicle has its
+    own. The optimized run scales it like the component optimization and raises
+    the fade onset by its temperature stability improvement. options go to
+    simulate_brake_fade.
+    """
+    optimizer = optimizer or MHMBrakePerformanceOptimizer()
+    specs = iso_data['brake_system_specs']
+    consciousness_factor, tesla_factor = optimizer.component_factors()
+    onset = options.pop('fade_onset_temperature_c', DEFAULT_THERMAL_PARAMETERS['fade_onset_temperature_c'])
+    fleet_friction = options.pop('pad_friction_coefficient', specs['pad_friction_coefficient'])
+    friction = np.array([iso_data['test_vehicles'][vehicle].get('pad_friction_coefficient', fleet_friction)
+                         for vehicle in iso_data['test_vehicles']], dtype=np.float64)
+    
+    baseline = simulate_brake_fade(iso_data['test_vehicles'], n_stops, pad_friction_coefficient=friction,
+                                   fade_onset_temperature_c=onset, **options)
+    optimized = simulate_brake_fade(iso_data['test_vehicles'], n_stops,
+                                    pad_friction_coefficient=friction * (1 + consciousness_factor),
+                                    fade_onset_temperature_c=onset + tesla_factor * 100, **options)
+    
+    baseline_summary, optimized_summary = baseline.summary(window), optimized.summary(window)
+    results = {}
+    for vehicle in baseline.vehicles:
+        base_fade = baseline_summary[vehicle]['max_friction_fade_percent']
+        results[vehicle] = {
+            'baseline_fade': baseline_summary[vehicle],
+            'mhm_optimized_fade': optimized_summary[vehicle],
+            'fade_reduction_percent': ((base_fade - optimized_summary[vehicle]['max_friction_fade_percent'])
+                                       / base_fade * 100 if base_fade > 0 else 0.0)
+        }
+    return results
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Monte Carlo Uncertainty
+============================================================
+Stopping-distance spread over sampled vehicle, surface and pad variation
+
+SAMPLING (relative standard deviations in DEFAULT_UNCERTAINTY):
+- Vehicle mass_kg and cg_height_m from test_vehicles
+- Surface surface_mu of every store surface
+- Pad friction, which scales the system's full-pressure deceleration capability
+Draws are normal and clipped at ±3σ so no sample turns unphysical.
+
+ENGINE:
+- Samples run in fixed-size chunks, each one broadcast simulate_stopping_distance
+  call over samples × vehicles × surfaces
+- Chunks reduce to mean, squared-deviation sum and fixed-bin histograms, merged
+  pairwise, so memory is bounded by chunk_size whatever n_samples is
+- Every chunk draws from its own child of one SeedSequence, so results depend only
+  on seed and chunk_size, not on how many worker processes ran the chunks
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+from mhm_brake_performance_optimization import ISOBaselineStore, MHMBrakePerformanceOptimizer
+from mhm_brake_simulation import DEFAULT_SIMULATION_PARAMETERS, simulate_stopping_distance, vehicle_parameter_arrays
+
+DEFAULT_UNCERTAINTY = {
+    'mass_kg': 0.05,                    # Occupants, fuel and cargo
+    'cg_height_m': 0.05,                # Load placement
+    'surface_mu': 0.08,                 # Surface texture, temperature and contamination
+    'pad_friction_coefficient': 0.05    # Pad batch and bedding-in
+}
+_CLIP_SIGMA = 3.0
+
+# Histogram of distance relative to the nominal stop; samples outside land in the end bins
+_HISTOGRAM_RANGE = (0.5, 2.0)
+_HISTOGRAM_BINS = 3000
+
+
+class _MonteCarloProblem:
+    """
+    Nominal vehicles × surfaces of a store with their spreads; picklable for worker processes
+    """
+    
+    def __init__(self, store: ISOBaselineStore, uncertainty: Mapping[str, float], parameters: Mapping):
+        vehicle_params = vehicle_parameter_arrays(store.metadata['test_vehicles'], store.vehicles)
+        self.mass_kg = vehicle_params['mass_kg'][None, :, None]
+        self.wheelbase_m = vehicle_params['wheelbase_m'][None, :, None]
+        self.cg_height_m = vehicle_params['cg_height_m'][None, :, None]
+        self.surface_mu = np.array([s.surface_mu for s in store.surfaces], dtype=np.float64)[None, None, :]
+        self.speed_kmh = np.array([s.test_speed_kmh for s in store.surfaces], dtype=np.float64)[None, None, :]
+        self.uncertainty = dict(uncertainty)
+        self.parameters = dict(parameters)
+        self.nominal_m = self.simulate(1.0, 1.0, 1.0, 1.0)[0]
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.mass_kg.shape[1], self.surface_mu.shape[2]
+    
+    def simulate(self, mass_scale, cg_scale, mu_scale, pad_scale) -> np.ndarray:
+        """(samples, V, S) stopping distances for relative draws shaped (samples, 1, 1) or broadcastable"""
+        capability = self.parameters.get('max_system_deceleration_g',
+                                         DEFAULT_SIMULATION_PARAMETERS['max_system_deceleration_g'])
+        parameters = dict(self.parameters, max_system_deceleration_g=capability * np.asarray(pad_scale))
+        return simulate_stopping_distance(self.mass_kg * mass_scale, self.wheelbase_m, self.cg_height_m * cg_scale,
+                                          self.surface_mu * mu_scale, self.speed_kmh,
+                                          **parameters).stopping_distance_m
+    
+    def draw(self, rng: np.random.Generator, n: int) -> Tuple[np.ndarray, ...]:
+        """Relative scale factors (mass, cg, mu, pad) per sample; mu varies per surface, the rest per vehicle"""
+        V, S = self.shape
+        
+        def scale(name, shape):
+            noise = np.clip(rng.standard_normal(shape), -_CLIP_SIGMA, _CLIP_SIGMA)
+            return 1 + self.uncertainty[name] * noise
+        
+        return (scale('mass_kg', (n, V, 1)), scale('cg_height_m', (n, V, 1)),
+                scale('surface_mu', (n, 1, S)), scale('pad_friction_coefficient', (n, V, 1)))
+    
+    def run_chunk(self, seed: np.random.SeedSequence, n: int) -> Tuple[np.ndarray, ...]:
+        """(count, mean, squared deviations, min, max, histogram) of one chunk's distances per vehicle × surface"""
+        distances = self.simulate(*self.draw(np.random.default_rng(seed), n))
+        low, high = _HISTOGRAM_RANGE
+        bins = ((distances / self.nominal_m - low) * (_HISTOGRAM_BINS / (high - low))).astype(np.int64)
+        # One block of bins per vehicle × surface so a single bincount fills every histogram
+        offsets = np.arange(self.nominal_m.size).reshape(self.nominal_m.shape) * _HISTOGRAM_BINS
+        histogram = np.bincount((np.clip(bins, 0, _HISTOGRAM_BINS - 1) + offsets).reshape(-1),
+                                minlength=self.nominal_m.size * _HISTOGRAM_BINS)
+        mean = distances.mean(axis=0)
+        return (n, mean, np.square(distances - mean).sum(axis=0), distances.min(axis=0), distances.max(axis=0),
+                histogram.reshape(distances.shape[1:] + (_HISTOGRAM_BINS,)))
+
+
+def _run_chunk(problem: _MonteCarloProblem, seed: np.random.SeedSequence, n: int) -> Tuple[np.ndarray, ...]:
+    return problem.run_chunk(seed, n)
+
+
+class MonteCarloResult:
+    """
+    Stopping-distance distribution per vehicle × surface, summarized by moments and histograms
+    """
+    
+    __slots__ = ('vehicles', 'surfaces', 'n_samples', 'nominal_m', 'mean_m', 'std_m', 'min_m', 'max_m',
+                 'histogram', 'distance_multiplier')
+    
+    def __init__(self, vehicles, surfaces, n_samples: int, nominal_m: np.ndarray, totals: Tuple[np.ndarray, ...],
+                 distance_multiplier: float):
+        _, self.mean_m, squared_deviations, self.min_m, self.max_m, self.histogram = totals
+        self.vehicles = list(vehicles)
+        self.surfaces = list(surfaces)
+        self.n_samples = n_samples
+        self.nominal_m = nominal_m
+        self.std_m = np.sqrt(squared_deviations / (n_samples - 1))
+        self.distance_multiplier = distance_multiplier
+    
+    def mean_interval(self, confidence: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+        """Normal-approximation confidence interval for the mean stopping distance"""
+        half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * self.std_m / np.sqrt(self.n_samples)
+        return self.mean_m - half_width, self.mean_m + half_width
+    
+    def quantile(self, q: float) -> np.ndarray:
+        """Stopping-distance quantile, interpolated within histogram bins"""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"q must be within [0, 1], got {q}")
+        cumulative = np.cumsum(self.histogram, axis=-1)
+        target = q * self.n_samples
+        index = np.minimum((cumulative < target).sum(axis=-1), _HISTOGRAM_BINS - 1)
+        count = np.take_along_axis(self.histogram, index[..., None], -1)[..., 0]
+        before = np.take_along_axis(cumulative, index[..., None], -1)[..., 0] - count
+        fraction = np.where(count > 0, (target - before) / np.maximum(count, 1), 0.0)
+        low, high = _HISTOGRAM_RANGE
+        relative = low + (index + np.clip(fraction, 0.0, 1.0)) * (high - low) / _HISTOGRAM_BINS
+        return np.clip(relative * self.nominal_m, self.min_m, self.max_m)
+    
+    def prediction_interval(self, confidence: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+        """Central interval holding the given share of individual stops"""
+        return self.quantile(0.5 - confidence / 2), self.quantile(0.5 + confidence / 2)
+    
+    def summary(self, confidence: float = 0.95) -> Dict[str, Dict[str, Dict]]:
+        """
+        Per vehicle and surface: nominal, mean, spread and intervals, baseline and MHM-optimized
+        
+        The optimized figures apply the optimizer's stopping-distance multiplier to
+        every sample, which scales each statistic by the same factor.
+        """
+        mean_low, mean_high = self.mean_interval(confidence)
+        low, high = self.prediction_interval(confidence)
+        
+        def stats(v, s, k):
+            return {
+                'mean_m': float(self.mean_m[v, s] * k),
+                'std_m': float(self.std_m[v, s] * k),
+                'mean_interval_m': (float(mean_low[v, s] * k), float(mean_high[v, s] * k)),
+                'prediction_interval_m': (float(low[v, s] * k), float(high[v, s] * k))
+            }
+        
+        return {
+            vehicle: {
+                surface: {
+                    'nominal_stopping_distance_m': float(self.nominal_m[v, s]),
+                    'baseline': stats(v, s, 1.0),
+                    'mhm_optimized': stats(v, s, self.distance_multiplier)
+                }
+                for s, surface in enumerate(self.surfaces)
+            }
+            for v, vehicle in enumerate(self.vehicles)
+        }
+    
+    def to_dict(self, confidence: float = 0.95) -> Dict:
+        return {'n_samples': self.n_samples, 'confidence': confidence, 'results': self.summary(confidence)}
+
+
+def monte_carlo_stopping_distance(iso_data: Union[Mapping, ISOBaselineStore], n_samples: int = 100_000,
+                                  chunk_size: int = 10_000, seed: Optional[int] = None, workers: int = 1,
+                                  optimizer: Optional[MHMBrakePerformanceOptimizer] = None,
+                                  uncertainty: Optional[Mapping[str, float]] = None,
+                                  **parameters) -> MonteCarloResult:
+    """
+    Sample n_samples variations of every vehicle on every surface and simulate their stops
+    
+    uncertainty overrides DEFAULT_UNCERTAINTY's relative standard deviations.
+    A given seed and chunk_size always give the same result; workers > 1 runs
+    chunks in that many processes. optimizer supplies the
+    MHM-optimized distance multiplier (default settings when omitted). Keyword
+    parameters override DEFAULT_SIMULATION_PARAMETERS.
+    """
+    uncertainty = dict(DEFAULT_UNCERTAINTY, **(uncertainty or {}))
+    unknown = set(uncertainty) - set(DEFAULT_UNCERTAINTY)
+    if unknown:
+        raise ValueError(f"Unknown uncertain parameters: {', '.join(sorted(unknown))}")
+    unknown = set(parameters) - set(DEFAULT_SIMULATION_PARAMETERS)
+    if unknown:
+        raise TypeError(f"Unknown simulation parameters: {', '.join(sorted(unknown))}")
+    if n_samples < 2 or chunk_size < 1 or workers < 1:
+        raise ValueError(f"Need n_samples >= 2, chunk_size >= 1 and workers >= 1, "
+                         f"got {n_samples}, {chunk_size}, {workers}")
+    
+    store = iso_data if isinstance(iso_data, ISOBaselineStore) else ISOBaselineStore.from_iso_dict(iso_data)
+    problem = _MonteCarloProblem(store, uncertainty, parameters)
+    sizes = [chunk_size] * (n_samples // chunk_size) + ([n_samples % chunk_size] if n_samples % chunk_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(_run_chunk, [problem] * len(sizes), seeds, sizes)
+            totals = _merge_chunks(chunks)
+    else:
+        totals = _merge_chunks(problem.run_chunk(s, n) for s, n in zip(seeds, sizes))
+    
+    optimizer = optimizer or MHMBrakePerformanceOptimizer()
+    return MonteCarloResult(store.vehicles, [surface.name for surface in store.surfaces], n_samples,
+                            problem.nominal_m, totals, optimizer.stopping_distance_multiplier())
+
+
+def _merge_chunks(chunks) -> Tuple[np.ndarray, ...]:
+    """Combine chunk reductions in chunk order (Chan et al. pairwise update for mean and squared deviations)"""
+    merged = None
+    for chunk in chunks:
+        if merged is None:
+            merged = chunk
+            continue
+        n_a, mean_a, m2_a, low_a, high_a, histogram_a = merged
+        n_b, mean_b, m2_b, low_b, high_b, histogram_b = chunk
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        merged = (n, mean_a + delta * n_b / n, m2_a + m2_b + delta ** 2 * n_a * n_b / n,
+                  np.minimum(low_a, low_b), np.maximum(high_a, high_b), histogram_a + histogram_b)
+    return merged
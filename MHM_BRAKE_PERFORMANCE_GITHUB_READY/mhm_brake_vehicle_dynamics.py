@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Vehicle Dynamics Models
+============================================================
+Multi-DOF passenger vehicle models for computed split-μ braking manoeuvres
+
+PASSVEH7DOF:
+- Longitudinal, lateral and yaw body motion plus four wheel rolling DOF
+- Combined-slip tire forces with quasi-static longitudinal and lateral load transfer
+- Idealized continuous ABS slip limiting with rear select-low, proportional driver heading correction
+
+SOLVERS:
+- Many scenarios stacked into one state array and advanced together
+- Hand-written fixed-step RK4, or adaptive scipy solve_ivp with block-sparse Jacobians
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import numpy as np
+from typing import Dict, Mapping, Optional, Sequence
+
+from mhm_brake_performance_optimization import ABSScenario
+from mhm_brake_simulation import (
+    DEFAULT_SIMULATION_PARAMETERS,
+    GRAVITY_MS2,
+    tire_radius_m,
+    vehicle_parameter_arrays
+)
+
+DEFAULT_DYNAMICS_PARAMETERS = {
+    'front_static_load_fraction': DEFAULT_SIMULATION_PARAMETERS['front_static_load_fraction'],
+    'front_brake_bias': DEFAULT_SIMULATION_PARAMETERS['front_brake_bias'],
+    'pressure_rise_time_s': DEFAULT_SIMULATION_PARAMETERS['pressure_rise_time_s'],
+    'brake_demand_g': 1.2,                 # Brake torque demand as a deceleration request (full ABS stop)
+    'track_width_m': 1.55,
+    'wheel_inertia_kg_m2': 1.2,
+    'tire_radius_m': 0.31,                 # Used when a vehicle has no tire_size
+    'tire_shape_b': 10.0,
+    'tire_shape_c': 1.65,
+    'lateral_slip_scale': 0.7,             # Lateral vs longitudinal slip stiffness
+    'front_roll_stiffness_fraction': 0.55,
+    'low_speed_slip_ms': 3.0,              # Slip denominator floor near standstill
+    'wheel_lock_speed_rad_s': 1.0,         # Brake torque smoothing around ω = 0
+    'abs_target_slip': 0.12,               # Idealized ABS slip limit; 1.0 or more disables it
+    'abs_slip_band': 0.02,                 # Width of the smooth ABS torque cut-off
+    'rear_select_low': True,               # Rear wheels share the low-μ side's ABS modulation
+    'driver_heading_gain': 0.5,            # Road-wheel angle per radian of heading error
+    'driver_yaw_rate_gain_s': 0.1,         # Road-wheel angle per rad/s of yaw rate
+    'max_steer_angle_rad': 0.1,
+    'stop_speed_ms': 1.0
+}
+
+SOLVER_METHODS = ('rk4', 'RK45', 'RK23', 'DOP853', 'Radau', 'BDF')
+
+
+class PassVeh7DOF:
+    """
+    7-DOF passenger vehicle (3 body + 4 wheel rolling), stacked over scenarios
+    
+    State columns are STATE_NAMES: body-frame velocities u, v and yaw rate r, the four
+    wheel speeds in FL, FR, RL, RR order, the planar pose x, y, psi and the travelled
+    path length s, all used for outputs.
+    """
+    
+    STATE_NAMES = ('u', 'v', 'r', 'omega_fl', 'omega_fr', 'omega_rl', 'omega_rr', 'x', 'y', 'psi', 's')
+    
+    __slots__ = ('n_scenarios', 'mass', 'cg_height', 'tire_radius', 'speed_ms', 'peak_mu', 'yaw_inertia',
+                 'wheel_x', 'wheel_y', 'static_load', 'pitch_weights', 'roll_weights', 'brake_share', 'parameters')
+    
+    def __init__(self, mass_kg, wheelbase_m, cg_height_m, tire_radius, left_surface_mu, right_surface_mu,
+                 initial_speed_kmh, **parameters):
+        unknown = set(parameters) - set(DEFAULT_DYNAMICS_PARAMETERS)
+        if unknown:
+            raise TypeError(f"Unknown vehicle dynamics parameters: {', '.join(sorted(unknown))}")
+        p = dict(DEFAULT_DYNAMICS_PARAMETERS, **parameters)
+        
+        mass, wheelbase, cg_height, radius, mu_left, mu_right, speed_kmh = np.broadcast_arrays(
+            *(np.asarray(value, dtype=np.float64).reshape(-1) for value in (
+                mass_kg, wheelbase_m, cg_height_m, tire_radius, left_surface_mu, right_surface_mu,
+                initial_speed_kmh)))
+        psi = p['front_static_load_fraction']
+        front_axle = wheelbase * (1 - psi)
+        rear_axle = wheelbase * psi
+        half_track = p['track_width_m'] / 2
+        
+        self.n_scenarios = mass.size
+        self.mass = mass
+        self.cg_height = cg_height
+        self.tire_radius = radius[:, None]
+        self.speed_ms = speed_kmh / 3.6
+        self.peak_mu = np.stack([mu_left, mu_right, mu_left, mu_right], axis=1)
+        self.yaw_inertia = mass * front_axle * rear_axle
+        self.wheel_x = np.stack([front_axle, front_axle, -rear_axle, -rear_axle], axis=1)
+        self.wheel_y = np.array([half_track, -half_track, half_track, -half_track])
+        front_load = mass * GRAVITY_MS2 * psi / 2
+        rear_load = mass * GRAVITY_MS2 * (1 - psi) / 2
+        self.static_load = np.stack([front_load, front_load, rear_load, rear_load], axis=1)
+        # Per-wheel share of a positive (accelerating, leftward) load transfer
+        front_roll = p['front_roll_stiffness_fraction']
+        self.pitch_weights = np.array([-1.0, -1.0, 1.0, 1.0]) * (cg_height / wheelbase / 2)[:, None]
+        self.roll_weights = np.array([-front_roll, front_roll, front_roll - 1, 1 - front_roll]) * (
+            cg_height / p['track_width_m'])[:, None]
+        beta = p['front_brake_bias']
+        self.brake_share = np.array([beta, beta, 1 - beta, 1 - beta]) / 2
+        self.parameters = p
+    
+    def initial_state(self) -> np.ndarray:
+        """(scenarios, 11) state at brake onset: straight running with free-rolling wheels"""
+        state = np.zeros((self.n_scenarios, len(self.STATE_NAMES)))
+        state[:, 0] = self.speed_ms
+        state[:, 3:7] = self.speed_ms[:, None] / self.tire_radius
+        return state
+    
+    def _tire_forces(self, kappa, tan_alpha, normal_load):
+        """Combined-slip longitudinal and lateral forces in the wheel frame"""
+        p = self.parameters
+        lateral_slip = p['lateral_slip_scale'] * tan_alpha
+        slip = np.sqrt(kappa ** 2 + lateral_slip ** 2)
+        force = self.peak_mu * normal_load * np.sin(p['tire_shape_c'] * np.arctan(p['tire_shape_b'] * slip))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scale = np.where(slip > 1e-12, force / slip, 0.0)
+        return scale * kappa, -scale * lateral_slip
+    
+    def derivatives(self, t: float, state: np.ndarray, gate: bool = True) -> np.ndarray:
+        """
+        State derivatives for every scenario; stopped scenarios are frozen when gate is set
+        """
+        p = self.parameters
+        u, v, r = state[:, 0], state[:, 1], state[:, 2]
+        omega = state[:, 3:7]
+        heading = state[:, 9]
+        
+        steer = np.clip(-p['driver_heading_gain'] * heading - p['driver_yaw_rate_gain_s'] * r,
+                        -p['max_steer_angle_rad'], p['max_steer_angle_rad'])
+        wheel_steer = np.zeros_like(omega)
+        wheel_steer[:, :2] = steer[:, None]
+        cos_steer, sin_steer = np.cos(wheel_steer), np.sin(wheel_steer)
+        
+        # Contact-patch velocities rotated into each wheel's frame
+        patch_u = u[:, None] - r[:, None] * self.wheel_y
+        patch_v = v[:, None] + r[:, None] * self.wheel_x
+        wheel_u = patch_u * cos_steer + patch_v * sin_steer
+        wheel_v = -patch_u * sin_steer + patch_v * cos_steer
+        slip_speed = np.maximum(np.abs(wheel_u), p['low_speed_slip_ms'])
+        kappa = (omega * self.tire_radius - wheel_u) / slip_speed
+        tan_alpha = wheel_v / slip_speed
+        
+        # Two passes, forces at static load and then at the load transfer they cause,
+        # resolve the load-transfer / tire-force loop
+        normal_load = self.static_load
+        for _ in range(2):
+            fx, fy = self._tire_forces(kappa, tan_alpha, normal_load)
+            body_fx = fx * cos_steer - fy * sin_steer
+            body_fy = fx * sin_steer + fy * cos_steer
+            force_x = body_fx.sum(axis=1)
+            force_y = body_fy.sum(axis=1)
+            normal_load = np.maximum(self.static_load + force_x[:, None] * self.pitch_weights
+                                     + force_y[:, None] * self.roll_weights, 0.0)
+        ax = force_x / self.mass
+        ay = force_y / self.mass
+        
+        ramp = 1.0 if p['pressure_rise_time_s'] <= 0 else min(t / p['pressure_rise_time_s'], 1.0)
+        brake_torque = (ramp * p['brake_demand_g'] * GRAVITY_MS2 * self.mass[:, None] * self.tire_radius
+                        * self.brake_share)
+        if p['abs_target_slip'] < 1.0:
+            # Smooth torque cut-off past the slip target keeps the right-hand side differentiable
+            modulation = 1 / (1 + np.exp((-kappa - p['abs_target_slip']) / p['abs_slip_band']))
+            if p['rear_select_low']:
+                modulation[:, 2:] = modulation[:, 2:].min(axis=1, keepdims=True)
+            brake_torque = brake_torque * modulation
+        
+        derivative = np.empty_like(state)
+        derivative[:, 0] = ax + v * r
+        derivative[:, 1] = ay - u * r
+        derivative[:, 2] = (self.wheel_x * body_fy - self.wheel_y * body_fx).sum(axis=1) / self.yaw_inertia
+        derivative[:, 3:7] = (-fx * self.tire_radius
+                              - brake_torque * np.tanh(omega / p['wheel_lock_speed_rad_s'])) / p['wheel_inertia_kg_m2']
+        derivative[:, 7] = u * np.cos(heading) - v * np.sin(heading)
+        derivative[:, 8] = u * np.sin(heading) + v * np.cos(heading)
+        derivative[:, 9] = r
+        derivative[:, 10] = np.hypot(u, v)
+        if gate:
+            derivative[np.hypot(u, v) <= p['stop_speed_ms']] = 0.0
+        return derivative
+
+
+# Vehicle models by their matlab_braking_test.vehicle_variants name
+VEHICLE_MODELS = {
+    'PassVeh7DOF': PassVeh7DOF
+}
+
+
+class ManeuverResult:
+    """
+    Per-scenario outputs of a computed braking manoeuvre
+    
+    stopping_distance_m is the path length travelled, which exceeds the straight-line
+    displacement whenever the vehicle yaws.
+    """
+    
+    __slots__ = ('stopping_distance_m', 'stopping_time_s', 'max_yaw_rate_deg_s', 'lateral_displacement_m',
+                 'final_heading_deg', 'solver_steps')
+    
+    def __init__(self, stopping_distance_m: np.ndarray, stopping_time_s: np.ndarray,
+                 max_yaw_rate_deg_s: np.ndarray, lateral_displacement_m: np.ndarray,
+                 final_heading_deg: np.ndarray, solver_steps: int):
+        self.stopping_distance_m = stopping_distance_m
+        self.stopping_time_s = stopping_time_s
+        self.max_yaw_rate_deg_s = max_yaw_rate_deg_s
+        self.lateral_displacement_m = lateral_displacement_m
+        self.final_heading_deg = final_heading_deg
+        self.solver_steps = solver_steps
+    
+    def reshape(self, shape) -> 'ManeuverResult':
+        """Same outputs with the scenario axis reshaped, e.g. to (vehicles, scenarios)"""
+        return ManeuverResult(*(getattr(self, name).reshape(shape) for name in self.__slots__[:-1]),
+                              self.solver_steps)
+
+
+def _solve_rk4(model, state, dt, max_time_s, stop_speed):
+    """Fixed-step RK4 over the stacked state, tracking stops and output extremes per step"""
+    stop_time = np.full(model.n_scenarios, np.inf)
+    max_yaw = np.abs(state[:, 2])
+    max_lateral = np.abs(state[:, 8])
+    t, steps = 0.0, 0
+    while t < max_time_s and np.isinf(stop_time).any():
+        k1 = model.derivatives(t, state)
+        k2 = model.derivatives(t + dt / 2, state + dt / 2 * k1)
+        k3 = model.derivatives(t + dt / 2, state + dt / 2 * k2)
+        k4 = model.derivatives(t + dt, state + dt * k3)
+        state = state + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        t += dt
+        steps += 1
+        stop_time[np.isinf(stop_time) & (np.hypot(state[:, 0], state[:, 1]) <= stop_speed)] = t
+        np.maximum(max_yaw, np.abs(state[:, 2]), out=max_yaw)
+        np.maximum(max_lateral, np.abs(state[:, 8]), out=max_lateral)
+    return state, stop_time, max_yaw, max_lateral, steps
+
+
+def _solve_adaptive(model, state, method, rtol, atol, max_time_s, stop_speed, sample_dt):
+    """Adaptive scipy solve_ivp over the flattened stacked state"""
+    from scipy.integrate import solve_ivp
+    from scipy.sparse import block_diag
+    
+    n, width = state.shape
+    
+    def rhs(t, flat):
+        return model.derivatives(t, flat.reshape(n, width)).reshape(-1)
+    
+    def all_stopped(t, flat):
+        state = flat.reshape(n, width)
+        return np.hypot(state[:, 0], state[:, 1]).max() - stop_speed
+    all_stopped.terminal = True
+    
+    options = {}
+    if method in ('Radau', 'BDF'):
+        # Scenarios never couple, so the Jacobian is block diagonal
+        options['jac_sparsity'] = block_diag([np.ones((width, width))] * n, format='csc')
+    solution = solve_ivp(rhs, (0.0, max_time_s), state.reshape(-1), method=method, rtol=rtol, atol=atol,
+                         t_eval=np.arange(0.0, max_time_s, sample_dt), events=all_stopped, **options)
+    if solution.status < 0:
+        raise RuntimeError(f"Vehicle dynamics solver failed: {solution.message}")
+    
+    samples = solution.y.reshape(n, width, -1)
+    all_done = solution.t_events[0].size > 0
+    final = solution.y_events[0][0].reshape(n, width) if all_done else samples[:, :, -1]
+    end_time = solution.t_events[0][0] if all_done else solution.t[-1]
+    
+    # First sample at or below the stop speed; the event root only lands within tolerance
+    # of the stop speed, so every scenario still unmatched when it fires stopped last
+    stopped = np.hypot(samples[:, 0, :], samples[:, 1, :]) <= stop_speed
+    first = np.where(stopped.any(axis=1), stopped.argmax(axis=1), -1)
+    stop_time = np.where(first >= 0, solution.t[np.maximum(first, 0)], np.inf)
+    late = np.isinf(stop_time) & (all_done | (np.hypot(final[:, 0], final[:, 1]) <= stop_speed))
+    stop_time[late] = end_time
+    max_yaw = np.maximum(np.abs(samples[:, 2, :]).max(axis=1), np.abs(final[:, 2]))
+    max_lateral = np.maximum(np.abs(samples[:, 8, :]).max(axis=1), np.abs(final[:, 8]))
+    return final, stop_time, max_yaw, max_lateral, solution.nfev
+
+
+def simulate_split_mu_maneuver(mass_kg, wheelbase_m, cg_height_m, tire_radius, left_surface_mu,
+                               right_surface_mu, initial_speed_kmh, model: str = 'PassVeh7DOF',
+                               method: str = 'rk4', dt: float = 1e-3, rtol: float = 1e-6, atol: float = 1e-6,
+                               max_time_s: float = 30.0, sample_dt: float = 0.01,
+                               **parameters) -> ManeuverResult:
+    """
+    Straight-line braking on (split-)μ for a flat batch of scenarios
+    
+    Every input broadcasts to one scenario axis. method 'rk4' integrates at the fixed
+    step dt; any scipy solve_ivp method integrates adaptively to rtol/atol, sampling
+    the extremes every sample_dt. Scenarios still moving at max_time_s report inf.
+    Solver steps are RK4 steps for 'rk4' and right-hand-side evaluations otherwise.
+    """
+    if model not in VEHICLE_MODELS:
+        raise ValueError(f"Unknown vehicle model: {model} (expected one of {', '.join(VEHICLE_MODELS)})")
+    if method not in SOLVER_METHODS:
+        raise ValueError(f"Unknown solver method: {method} (expected one of {', '.join(SOLVER_METHODS)})")
+    vehicle = VEHICLE_MODELS[model](mass_kg, wheelbase_m, cg_height_m, tire_radius, left_surface_mu,
+                                    right_surface_mu, initial_speed_kmh, **parameters)
+    stop_speed = vehicle.parameters['stop_speed_ms']
+    state = vehicle.initial_state()
+    
+    if method == 'rk4':
+        final, stop_time, max_yaw, max_lateral, steps = _solve_rk4(vehicle, state, dt, max_time_s, stop_speed)
+    else:
+        final, stop_time, max_yaw, max_lateral, steps = _solve_adaptive(
+            vehicle, state, method, rtol, atol, max_time_s, stop_speed, sample_dt)
+    
+    # Close the last metre per second analytically at the deceleration reached there
+    residual_speed = np.hypot(final[:, 0], final[:, 1])
+    deceleration = np.maximum(-vehicle.derivatives(max_time_s, final, gate=False)[:, 0], 1e-6)
+    stopped = np.isfinite(stop_time)
+    distance = np.where(stopped, final[:, 10] + residual_speed ** 2 / (2 * deceleration), np.inf)
+    elapsed = np.where(stopped, stop_time + residual_speed / deceleration, np.inf)
+    return ManeuverResult(distance, elapsed, np.degrees(max_yaw), max_lateral, np.degrees(final[:, 9]), steps)
+
+
+def simulate_scenario_dynamics(test_vehicles: Mapping[str, Mapping], scenarios: Sequence[ABSScenario],
+                               vehicles: Optional[Sequence[str]] = None, **options) -> ManeuverResult:
+    """
+    Every vehicle × split-μ scenario in one stacked solve, outputs shaped (vehicles, scenarios)
+    """
+    vehicles = list(test_vehicles) if vehicles is None else list(vehicles)
+    vehicle_params = vehicle_parameter_arrays(test_vehicles, vehicles)
+    default_radius = options.get('tire_radius_m', DEFAULT_DYNAMICS_PARAMETERS['tire_radius_m'])
+    radius = np.array([tire_radius_m(test_vehicles[vehicle].get('tire_size'), default_radius)
+                       for vehicle in vehicles])
+    
+    def per_scenario(attribute):
+        return np.array([getattr(scenario, attribute) for scenario in scenarios], dtype=np.float64)[None, :]
+    
+    shape = (len(vehicles), len(scenarios))
+    inputs: Dict[str, np.ndarray] = {
+        'mass_kg': vehicle_params['mass_kg'][:, None],
+        'wheelbase_m': vehicle_params['wheelbase_m'][:, None],
+        'cg_height_m': vehicle_params['cg_height_m'][:, None],
+        'tire_radius': radius[:, None],
+        'left_surface_mu': per_scenario('left_surface_mu'),
+        'right_surface_mu': per_scenario('right_surface_mu'),
+        'initial_speed_kmh': per_scenario('initial_speed_kmh')
+    }
+    flat = {name: np.broadcast_to(value, shape).reshape(-1) for name, value in inputs.items()}
+    return simulate_split_mu_maneuver(**flat, **options).reshape(shape)
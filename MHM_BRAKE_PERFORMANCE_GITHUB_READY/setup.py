@@ -63,6 +63,9 @@ EXTRAS_REQUIRE = {
         'plotly>=5.0.0',
         'bokeh>=2.4.0',
     ],
+    'columnar': [
+        'pyarrow>=8.0.0',
+    ],
     'real_time': [
         'python-can>=4.0.0',
         'cantools>=36.0.0',
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Benchmark Suite Tests
+==========================================================
+Smoke tests for the benchmark runner and regression comparison
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import json
+import time
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_mhm_brake_performance import _measure, compare_benchmarks, run_benchmarks, synthetic_fleet_store
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test suite for the optimizer benchmark runner"""
+    
+    def test_report_layout(self):
+        """Test every stage is reported per fleet size in a JSON-serializable report"""
+        print("\n🔍 Testing Benchmark Report...")
+        
+        report = run_benchmarks([3, 50], repeat=1)
+        
+        self.assertEqual(len(report['results']), 2 * 7)
+        for result in report['results']:
+            self.assertGreater(result['seconds'], 0)
+            self.assertGreaterEqual(result['peak_memory_bytes'], 0)
+        self.assertEqual(json.loads(json.dumps(report))['format'], 1)
+        print(f"  ✅ {len(report['results'])} stage timings recorded")
+    
+    def test_regression_comparison(self):
+        """Test slowdowns beyond the tolerance are reported"""
+        baseline = {'results': [{'stage': 'load', 'fleet_size': 3, 'seconds': 1.0},
+                                {'stage': 'fold', 'fleet_size': 3, 'seconds': 1.0}]}
+        current = {'results': [{'stage': 'load', 'fleet_size': 3, 'seconds': 1.1},
+                               {'stage': 'fold', 'fleet_size': 3, 'seconds': 2.0},
+                               {'stage': 'fold', 'fleet_size': 1000, 'seconds': 9.0}]}
+        
+        regressions = compare_benchmarks(current, baseline, tolerance=0.25)
+        
+        self.assertEqual([(r['stage'], r['fleet_size']) for r in regressions], [('fold', 3)])
+        self.assertAlmostEqual(regressions[0]['slowdown'], 2.0)
+    
+    def test_warm_up_is_not_timed(self):
+        """Test a slow first call (e.g. JIT compilation) is excluded from the timing"""
+        calls = []
+        
+        def stage():
+            if not calls:
+                time.sleep(0.2)
+            calls.append(None)
+        
+        measurement = _measure(stage, repeat=1)
+        
+        self.assertLess(measurement['seconds'], 0.1)
+        self.assertEqual(len(calls), 3)
+    
+    def test_synthetic_fleet(self):
+        """Test synthetic fleets cycle the built-in vehicle classes"""
+        store = synthetic_fleet_store(7)
+        
+        self.assertEqual(store.performance.shape, (7, 2, 4))
+        self.assertEqual(store.vehicles[4], 'midsize_sedan_000004')
+        self.assertEqual(len(store.metadata['test_vehicles']), 7)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Component Design Search Test Suite
+=======================================================================
+Tests for the constrained differential-evolution search over brake component settings
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import MHMBrakePerformanceOptimizer, get_builtin_iso_store, get_iso_brake_data
+from mhm_brake_component_search import (
+    COMPONENT_VARIABLES,
+    DEFAULT_BOOSTER_RATIO_BAR_PER_N,
+    DEFAULT_COMPONENT_BOUNDS,
+    _ComponentProblem,
+    search_component_settings
+)
+from mhm_brake_simulation import simulate_stopping_distance
+
+
+class TestComponentSearch(unittest.TestCase):
+    """Test suite for the simulator-driven component design search"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.store = get_builtin_iso_store()
+        self.specs = self.store.metadata['brake_system_specs']
+    
+    def test_population_matches_single_simulations(self):
+        """Test a batched population evaluates the same as simulating each candidate alone"""
+        print("\n🔍 Testing Component Design Search...")
+        problem = _ComponentProblem(self.store, self.specs)
+        population = np.array([[120.0, 0.42, 50.0, 0.70], [160.0, 0.50, 150.0, 0.62]])
+        values = problem.evaluate(population)
+        self.assertEqual(values.shape, (2, 3))
+        
+        test_vehicles = self.store.metadata['test_vehicles']
+        for candidate, row in zip(population, values):
+            inputs = {name: float(value[0, 0, 0]) for name, value in problem.simulation_inputs(candidate[None]).items()}
+            distances = [simulate_stopping_distance(test_vehicles[vehicle]['mass_kg'],
+                                                    test_vehicles[vehicle]['wheelbase_m'],
+                                                    test_vehicles[vehicle]['cg_height_m'],
+                                                    surface.surface_mu, surface.test_speed_kmh,
+                                                    **inputs).stopping_distance_m
+                         for vehicle in self.store.vehicles for surface in self.store.surfaces]
+            self.assertAlmostEqual(row[0], np.mean(distances))
+        
+        # The reference design reproduces the simulator defaults
+        reference = problem.simulation_inputs(np.array([[120.0, 0.42, 50.0, 0.70]]))
+        self.assertAlmostEqual(float(reference['max_system_deceleration_g'][0, 0, 0]), 1.2)
+        self.assertAlmostEqual(float(reference['abs_efficiency'][0, 0, 0]), 0.9)
+    
+    def test_search_beats_reference_within_constraints(self):
+        """Test the search shortens stops, respects its limits and is reproducible across workers"""
+        result = search_component_settings(self.store, seed=3, max_generations=30, population_size=8)
+        self.assertTrue(result.feasible)
+        self.assertLess(result.stopping_distance_m, result.reference_stopping_distance_m)
+        self.assertGreater(result.distance_reduction_percent, 0.0)
+        self.assertEqual(result.constraint_limits['brake_temperature_c'], 210.0)
+        for name in COMPONENT_VARIABLES:
+            low, high = DEFAULT_COMPONENT_BOUNDS[name]
+            self.assertTrue(low <= result.settings[name] <= high)
+        
+        # A tight temperature limit stays satisfied, at some cost in distance
+        limited = search_component_settings(self.store, max_brake_temperature_c=165.0, seed=3,
+                                            max_generations=30, population_size=8)
+        self.assertTrue(limited.feasible)
+        self.assertLessEqual(limited.constraints['brake_temperature_c'], 165.0 + 1e-6)
+        self.assertGreaterEqual(limited.stopping_distance_m, result.stopping_distance_m - 1e-6)
+        
+        parallel = search_component_settings(self.store, seed=3, max_generations=30, population_size=8, workers=2)
+        self.assertEqual(parallel.settings, result.settings)
+        print(f"  ✅ {result}: {result.distance_reduction_percent:.1f}% shorter")
+    
+    def test_pedal_force_limit_binds(self):
+        """Test the pedal-force limit caps line pressure inside its bounds, and relaxing it helps"""
+        result = search_component_settings(self.store, seed=3, max_generations=30, population_size=8)
+        pressure_cap = 500.0 * DEFAULT_BOOSTER_RATIO_BAR_PER_N
+        self.assertAlmostEqual(result.constraints['pedal_force_n'], 500.0, delta=5.0)
+        self.assertAlmostEqual(result.settings['hydraulic_pressure_bar'], pressure_cap, delta=0.01 * pressure_cap)
+        low, high = DEFAULT_COMPONENT_BOUNDS['hydraulic_pressure_bar']
+        self.assertTrue(low < result.settings['hydraulic_pressure_bar'] < high)
+        
+        relaxed = search_component_settings(self.store, max_pedal_force_n=700.0, seed=3, max_generations=30,
+                                            population_size=8)
+        self.assertGreater(relaxed.settings['hydraulic_pressure_bar'], result.settings['hydraulic_pressure_bar'] + 20)
+        self.assertLess(relaxed.stopping_distance_m, result.stopping_distance_m)
+        
+        # A stronger booster reaches the same pressure with less pedal force
+        problem = _ComponentProblem(self.store, self.specs, booster_ratio_bar_per_n=0.5)
+        self.assertAlmostEqual(problem.evaluate([120.0, 0.42, 50.0, 0.70])[0, 1], 240.0)
+        print(f"  ✅ Pedal force {result.constraints['pedal_force_n']:.0f} N caps pressure at "
+              f"{result.settings['hydraulic_pressure_bar']:.0f} bar")
+    
+    def test_optimizer_integration_and_bad_arguments(self):
+        """Test the optimizer adds the search on request and bad arguments are rejected"""
+        optimizer = MHMBrakePerformanceOptimizer()
+        legacy = optimizer.optimize_brake_system_components(get_iso_brake_data())
+        searched = optimizer.optimize_brake_system_components(get_iso_brake_data(), search=True, seed=1,
+                                                              max_generations=5, population_size=5)
+        self.assertNotIn('design_search', legacy)
+        self.assertEqual({key: searched[key] for key in legacy}, legacy)
+        self.assertEqual(set(searched['design_search']['settings']), set(COMPONENT_VARIABLES))
+        
+        with self.assertRaises(ValueError):
+            search_component_settings(self.store, bounds={'rotor_color': (0, 1)})
+        with self.assertRaises(ValueError):
+            search_component_settings(self.store, workers=0)
+        with self.assertRaises(ValueError):
+            search_component_settings(self.store, booster_ratio_bar_per_n=0.0)
+        with self.assertRaises(TypeError):
+            search_component_settings(self.store, rotor_color='grey')
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
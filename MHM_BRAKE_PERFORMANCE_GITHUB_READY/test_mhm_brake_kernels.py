@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Kernel Test Suite
+======================================================
+Tests that the optional numba kernels match the NumPy fallbacks exactly
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import mhm_brake_kernels
+from mhm_brake_kernels import (
+    NUMBA_AVAILABLE,
+    fold_metrics_numpy,
+    integrate_stops_numpy
+)
+from mhm_brake_performance_optimization import BRAKE_IMPROVEMENT_SIGN, MHMBrakePerformanceOptimizer
+
+
+class TestKernelBackends(unittest.TestCase):
+    """Test suite for backend selection and the NumPy kernels"""
+    
+    def test_backend_selection(self):
+        """Test the compiled kernels are used exactly when numba is available"""
+        print(f"\n🔍 Testing Kernel Backend ({mhm_brake_kernels.KERNEL_BACKEND})...")
+        
+        expected = 'numba' if mhm_brake_kernels.USE_NUMBA else 'numpy'
+        self.assertEqual(mhm_brake_kernels.KERNEL_BACKEND, expected)
+        self.assertTrue(NUMBA_AVAILABLE or not mhm_brake_kernels.USE_NUMBA)
+        self.assertIs(mhm_brake_kernels.fold_metrics, getattr(mhm_brake_kernels, f'fold_metrics_{expected}'))
+        self.assertIs(mhm_brake_kernels.integrate_stops, getattr(mhm_brake_kernels, f'integrate_stops_{expected}'))
+    
+    def test_numpy_stop_kernel(self):
+        """Test the NumPy stop kernel closes a constant-deceleration stop exactly"""
+        v0 = np.array([0.0, 20.0])
+        distance, elapsed, peak = integrate_stops_numpy(
+            v0, np.full(2, 20.0), np.full(2, 8.0), np.zeros(2), np.zeros(2), np.zeros(2), 5e-3, 10000)
+        
+        np.testing.assert_allclose(distance, [0.0, 25.0])
+        np.testing.assert_allclose(elapsed, [0.0, 2.5])
+        np.testing.assert_allclose(peak, [0.0, 8.0])
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+class TestNumbaKernels(unittest.TestCase):
+    """Test suite comparing the numba kernels with the NumPy fallbacks"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.rng = np.random.default_rng(7)
+    
+    def test_fold_metrics_identical(self):
+        """Test the fused fold loop reproduces the broadcasted NumPy fold bit for bit"""
+        baseline = self.rng.uniform(0.5, 500.0, (40, 3, 4))
+        multipliers = np.array([[MHMBrakePerformanceOptimizer(level, proven_improvement=improvement).brake_multipliers()
+                                 for improvement in np.linspace(10.0, 30.0, 6)]
+                                for level in np.linspace(0.5, 1.0, 5)])[:, :, None, None, :]
+        
+        expected = fold_metrics_numpy(baseline, multipliers, BRAKE_IMPROVEMENT_SIGN)
+        actual = mhm_brake_kernels.fold_metrics_numba(baseline, multipliers, BRAKE_IMPROVEMENT_SIGN)
+        
+        for want, got in zip(expected, actual):
+            self.assertEqual(got.shape, (5, 6, 40, 3, 4))
+            np.testing.assert_array_equal(got, want)
+    
+    def test_integrate_stops_identical(self):
+        """Test the scalar stop loop reproduces the compacting NumPy loop bit for bit"""
+        n = 500
+        v0 = self.rng.uniform(0.0, 45.0, n)
+        v0[:3] = 0.0
+        inputs = (v0, self.rng.uniform(5.0, 12.0, n), self.rng.uniform(0.5, 9.0, n),
+                  self.rng.choice([0.0, 0.15, 0.3], n), self.rng.uniform(0.0, 3e-4, n), self.rng.uniform(0.0, 0.2, n))
+        
+        # The short horizon leaves some vehicles still moving
+        for max_steps in (20000, 300):
+            expected = integrate_stops_numpy(*inputs, 5e-3, max_steps)
+            actual = mhm_brake_kernels.integrate_stops_numba(*inputs, 5e-3, max_steps)
+            for want, got in zip(expected, actual):
+                np.testing.assert_array_equal(got, want)
+        self.assertTrue(np.isinf(expected[0]).any())
+    
+    def test_optimizer_results_unchanged(self):
+        """Test the optimizer output is identical on either backend"""
+        optimizer = MHMBrakePerformanceOptimizer()
+        table = self.rng.uniform(1.0, 100.0, (1000, 4))
+        
+        result = optimizer.apply_tesla_folding_batch(dry_asphalt=table).dry_asphalt
+        expected = fold_metrics_numpy(table, optimizer.brake_multipliers(), BRAKE_IMPROVEMENT_SIGN)
+        
+        np.testing.assert_array_equal(result.optimized, expected[0])
+        np.testing.assert_array_equal(result.improvements, expected[1])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
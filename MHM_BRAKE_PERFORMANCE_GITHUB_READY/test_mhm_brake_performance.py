@@ -16,16 +16,44 @@ Contact: holdatllc2@gmail.com
 """
 
 import unittest
+import unittest.mock
 import sys
 import os
 import json
+import copy
+import pickle
+import csv
+import tempfile
+import io
+import logging
+import contextlib
 import numpy as np
 
 # Add the package to path for testing
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from mhm_brake_performance_optimization import MHMBrakePerformanceOptimizer
+    from mhm_brake_performance_optimization import (
+        MHMBrakePerformanceOptimizer,
+        BRAKE_BASELINE_DTYPE,
+        ABS_BASELINE_DTYPE,
+        BRAKE_METRICS,
+        ISOBaselineStore,
+        ISODataView,
+        ConditionFoldingResult,
+        SurfaceCondition,
+        get_builtin_iso_store,
+        get_iso_brake_data,
+        get_iso_store,
+        invalidate_iso_data_cache,
+        reload_iso_brake_data,
+        compile_baseline_catalog,
+        open_baseline_catalog,
+        run_brake_optimization_batch,
+        json_default,
+        folded_conditions,
+        _freeze
+    )
 except ImportError as e:
     print(f"❌ Import Error: {e}")
     print("Make sure mhm_brake_performance_optimization.py is in the same directory")
@@ -259,13 +287,633 @@ class TestMHMBrakePerformance(unittest.TestCase):
         self.assertGreater(file_size, 1000)  # At least 1KB of data
         print(f"  ✅ Results File Size: {file_size} bytes")
 
+class TestFleetBatchOptimization(unittest.TestCase):
+    """Test suite for the vectorized fleet-scale Tesla Folding engine"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.optimizer = MHMBrakePerformanceOptimizer()
+        self.iso_data = self.optimizer.load_real_iso_brake_data()
+    
+    def test_batch_matches_dict_results(self):
+        """Test batched results reproduce the per-vehicle dict results exactly"""
+        print("\n🔍 Testing Batch vs Dict Optimization...")
+        
+        dict_results = self.optimizer.apply_tesla_folding_to_brake_performance(self.iso_data)
+        
+        vehicles = ['compact_car', 'midsize_sedan', 'suv']
+        dry = self.iso_data['baseline_performance']['dry_asphalt_100_0']
+        split_mu = self.iso_data['abs_performance']['split_mu_braking']
+        dry_records = np.array([tuple(dry[v][f] for f in BRAKE_BASELINE_DTYPE.names) for v in vehicles],
+                               dtype=BRAKE_BASELINE_DTYPE)
+        abs_records = np.array([tuple(split_mu[v][f] for f in ABS_BASELINE_DTYPE.names) for v in vehicles],
+                               dtype=ABS_BASELINE_DTYPE)
+        
+        batch = self.optimizer.apply_tesla_folding_batch(dry_records, abs_records, vehicles=vehicles)
+        
+        batch_results = batch.to_dict()
+        self.assertEqual(batch_results, {key: dict_results[key] for key in batch_results})
+        print(f"  ✅ Batch dict view identical for {len(vehicles)} vehicles")
+    
+    def test_fleet_scale_batch(self):
+        """Test a large synthetic fleet is processed as arrays"""
+        print("\n🔍 Testing Fleet-Scale Batch...")
+        
+        rng = np.random.default_rng(0)
+        n_vehicles = 20000
+        dry = {
+            'stopping_distance_m': rng.uniform(35, 50, n_vehicles),
+            'deceleration_g': rng.uniform(0.7, 0.95, n_vehicles),
+            'pedal_force_n': rng.uniform(400, 550, n_vehicles),
+            'brake_temperature_c': rng.uniform(150, 250, n_vehicles)
+        }
+        
+        batch = self.optimizer.apply_tesla_folding_batch(dry_asphalt=dry)
+        
+        self.assertIsNone(batch.abs_split_mu)
+        self.assertEqual(batch.dry_asphalt.optimized.shape, (n_vehicles, 4))
+        distance = batch.dry_asphalt.metric('stopping_distance_m')
+        np.testing.assert_allclose(distance, dry['stopping_distance_m'] * (1 - 0.234 * 0.3))
+        reduction = batch.dry_asphalt.metric('distance_reduction_percent', 'improvements')
+        np.testing.assert_allclose(reduction, 7.02)
+        print(f"  ✅ {n_vehicles} vehicles optimized in one pass")
+    
+    def test_batch_rejects_missing_fields(self):
+        """Test structured input must provide every baseline metric"""
+        with self.assertRaises(KeyError):
+            self.optimizer.apply_tesla_folding_batch(dry_asphalt={'stopping_distance_m': [40.0]})
+        with self.assertRaises(ValueError):
+            self.optimizer.apply_tesla_folding_batch(abs_split_mu=np.ones((2, 3)))
+
+class TestISOBaselineStore(unittest.TestCase):
+    """Test suite for the columnar ISO baseline store"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.store = get_builtin_iso_store()
+    
+    def test_store_shape_and_lookup(self):
+        """Test vehicle × surface × metric layout and index lookup"""
+        print("\n🔍 Testing Columnar Store Layout...")
+        
+        self.assertIs(self.store, get_builtin_iso_store())
+        self.assertEqual(self.store.vehicles, ('compact_car', 'midsize_sedan', 'suv'))
+        self.assertEqual(self.store.performance.shape, (3, 2, len(BRAKE_METRICS)))
+        self.assertEqual(self.store.abs_performance.shape, (3, 1, 4))
+        
+        wet = self.store.surface('wet_asphalt_100_0')
+        self.assertEqual(wet.surface_mu, 0.45)
+        self.assertEqual(wet.test_speed_kmh, 100)
+        self.assertFalse(hasattr(wet, '__dict__'))
+        
+        row = self.store.baseline('suv', 'wet_asphalt_100_0')
+        self.assertEqual(row[BRAKE_METRICS.index('stopping_distance_m')], 82.9)
+        self.assertEqual(self.store.abs_baseline('midsize_sedan', 'split_mu_braking')[1], 7.8)
+        print(f"  ✅ {len(self.store.vehicles)} vehicles × {len(self.store.surfaces)} surfaces")
+    
+    def test_legacy_dict_round_trip(self):
+        """Test the legacy dict view round-trips through the store"""
+        legacy = self.store.to_legacy_dict()
+        
+        self.assertEqual(legacy['baseline_performance']['dry_asphalt_100_0']['compact_car']['pedal_force_n'], 445)
+        self.assertEqual(ISOBaselineStore.from_iso_dict(legacy).to_legacy_dict(), legacy)
+    
+    def test_missing_vehicle_rows(self):
+        """Test vehicles absent from a condition are NaN and left out of the dict view"""
+        legacy = self.store.to_legacy_dict()
+        del legacy['baseline_performance']['wet_asphalt_100_0']['suv']
+        store = ISOBaselineStore.from_iso_dict(legacy)
+        
+        self.assertTrue(np.isnan(store.baseline('suv', 'wet_asphalt_100_0')).all())
+        vehicles, table = store.surface_table('wet_asphalt_100_0')
+        self.assertEqual(vehicles, ['compact_car', 'midsize_sedan'])
+        self.assertEqual(table.shape, (2, len(BRAKE_METRICS)))
+        self.assertNotIn('suv', store.to_legacy_dict()['baseline_performance']['wet_asphalt_100_0'])
+
+
+class TestConditionFolding(unittest.TestCase):
+    """Test suite for the generic every-condition Tesla Folding engine"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.optimizer = MHMBrakePerformanceOptimizer()
+        self.store = get_builtin_iso_store()
+    
+    def test_every_condition_is_optimized(self):
+        """Test wet asphalt is optimized alongside the legacy dry and split-μ sections"""
+        print("\n🔍 Testing Condition Folding...")
+        
+        results = self.optimizer.apply_tesla_folding_to_brake_performance(self.store)
+        
+        # Legacy sections are not repeated in the per-condition maps
+        self.assertEqual(list(results['surface_optimization']), ['wet_asphalt_100_0'])
+        self.assertEqual(results['abs_scenario_optimization'], {})
+        conditions = folded_conditions(results)
+        self.assertEqual(list(conditions['braking']), ['dry_asphalt_100_0', 'wet_asphalt_100_0'])
+        self.assertEqual(list(conditions['abs']), ['split_mu_braking'])
+        self.assertIs(conditions['braking']['dry_asphalt_100_0'], results['dry_asphalt_optimization'])
+        
+        wet_suv = results['surface_optimization']['wet_asphalt_100_0']['suv']
+        self.assertEqual(wet_suv['baseline_performance']['stopping_distance_m'], 82.9)
+        self.assertAlmostEqual(wet_suv['mhm_optimized_performance']['stopping_distance_m'], 82.9 * (1 - 0.234 * 0.3))
+        self.assertAlmostEqual(wet_suv['improvements']['distance_reduction_percent'], 7.02)
+        print(f"  ✅ {len(conditions['braking'])} surfaces optimized")
+    
+    def test_user_supplied_surfaces(self):
+        """Test added snow and ice conditions fold in the same pass as the ISO surfaces"""
+        snow = np.array([[[60.0, 0.3, 400.0, 90.0]]]).repeat(3, axis=0)
+        ice = np.full((3, 1, len(BRAKE_METRICS)), np.nan)
+        ice[0] = [[140.0, 0.1, 300.0, 60.0]]
+        store = self.store.with_surfaces([SurfaceCondition('snow_50_0', 0.3, 50),
+                                          SurfaceCondition('ice_50_0', 0.1, 50)],
+                                         np.concatenate([snow, ice], axis=1))
+        
+        folded = self.optimizer.apply_tesla_folding_to_conditions(store)
+        
+        self.assertEqual(folded.braking[1].shape, (3, 4, len(BRAKE_METRICS)))
+        self.assertEqual(folded.surface('ice_50_0').vehicles, ['compact_car'])
+        np.testing.assert_allclose(folded.surface('snow_50_0').metric('distance_reduction_percent', 'improvements'),
+                                   7.02)
+        np.testing.assert_array_equal(folded.surface('wet_asphalt_100_0').optimized,
+                                      self.optimizer.apply_tesla_folding_batch(
+                                          store.surface_table('wet_asphalt_100_0')[1]).dry_asphalt.optimized)
+        
+        selected = self.optimizer.apply_tesla_folding_to_conditions(store, surfaces=['ice_50_0'], abs_scenarios=[])
+        self.assertEqual(list(selected.to_dict()['surface_optimization']), ['ice_50_0'])
+        self.assertNotIn('dry_asphalt_optimization', selected.to_dict())
+        
+        with self.assertRaises(ValueError):
+            store.with_surfaces([SurfaceCondition('snow_50_0', 0.3, 50)], snow)
+        with self.assertRaises(ValueError):
+            self.store.with_surfaces([SurfaceCondition('gravel_60_0', 0.6, 60)], snow[:2])
+
+class TestLazyResults(unittest.TestCase):
+    """Test suite for lazy array-backed result views"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.optimizer = MHMBrakePerformanceOptimizer()
+        self.store = get_builtin_iso_store()
+    
+    def test_lazy_results_read_like_dicts(self):
+        """Test lazy results match the nested dicts field for field"""
+        print("\n🔍 Testing Lazy Result Views...")
+        
+        lazy = self.optimizer.apply_tesla_folding_to_brake_performance(self.store, lazy=True)
+        eager = self.optimizer.apply_tesla_folding_to_brake_performance(self.store)
+        
+        self.assertEqual(list(lazy), list(eager))
+        self.assertEqual(lazy, eager)
+        self.assertEqual(lazy.to_dict(), eager)
+        
+        suv = lazy['surface_optimization']['wet_asphalt_100_0']['suv']
+        self.assertEqual(list(suv), ['baseline_performance', 'mhm_optimized_performance', 'improvements'])
+        self.assertEqual(suv['baseline_performance']['stopping_distance_m'], 82.9)
+        self.assertIsInstance(suv.improvements['distance_reduction_percent'], float)
+        self.assertEqual(suv.to_dict(), eager['surface_optimization']['wet_asphalt_100_0']['suv'])
+        self.assertEqual([vehicle for vehicle, _ in lazy['abs_optimization'].items()],
+                         list(eager['abs_optimization']))
+        print(f"  ✅ Lazy views equal {len(eager['surface_optimization'])} surface dicts")
+    
+    def test_views_are_slotted_and_strict(self):
+        """Test views carry no per-instance dict and reject unknown keys"""
+        dry = self.optimizer.apply_tesla_folding_to_brake_performance(self.store, lazy=True)['dry_asphalt_optimization']
+        
+        for view in (dry, dry['suv'], dry['suv'].optimized):
+            self.assertFalse(hasattr(view, '__dict__'))
+        with self.assertRaises(KeyError):
+            dry['bus']
+        with self.assertRaises(KeyError):
+            dry['suv']['baseline_abs_performance']
+        with self.assertRaises(KeyError):
+            dry['suv'].improvements['yaw_stability_improvement_percent']
+        self.assertIn('suv', dry)
+        
+        results = self.optimizer.run_complete_brake_optimization(lazy=True)
+        self.assertIsInstance(results['brake_performance_optimization'], ConditionFoldingResult)
+        self.assertEqual(results['brake_performance_optimization'],
+                         self.optimizer.run_complete_brake_optimization()['brake_performance_optimization'])
+
+
+class TestIncrementalRecomputation(unittest.TestCase):
+    """Test suite for content-hash based incremental recomputation"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(invalidate_iso_data_cache)
+        self.path = os.path.join(self.tmp.name, 'lab_baseline.json')
+        self.iso_data = copy.deepcopy(get_iso_brake_data())
+        self.write_baseline(1)
+    
+    def write_baseline(self, revision):
+        with open(self.path, 'w') as f:
+            json.dump(self.iso_data, f)
+        # Distinct timestamps so every rewrite is seen as a new source version
+        os.utime(self.path, ns=(revision * 10**9, revision * 10**9))
+    
+    def test_only_changed_vehicle_is_recomputed(self):
+        """Test one updated vehicle reruns only its own condition"""
+        print("\n🔍 Testing Incremental Recomputation...")
+        optimizer = MHMBrakePerformanceOptimizer()
+        
+        first = optimizer.run_complete_brake_optimization(self.path, incremental=True)
+        self.assertEqual(first['recomputation']['recomputed_count'], 3 * 2 + 3)
+        self.assertEqual(first['recomputation']['reused_count'], 0)
+        self.assertTrue(first['recomputation']['components_recomputed'])
+        
+        unchanged = optimizer.run_complete_brake_optimization(self.path, incremental=True)
+        self.assertEqual(unchanged['recomputation']['recomputed'], [])
+        self.assertEqual(unchanged['recomputation']['reused_count'], 9)
+        self.assertFalse(unchanged['recomputation']['components_recomputed'])
+        
+        self.iso_data['baseline_performance']['dry_asphalt_100_0']['suv']['stopping_distance_m'] = 40.1
+        self.write_baseline(2)
+        updated = optimizer.run_complete_brake_optimization(self.path, incremental=True)
+        
+        self.assertEqual(updated['recomputation']['recomputed'], [['braking', 'dry_asphalt_100_0', 'suv']])
+        self.assertEqual(updated['recomputation']['reused_count'], 8)
+        full = MHMBrakePerformanceOptimizer().run_complete_brake_optimization(self.path)
+        self.assertEqual(updated['brake_performance_optimization'], full['brake_performance_optimization'])
+        self.assertEqual(updated['component_optimization'], full['component_optimization'])
+        print(f"  ✅ Recomputed {updated['recomputation']['recomputed']}, reused 8")
+    
+    def test_parameter_and_layout_changes(self):
+        """Test parameter changes recompute everything and removed vehicles are dropped"""
+        optimizer = MHMBrakePerformanceOptimizer()
+        store = get_builtin_iso_store()
+        optimizer.apply_tesla_folding_incremental(store)
+        
+        optimizer.consciousness_level = 0.9
+        folded, report = optimizer.apply_tesla_folding_incremental(store)
+        self.assertEqual(len(report.recomputed), 9)
+        self.assertEqual(folded.to_dict(), optimizer.apply_tesla_folding_to_brake_performance(store))
+        
+        del self.iso_data['test_vehicles']['compact_car']
+        for section in ('dry_asphalt_100_0', 'wet_asphalt_100_0'):
+            del self.iso_data['baseline_performance'][section]['compact_car']
+        del self.iso_data['abs_performance']['split_mu_braking']['compact_car']
+        folded, report = optimizer.apply_tesla_folding_incremental(self.iso_data)
+        
+        self.assertEqual(report.recomputed, [])
+        self.assertEqual(report.reused, 6)
+        self.assertEqual(sorted(report.dropped), [('abs_split_mu', 'split_mu_braking', 'compact_car'),
+                                                  ('braking', 'dry_asphalt_100_0', 'compact_car'),
+                                                  ('braking', 'wet_asphalt_100_0', 'compact_car')])
+        self.assertNotIn('compact_car', folded.to_dict()['dry_asphalt_optimization'])
+    
+    def test_added_condition_and_reordered_vehicles(self):
+        """Test a new condition is folded alone when the vehicle order also changes"""
+        optimizer = MHMBrakePerformanceOptimizer()
+        optimizer.apply_tesla_folding_incremental(self.iso_data)
+        
+        vehicles = list(reversed(self.iso_data['test_vehicles']))
+        dry = self.iso_data['baseline_performance']['dry_asphalt_100_0']
+        ice = {'surface_mu': 0.1, 'test_speed_kmh': 50.0}
+        for vehicle in vehicles:
+            ice[vehicle] = dict(dry[vehicle], stopping_distance_m=dry[vehicle]['stopping_distance_m'] * 4)
+        self.iso_data['baseline_performance']['ice_50_0'] = ice
+        self.iso_data['test_vehicles'] = {vehicle: self.iso_data['test_vehicles'][vehicle] for vehicle in vehicles}
+        store = ISOBaselineStore.from_iso_dict(self.iso_data)
+        self.assertEqual(list(store.vehicles), vehicles)
+        folded, report = optimizer.apply_tesla_folding_incremental(store)
+        
+        self.assertEqual(sorted(report.recomputed), [('braking', 'ice_50_0', vehicle)
+                                                     for vehicle in ('compact_car', 'midsize_sedan', 'suv')])
+        self.assertEqual((report.reused, report.dropped), (9, []))
+        self.assertEqual(folded.to_dict(), optimizer.apply_tesla_folding_to_brake_performance(store))
+
+
+class TestISODataCache(unittest.TestCase):
+    """Test suite for the process-wide ISO dataset cache"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.optimizer = MHMBrakePerformanceOptimizer()
+    
+    def test_dataset_is_shared(self):
+        """Test repeated loads return the same cached dataset"""
+        print("\n🔍 Testing ISO Data Cache...")
+        
+        first = self.optimizer.load_real_iso_brake_data()
+        second = MHMBrakePerformanceOptimizer().load_real_iso_brake_data()
+        
+        self.assertIs(first, second)
+        self.assertIs(first, get_iso_brake_data())
+        print(f"  ✅ Dataset shared across optimizers")
+    
+    def test_dataset_is_read_only(self):
+        """Test cached data cannot be modified in place"""
+        iso_data = self.optimizer.load_real_iso_brake_data()
+        dry = iso_data['baseline_performance']['dry_asphalt_100_0']
+        
+        with self.assertRaises(TypeError):
+            dry['compact_car']['stopping_distance_m'] = 0.0
+        with self.assertRaises(TypeError):
+            del iso_data['test_vehicles']
+        self.assertIsInstance(iso_data['matlab_braking_test']['test_types'], tuple)
+        with self.assertRaises(ValueError):
+            get_builtin_iso_store().performance[0, 0, 0] = 0.0
+        
+        editable = copy.deepcopy(iso_data)
+        editable['test_vehicles']['compact_car']['mass_kg'] = 1500
+        self.assertEqual(iso_data['test_vehicles']['compact_car']['mass_kg'], 1400)
+        
+        # Freezing locks a view, never the caller's own arrays
+        caller_array = np.zeros(3)
+        frozen = _freeze({'samples': caller_array})
+        with self.assertRaises(ValueError):
+            frozen['samples'][0] = 1.0
+        caller_array[0] = 1.0
+        self.assertEqual(frozen['samples'][0], 1.0)
+        
+        self.assertEqual(pickle.loads(pickle.dumps(iso_data)), iso_data)
+        self.assertEqual(json.loads(json.dumps(iso_data))['validation_status'], 'REAL ISO STANDARDS DATA')
+    
+    def test_invalidate_and_reload(self):
+        """Test explicit invalidation rebuilds the dataset"""
+        first = get_iso_brake_data()
+        
+        self.assertGreaterEqual(invalidate_iso_data_cache(), 1)
+        rebuilt = self.optimizer.load_real_iso_brake_data()
+        self.assertIsNot(rebuilt, first)
+        self.assertEqual(rebuilt, first)
+        
+        reloaded = reload_iso_brake_data()
+        self.assertIsNot(reloaded, rebuilt)
+        self.assertIs(self.optimizer.load_real_iso_brake_data(), reloaded)
+        self.assertIsNot(self.optimizer.load_real_iso_brake_data(reload=True), reloaded)
+    
+    def test_lazy_view_builds_sections_on_demand(self):
+        """Test the lazy view only builds the sections it is asked for and matches the full dict"""
+        invalidate_iso_data_cache()
+        view = self.optimizer.load_real_iso_brake_data(lazy=True)
+        self.assertIsInstance(view, ISODataView)
+        self.assertEqual(view['brake_system_specs']['hydraulic_pressure_bar'], 120)
+        self.assertEqual(list(view._dataset._sections), ['brake_system_specs'])
+        self.assertIs(ISOBaselineStore.from_iso_dict(view), get_builtin_iso_store())
+        
+        results = self.optimizer.run_complete_brake_optimization(lazy=True)
+        self.assertIsInstance(results['iso_source_data'], ISODataView)
+        self.assertNotIn('baseline_performance', view._dataset._sections)
+        
+        full = get_iso_brake_data()
+        self.assertEqual(view, full)
+        self.assertIs(view.to_dict(), full)
+        self.assertEqual(pickle.loads(pickle.dumps(view)), full)
+        self.assertEqual(json.loads(json.dumps(view, default=json_default)), json.loads(json.dumps(full)))
+        self.assertIs(self.optimizer.run_complete_brake_optimization()['iso_source_data'], full)
+
+class TestBaselineCatalog(unittest.TestCase):
+    """Test suite for external baseline files and memory-mapped catalogs"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(invalidate_iso_data_cache)
+        self.optimizer = MHMBrakePerformanceOptimizer()
+    
+    def write_fleet_csv(self, n_vehicles, distance=40.0):
+        """Write a synthetic dry-asphalt fleet as long-format CSV"""
+        path = os.path.join(self.tmp.name, 'fleet.csv')
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['condition', 'vehicle', 'surface_mu', 'test_speed_kmh'] + list(BRAKE_METRICS))
+            for i in range(n_vehicles):
+                writer.writerow(['dry_asphalt_100_0', f'vehicle_{i:05d}', 0.85, 100, distance + i % 7, 0.85, 450, 190])
+        return path
+    
+    def test_json_source_matches_builtin(self):
+        """Test a JSON baseline file loads to the same data as the built-in tables"""
+        print("\n🔍 Testing JSON Baseline Catalog...")
+        
+        path = os.path.join(self.tmp.name, 'iso.json')
+        with open(path, 'w') as f:
+            json.dump(get_iso_brake_data(), f)
+        
+        iso_data = self.optimizer.load_real_iso_brake_data(source=path)
+        
+        self.assertEqual(iso_data, get_iso_brake_data())
+        self.assertTrue(os.path.isfile(os.path.join(path + '.catalog', 'catalog.json')))
+        self.assertIs(self.optimizer.load_real_iso_brake_data(source=path), iso_data)
+        print(f"  ✅ Compiled catalog: {path}.catalog")
+    
+    def test_csv_catalog_is_memory_mapped(self):
+        """Test a large CSV fleet compiles to a memory-mapped catalog"""
+        print("\n🔍 Testing Memory-Mapped CSV Catalog...")
+        
+        path = self.write_fleet_csv(2000)
+        catalog = compile_baseline_catalog(path, os.path.join(self.tmp.name, 'fleet_catalog'))
+        store = open_baseline_catalog(catalog)
+        
+        self.assertIsInstance(store.performance, np.memmap)
+        self.assertEqual(store.performance.shape, (2000, 1, len(BRAKE_METRICS)))
+        self.assertEqual(store.baseline('vehicle_00009', 'dry_asphalt_100_0')[0], 42.0)
+        self.assertEqual(store.surface('dry_asphalt_100_0').surface_mu, 0.85)
+        
+        batch = self.optimizer.apply_tesla_folding_batch(store.surface_table('dry_asphalt_100_0')[1])
+        self.assertEqual(len(batch.dry_asphalt), 2000)
+        print(f"  ✅ {len(store.vehicles)} vehicles memory-mapped")
+    
+    def test_changed_source_is_recompiled(self):
+        """Test editing the source file invalidates the compiled catalog and the cache"""
+        path = self.write_fleet_csv(10)
+        first = get_iso_store(path)
+        self.assertIs(get_iso_store(path), first)
+        
+        path = self.write_fleet_csv(12, distance=50.0)
+        second = get_iso_store(path)
+        
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second.vehicles), 12)
+        self.assertEqual(second.baseline('vehicle_00000', 'dry_asphalt_100_0')[0], 50.0)
+    
+    def test_recompiled_catalog_is_swapped_atomically(self):
+        """Test a recompile never pairs new arrays with the old manifest, even when it fails"""
+        path = self.write_fleet_csv(10)
+        catalog = compile_baseline_catalog(path)
+        before = open_baseline_catalog(catalog)
+        files = sorted(os.listdir(catalog))
+        
+        # A save that dies before the manifest swap leaves the old catalog untouched
+        path = self.write_fleet_csv(12, distance=50.0)
+        with unittest.mock.patch('json.dump', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                compile_baseline_catalog(path)
+        self.assertEqual(sorted(os.listdir(catalog)), files)
+        self.assertEqual(len(open_baseline_catalog(catalog).vehicles), 10)
+        
+        compile_baseline_catalog(path)
+        after = open_baseline_catalog(catalog)
+        self.assertEqual(len(after.vehicles), 12)
+        self.assertEqual(after.baseline('vehicle_00000', 'dry_asphalt_100_0')[0], 50.0)
+        self.assertEqual(len(os.listdir(catalog)), 3)
+        self.assertTrue(set(os.listdir(catalog)).isdisjoint(set(files) - {'catalog.json'}))
+        # Stores opened earlier keep their own arrays
+        self.assertEqual(before.baseline('vehicle_00000', 'dry_asphalt_100_0')[0], 40.0)
+    
+    def test_unsupported_source(self):
+        """Test unknown file types and missing files are rejected"""
+        with self.assertRaises(FileNotFoundError):
+            get_iso_store(os.path.join(self.tmp.name, 'missing.json'))
+        path = os.path.join(self.tmp.name, 'fleet.xml')
+        open(path, 'w').close()
+        with self.assertRaises(ValueError):
+            get_iso_store(path)
+
+class TestParameterSweep(unittest.TestCase):
+    """Test suite for the broadcasted consciousness_level / proven_improvement sweep"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.optimizer = MHMBrakePerformanceOptimizer()
+        self.levels = np.linspace(0.5, 1.0, 11)
+        self.improvements = [10.0, 23.4, 30.0]
+    
+    def test_sweep_cube_shape(self):
+        """Test the sweep covers every grid point, vehicle and condition"""
+        print("\n🔍 Testing Parameter Sweep Cube...")
+        
+        sweep = self.optimizer.sweep_parameters(self.levels, self.improvements)
+        
+        self.assertEqual(sweep.braking.dims,
+                         ('consciousness_level', 'proven_improvement', 'vehicle', 'surface', 'field'))
+        self.assertEqual(sweep.braking.shape, (11, 3, 3, 2, 8))
+        self.assertEqual(sweep.abs_split_mu.shape, (11, 3, 3, 1, 8))
+        self.assertEqual(sweep.components.shape[:2], (11, 3))
+        
+        wet_suv = sweep.braking.sel(vehicle='suv', surface='wet_asphalt_100_0', field='stopping_distance_m')
+        self.assertEqual(wet_suv.dims, ('consciousness_level', 'proven_improvement'))
+        np.testing.assert_allclose(wet_suv.values[:, 0], 82.9 * (1 - 0.1 * 0.3))
+        print(f"  ✅ Sweep cube: {sweep.braking.shape}")
+    
+    def test_sweep_matches_optimizer_instances(self):
+        """Test each grid point reproduces an optimizer built with those parameters"""
+        sweep = self.optimizer.sweep_parameters(self.levels, self.improvements)
+        
+        for level in (self.levels[0], self.levels[7]):
+            for improvement in self.improvements:
+                optimizer = MHMBrakePerformanceOptimizer()
+                optimizer.consciousness_level = level
+                optimizer.proven_improvement = improvement
+                iso_data = optimizer.load_real_iso_brake_data()
+                expected = optimizer.apply_tesla_folding_to_brake_performance(iso_data)
+                components = optimizer.optimize_brake_system_components(iso_data)
+                
+                point = {'consciousness_level': level, 'proven_improvement': improvement}
+                for vehicle, result in expected['dry_asphalt_optimization'].items():
+                    for field, value in result['improvements'].items():
+                        self.assertEqual(sweep.braking.sel(
+                            vehicle=vehicle, surface='dry_asphalt_100_0', field=field, **point), value)
+                for vehicle, result in expected['abs_optimization'].items():
+                    for field, value in result['mhm_optimized_abs_performance'].items():
+                        self.assertEqual(sweep.abs_split_mu.sel(
+                            vehicle=vehicle, scenario='split_mu_braking', field=field, **point), value)
+                self.assertEqual(sweep.components.sel(
+                    field='esc_integration.mhm_optimized_threshold_g', **point),
+                    components['esc_integration']['mhm_optimized_threshold_g'])
+    
+    def test_cube_selection(self):
+        """Test label lists keep dimensions and unknown labels are rejected"""
+        sweep = self.optimizer.sweep_parameters([0.82], [23.4])
+        
+        subset = sweep.braking.sel(vehicle=['suv', 'compact_car'], field='deceleration_g')
+        self.assertEqual(subset.shape, (1, 1, 2, 2))
+        self.assertEqual(subset.coords['vehicle'], ['suv', 'compact_car'])
+        with self.assertRaises(KeyError):
+            sweep.braking.sel(vehicle='truck')
+        with self.assertRaises(KeyError):
+            sweep.braking.sel(speed=100)
+
+class TestParallelBatchRunner(unittest.TestCase):
+    """Test suite for the process-pool batch runner"""
+    
+    def test_parallel_matches_serial_in_order(self):
+        """Test pooled results equal serial results in input order"""
+        print("\n🔍 Testing Parallel Batch Runner...")
+        
+        jobs = [{'consciousness_level': level, 'proven_improvement': improvement}
+                for level in (0.6, 0.82, 0.95) for improvement in (15.0, 23.4)]
+        
+        parallel = run_brake_optimization_batch(jobs, max_workers=2, chunksize=2)
+        serial = run_brake_optimization_batch(jobs, max_workers=1)
+        
+        self.assertEqual(len(parallel), len(jobs))
+        self.assertEqual(parallel, serial)
+        for job, result in zip(jobs, parallel):
+            self.assertNotIn('iso_source_data', result)
+            self.assertEqual(result['system_info']['consciousness_level'], job['consciousness_level'])
+            self.assertEqual(result['system_info']['tesla_folding_proven_improvement'],
+                             f"{job['proven_improvement']}%")
+        print(f"  ✅ {len(jobs)} configurations merged in input order")
+    
+    def test_batch_job_validation(self):
+        """Test unknown job keys and empty batches"""
+        self.assertEqual(run_brake_optimization_batch([]), [])
+        with self.assertRaises(ValueError):
+            run_brake_optimization_batch([{'consciousness': 0.9}])
+
+class TestQuietLogging(unittest.TestCase):
+    """Test suite for quiet library use and pluggable logging"""
+    
+    def test_library_use_is_silent(self):
+        """Test the default optimizer performs no console output"""
+        print("\n🔍 Testing Quiet Library Mode...")
+        
+        invalidate_iso_data_cache()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            optimizer = MHMBrakePerformanceOptimizer()
+            optimizer.run_complete_brake_optimization()
+        
+        self.assertEqual(output.getvalue(), '')
+        print(f"  ✅ No output from the compute path")
+    
+    def test_verbose_console_report(self):
+        """Test verbose=True keeps the console progress report"""
+        invalidate_iso_data_cache()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            optimizer = MHMBrakePerformanceOptimizer(verbose=True)
+            optimizer.run_complete_brake_optimization()
+        
+        report = output.getvalue()
+        self.assertIn("🛑 MHM Brake Performance Optimization System", report)
+        self.assertIn("   Tesla Folding Engine: 23.4% proven improvement", report)
+        self.assertIn("     Test Vehicles: 3", report)
+        self.assertIn("    Optimizing midsize sedan ABS...", report)
+    
+    def test_custom_logger(self):
+        """Test progress messages are routed to a supplied logger"""
+        custom = logging.getLogger('mhm_brake_test_custom')
+        with self.assertLogs(custom, level='INFO') as captured:
+            optimizer = MHMBrakePerformanceOptimizer(logger=custom)
+            optimizer.apply_tesla_folding_to_brake_performance(optimizer.load_real_iso_brake_data())
+        
+        self.assertIn("INFO:mhm_brake_test_custom:    Optimizing suv...", captured.output)
+
 def run_validation_tests():
     """Run complete validation test suite"""
     print("🧪 MHM Brake Performance Optimization - Validation Test Suite")
     print("=" * 70)
     
     # Create test suite
-    test_suite = unittest.TestLoader().loadTestsFromTestCase(TestMHMBrakePerformance)
+    loader = unittest.TestLoader()
+    test_suite = unittest.TestSuite([
+        loader.loadTestsFromTestCase(TestMHMBrakePerformance),
+        loader.loadTestsFromTestCase(TestFleetBatchOptimization),
+        loader.loadTestsFromTestCase(TestISOBaselineStore),
+        loader.loadTestsFromTestCase(TestConditionFolding),
+        loader.loadTestsFromTestCase(TestLazyResults),
+        loader.loadTestsFromTestCase(TestIncrementalRecomputation),
+        loader.loadTestsFromTestCase(TestISODataCache),
+        loader.loadTestsFromTestCase(TestBaselineCatalog),
+        loader.loadTestsFromTestCase(TestParameterSweep),
+        loader.loadTestsFromTestCase(TestParallelBatchRunner),
+        loader.loadTestsFromTestCase(TestQuietLogging)
+    ])
     
     # Run tests with detailed output
     runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Result Cache Test Suite
+============================================================
+Tests for the persistent content-addressed result cache
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import io
+import copy
+import json
+import tempfile
+import contextlib
+import unittest.mock
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import (
+    MHMBrakePerformanceOptimizer,
+    get_iso_brake_data,
+    invalidate_iso_data_cache,
+    main
+)
+from mhm_brake_result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    """Test suite for cached complete optimization runs"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(invalidate_iso_data_cache)
+        self.cache = ResultCache(os.path.join(self.tmp.name, 'cache'))
+    
+    def test_identical_runs_hit_the_cache(self):
+        """Test a repeated run is read back from disk with identical output"""
+        print("\n🔍 Testing Persistent Result Cache...")
+        optimizer = MHMBrakePerformanceOptimizer()
+        
+        first = optimizer.run_complete_brake_optimization(cache=self.cache)
+        second = MHMBrakePerformanceOptimizer().run_complete_brake_optimization(cache=self.cache)
+        
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(second, first)
+        fresh = optimizer.run_complete_brake_optimization()
+        self.assertEqual(fresh.pop('iso_source_data'), get_iso_brake_data())
+        self.assertNotIn('iso_source_data', second)
+        self.assertEqual(second, json.loads(json.dumps(fresh, default=str)))
+        print(f"  ✅ {len(self.cache)} entry, {self.cache.size_bytes()} bytes")
+    
+    def test_key_covers_parameters_and_data(self):
+        """Test changed parameters or baseline content miss, equal content from another file hits"""
+        optimizer = MHMBrakePerformanceOptimizer()
+        optimizer.run_complete_brake_optimization(cache=self.cache)
+        
+        MHMBrakePerformanceOptimizer(tesla_multiplier=2.5).run_complete_brake_optimization(cache=self.cache)
+        self.assertEqual(self.cache.misses, 2)
+        
+        iso_data = copy.deepcopy(get_iso_brake_data())
+        path = os.path.join(self.tmp.name, 'baseline.json')
+        with open(path, 'w') as f:
+            json.dump(iso_data, f)
+        optimizer.run_complete_brake_optimization(path, cache=self.cache)
+        self.assertEqual(self.cache.hits, 1)
+        
+        iso_data['baseline_performance']['wet_asphalt_100_0']['suv']['stopping_distance_m'] = 80.0
+        path = os.path.join(self.tmp.name, 'updated.json')
+        with open(path, 'w') as f:
+            json.dump(iso_data, f)
+        results = optimizer.run_complete_brake_optimization(path, cache=self.cache)
+        self.assertEqual(self.cache.misses, 3)
+        wet_suv = results['brake_performance_optimization']['surface_optimization']['wet_asphalt_100_0']['suv']
+        self.assertEqual(wet_suv['baseline_performance']['stopping_distance_m'], 80.0)
+    
+    def test_incremental_runs_reject_a_cache(self):
+        """Test incremental=True with a cache raises instead of silently skipping the cache"""
+        with self.assertRaises(ValueError):
+            MHMBrakePerformanceOptimizer().run_complete_brake_optimization(incremental=True, cache=self.cache)
+        self.assertEqual(len(self.cache), 0)
+    
+    def test_lru_eviction(self):
+        """Test the size cap evicts least recently used entries first"""
+        cache = ResultCache(os.path.join(self.tmp.name, 'small'), max_bytes=250)
+        for i, key in enumerate(('a', 'b', 'c')):
+            cache.put(key, {'payload': 'x' * 90})
+            os.utime(os.path.join(cache.directory, key + '.json'), ns=(i * 10**9, i * 10**9))
+        self.assertNotIn('a', cache)
+        
+        cache.get('b')  # b becomes most recently used, so c is evicted next
+        cache.put('d', {'payload': 'x' * 90})
+        self.assertEqual(sorted(name for name in 'abcd' if name in cache), ['b', 'd'])
+        self.assertLessEqual(cache.size_bytes(), 250)
+        
+        self.assertEqual(cache.clear(), 2)
+        self.assertIsNone(cache.get('b'))
+        with self.assertRaises(ValueError):
+            ResultCache(self.tmp.name, max_bytes=0)
+    
+    def test_default_directory_follows_environment(self):
+        """Test MHM_BRAKE_CACHE_DIR set after import still picks the default cache directory"""
+        directory = os.path.join(self.tmp.name, 'from_env')
+        with unittest.mock.patch.dict(os.environ, {'MHM_BRAKE_CACHE_DIR': directory}):
+            self.assertEqual(ResultCache().directory, directory)
+        self.assertNotEqual(ResultCache().directory, directory)
+    
+    def test_main_uses_cache(self):
+        """Test main() caches only with --cache-dir, skips it with --no-cache and says where results came from"""
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        default_dir = os.path.join(self.tmp.name, 'default')
+        
+        outputs = []
+        with unittest.mock.patch.dict(os.environ, {'MHM_BRAKE_CACHE_DIR': default_dir}):
+            for argv in ([], ['--cache-dir', self.cache.directory], ['--cache-dir', self.cache.directory],
+                         ['--no-cache', '--cache-dir', os.path.join(self.tmp.name, 'unused')]):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    main(argv)
+                self.assertIn('MHM BRAKE PERFORMANCE OPTIMIZATION COMPLETE', output.getvalue())
+                outputs.append(output.getvalue())
+        
+        self.assertEqual(['Loaded cached' in output for output in outputs], [False, False, True, False])
+        self.assertEqual(['Results loaded from cache' in output for output in outputs], [False, False, True, False])
+        self.assertIn('stored in cache', outputs[1])
+        self.assertEqual(len(self.cache), 1)
+        self.assertFalse(os.path.exists(default_dir))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, 'unused')))
+        self.assertTrue(os.path.exists('mhm_brake_optimization_results.ndjson'))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
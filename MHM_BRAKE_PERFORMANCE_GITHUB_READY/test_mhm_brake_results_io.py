@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Results I/O Test Suite
+===========================================================
+Tests for the streaming NDJSON results writer and columnar export
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import importlib.util
+import io
+import contextlib
+import numpy as np
+import pandas as pd
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import (
+    MHMBrakePerformanceOptimizer,
+    folded_conditions,
+    get_builtin_iso_store,
+    json_default,
+    main
+)
+from mhm_brake_results_io import (
+    ResultStreamWriter,
+    export_results_table,
+    iter_result_records,
+    read_results_table,
+    result_stream_to_table,
+    results_to_table,
+    stream_brake_optimization_runs,
+    stream_complete_brake_optimization,
+    stream_optimization_results
+)
+
+
+class TestResultStream(unittest.TestCase):
+    """Test suite for the streaming NDJSON results writer"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'results.ndjson')
+    
+    def test_source_written_once(self):
+        """Test the source dataset is written once and referenced by every run"""
+        print("\n🔍 Testing NDJSON Result Stream...")
+        
+        jobs = [{'consciousness_level': level} for level in (0.7, 0.82, 0.9)]
+        run_ids = stream_brake_optimization_runs(jobs, self.path)
+        
+        sources = list(iter_result_records(self.path, 'source'))
+        runs = list(iter_result_records(self.path, 'run'))
+        self.assertEqual(len(sources), 1)
+        self.assertEqual([run['run_id'] for run in runs], run_ids)
+        self.assertTrue(all(run['source_id'] == sources[0]['source_id'] for run in runs))
+        self.assertEqual(len(list(iter_result_records(self.path, 'braking'))), 3 * 3 * 2)
+        
+        # The source record identifies the dataset without copying it
+        store = get_builtin_iso_store()
+        self.assertEqual(sources[0]['content_digest'], store.content_digest())
+        self.assertEqual(sources[0]['surfaces'], [surface.name for surface in store.surfaces])
+        self.assertNotIn('data', sources[0])
+        
+        with open(self.path) as f:
+            for line in f:
+                json.loads(line)
+        print(f"  ✅ {len(runs)} runs share source {sources[0]['source_id']}")
+    
+    def test_bad_job_rejected_before_writing(self):
+        """Test an unknown job key raises ValueError before the output file is created"""
+        with self.assertRaises(ValueError):
+            stream_brake_optimization_runs([{'consciousness_level': 0.9}, {'consciousnes_level': 0.8}], self.path)
+        self.assertFalse(os.path.exists(self.path))
+    
+    def test_records_match_complete_results(self):
+        """Test streamed records carry the same values as run_complete_brake_optimization"""
+        optimizer = MHMBrakePerformanceOptimizer()
+        expected = optimizer.run_complete_brake_optimization()
+        
+        with ResultStreamWriter(self.path) as writer:
+            run_id = stream_complete_brake_optimization(optimizer, writer)
+        
+        conditions = folded_conditions(expected['brake_performance_optimization'])
+        for record in iter_result_records(self.path, 'braking'):
+            vehicle_result = conditions['braking'][record['condition']][record['vehicle']]
+            self.assertEqual(record['run_id'], run_id)
+            self.assertEqual(record['optimized'], vehicle_result['mhm_optimized_performance'])
+            self.assertEqual(record['improvements'], vehicle_result['improvements'])
+        for record in iter_result_records(self.path, 'abs'):
+            vehicle_result = conditions['abs'][record['condition']][record['vehicle']]
+            self.assertEqual(record['baseline'], vehicle_result['baseline_abs_performance'])
+        
+        components, = iter_result_records(self.path, 'components')
+        self.assertEqual(components['component_optimization'], expected['component_optimization'])
+        run, = iter_result_records(self.path, 'run')
+        self.assertEqual(run['system_info'], expected['system_info'])
+        overall, = iter_result_records(self.path, 'overall')
+        self.assertEqual(overall['overall_performance'],
+                         json.loads(json.dumps(expected['overall_performance'], default=json_default)))
+    
+    def test_finished_results_stream_like_a_fresh_run(self):
+        """Test lazy and plain (cached) results stream the same records as a fresh streamed run"""
+        optimizer = MHMBrakePerformanceOptimizer()
+        with ResultStreamWriter(self.path) as writer:
+            stream_complete_brake_optimization(optimizer, writer)
+        expected = list(iter_result_records(self.path))
+        
+        lazy = optimizer.run_complete_brake_optimization(lazy=True)
+        plain = json.loads(json.dumps(lazy, default=json_default))
+        for results in (lazy, plain):
+            with ResultStreamWriter(self.path) as writer:
+                stream_optimization_results(results, optimizer, writer)
+            self.assertEqual(list(iter_result_records(self.path)), expected)
+    
+    def test_main_streams_results(self):
+        """Test the command line writes an NDJSON stream that references its source once"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            main(['--output', self.path])
+        
+        records = list(iter_result_records(self.path))
+        self.assertEqual([record['record'] for record in records][:2], ['source', 'run'])
+        self.assertEqual(sum(record['record'] == 'source' for record in records), 1)
+        self.assertEqual(records[1]['source_id'], records[0]['source_id'])
+        self.assertEqual(len([record for record in records if record['record'] == 'braking']), 3 * 2)
+        self.assertTrue(all('iso_source_data' not in record for record in records))
+
+
+
+class TestColumnarExport(unittest.TestCase):
+    """Test suite for the columnar results table export"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.optimizer = MHMBrakePerformanceOptimizer()
+        self.results = self.optimizer.run_complete_brake_optimization()
+    
+    def test_table_layout(self):
+        """Test one row per vehicle × condition × metric"""
+        print("\n🔍 Testing Columnar Results Table...")
+        
+        table = results_to_table(self.results)
+        
+        self.assertEqual(len(table), 3 * 3 * 4)
+        row = table[(table.vehicle == 'suv') & (table.metric == 'max_yaw_rate_deg_s')].iloc[0]
+        improvements = self.results['brake_performance_optimization']['abs_optimization']['suv']['improvements']
+        self.assertEqual(row['condition'], 'split_mu_braking')
+        self.assertEqual(row['baseline'], 9.1)
+        self.assertEqual(row['improvement_metric'], 'yaw_stability_improvement_percent')
+        self.assertEqual(row['improvement_percent'], improvements['yaw_stability_improvement_percent'])
+        print(f"  ✅ {len(table)} rows, columns: {', '.join(table.columns)}")
+    
+    def test_batch_and_stream_tables_match_dict(self):
+        """Test array-built and stream-built tables equal the dict-built table"""
+        expected = results_to_table(self.results)
+        
+        folded = self.optimizer.apply_tesla_folding_to_conditions(get_builtin_iso_store())
+        pd.testing.assert_frame_equal(results_to_table(folded), expected)
+        
+        # Single-condition batches match results saved with only the legacy sections
+        store = get_builtin_iso_store()
+        vehicles, dry_table = store.surface_table('dry_asphalt_100_0')
+        batch = self.optimizer.apply_tesla_folding_batch(
+            dry_table, store.abs_table('split_mu_braking')[1], vehicles=vehicles)
+        legacy = {key: value for key, value in self.results['brake_performance_optimization'].items()
+                  if key in ('dry_asphalt_optimization', 'abs_optimization')}
+        pd.testing.assert_frame_equal(results_to_table(batch), results_to_table(legacy))
+        
+        path = os.path.join(self.tmp.name, 'results.ndjson')
+        with ResultStreamWriter(path) as writer:
+            stream_complete_brake_optimization(self.optimizer, writer)
+        pd.testing.assert_frame_equal(result_stream_to_table(path), expected)
+    
+    def test_npz_round_trip_with_column_selection(self):
+        """Test compressed NPZ export and reading a subset of columns"""
+        path = export_results_table(self.results, os.path.join(self.tmp.name, 'results.npz'))
+        
+        full = read_results_table(path)
+        pd.testing.assert_frame_equal(full, results_to_table(self.results))
+        
+        subset = read_results_table(path, columns=['vehicle', 'improvement_percent'])
+        self.assertEqual(list(subset.columns), ['vehicle', 'improvement_percent'])
+        self.assertEqual(subset.improvement_percent.dtype, np.float64)
+        with self.assertRaises(KeyError):
+            read_results_table(path, columns=['speed'])
+        with self.assertRaises(ValueError):
+            export_results_table(self.results, os.path.join(self.tmp.name, 'results.xlsx'))
+    
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), "pyarrow not installed")
+    def test_parquet_round_trip(self):
+        """Test Parquet export and column projection"""
+        path = export_results_table(self.results, os.path.join(self.tmp.name, 'results.parquet'))
+        
+        subset = read_results_table(path, columns=['vehicle', 'optimized'])
+        self.assertEqual(list(subset.columns), ['vehicle', 'optimized'])
+        self.assertEqual(len(subset), 36)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Run Log Replay Test Suite
+==============================================================
+Tests for chunked, memory-mapped replay of recorded brake test logs
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import get_iso_brake_data
+from mhm_brake_run_log import (
+    RUN_LOG_DTYPE,
+    RecordedStop,
+    RunLogReplayer,
+    open_run_log,
+    replay_run_log,
+    synthetic_run_records,
+    write_run_log
+)
+
+
+def _stop_distance(speed_kmh, deceleration_g=0.8):
+    return (speed_kmh / 3.6) ** 2 / (2 * deceleration_g * 9.81)
+
+
+class TestRunLogReplay(unittest.TestCase):
+    """Test suite for stop detection and ISO metrics over recorded logs"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'run.bin')
+        
+        # Three stops: straight, yawing with ABS modulation, and one released before standstill
+        released = synthetic_run_records(80.0, start_time_s=30.0)
+        released['brake_pressure_bar'][len(released) // 2:] = 0.0
+        self.runs = [synthetic_run_records(100.0),
+                     synthetic_run_records(60.0, yaw_rate_deg_s=2.0, abs_frequency_hz=8.0, start_time_s=10.0),
+                     released]
+        self.rows = write_run_log(self.path, self.runs)
+    
+    def test_iso_metrics_from_memory_mapped_log(self):
+        """Test stops replayed from a memory-mapped log match the analytic stops"""
+        print("\n🔍 Testing Run Log Replay...")
+        log = open_run_log(self.path)
+        self.assertIsInstance(log, np.memmap)
+        self.assertEqual(len(log), self.rows)
+        
+        replay = replay_run_log(self.path, chunk_rows=4096)
+        
+        self.assertEqual(len(replay.stops), 2)
+        self.assertEqual(replay.abandoned_stops, 1)
+        self.assertEqual(replay.chunks, -(-self.rows // 4096))
+        straight, yawing = replay.stops
+        self.assertAlmostEqual(straight.stopping_distance_m, _stop_distance(100.0), delta=0.002 * _stop_distance(100.0))
+        self.assertAlmostEqual(straight.mean_deceleration_g, 0.8, places=2)
+        self.assertAlmostEqual(straight.start_time_s, 0.5)
+        self.assertEqual((straight.max_yaw_rate_deg_s, straight.lateral_displacement_m, straight.abs_cycles),
+                         (0.0, 0.0, 0))
+        
+        self.assertAlmostEqual(yawing.max_yaw_rate_deg_s, 2.0, places=5)
+        self.assertGreater(yawing.lateral_displacement_m, 0.0)
+        self.assertLess(yawing.lateral_displacement_m, 0.1 * yawing.stopping_distance_m)
+        self.assertAlmostEqual(yawing.abs_cycles_per_second, 8.0, delta=1.0 / yawing.stopping_time_s)
+        self.assertAlmostEqual(yawing.corrected_stopping_distance_m(100.0), _stop_distance(100.0),
+                               delta=0.005 * _stop_distance(100.0))
+        print(f"  ✅ {replay.rows} records → {straight}, {yawing}")
+    
+    def test_results_independent_of_chunking(self):
+        """Test stops spanning chunk boundaries measure the same as a single pass"""
+        whole = RunLogReplayer(chunk_rows=10**9).replay(self.path)
+        for chunk_rows in (1, 7, 333):
+            chunked = RunLogReplayer(chunk_rows=chunk_rows).replay(self.path)
+            self.assertEqual(chunked.abandoned_stops, whole.abandoned_stops)
+            for stop, expected in zip(chunked.stops, whole.stops):
+                for field, value in expected.to_dict().items():
+                    self.assertAlmostEqual(stop.to_dict()[field], value, places=9, msg=f"{field} @ {chunk_rows}")
+        
+        # A structured .npy log with extra channels replays the same way
+        npy_path = os.path.join(self.tmp.name, 'run.npy')
+        extended = np.zeros(self.rows, dtype=RUN_LOG_DTYPE.descr + [('steering_angle_deg', '<f4')])
+        for name in RUN_LOG_DTYPE.names:
+            extended[name] = np.concatenate(self.runs)[name]
+        np.save(npy_path, extended)
+        self.assertEqual(len(replay_run_log(npy_path, chunk_rows=1000).stops), 2)
+    
+    def test_stops_fold_through_optimizer(self):
+        """Test recorded stops feed the Tesla Folding batch as braking and split-μ baselines"""
+        replay = replay_run_log(self.path)
+        suv = get_iso_brake_data()['test_vehicles']['suv']
+        
+        folded = replay.fold(vehicle=suv, nominal_speed_kmh=100.0)
+        self.assertEqual(list(folded.dry_asphalt), ['stop_0', 'stop_1'])
+        baseline = folded.dry_asphalt['stop_1'].baseline
+        self.assertAlmostEqual(baseline['stopping_distance_m'], replay.stops[1].corrected_stopping_distance_m(100.0))
+        self.assertGreater(baseline['brake_temperature_c'], 120.0)
+        self.assertAlmostEqual(folded.abs_split_mu['stop_1'].baseline['max_yaw_rate_deg_s'], 2.0, places=5)
+        self.assertTrue(np.isnan(replay.brake_metrics()[:, 3]).all())
+    
+    def test_degenerate_stop_reports_nan(self):
+        """Test a stop with no distance or duration reports NaN rates instead of dividing by zero"""
+        stop = RecordedStop(5.0, 5.0, 3.0, 0.0, 40.0, 0.0, 0.0, 0)
+        self.assertTrue(np.isnan(stop.mean_deceleration_g))
+        self.assertTrue(np.isnan(stop.abs_cycles_per_second))
+        self.assertTrue(np.isnan(stop.to_dict()['abs_cycles_per_second']))
+        self.assertIn('nan ABS cycles/s', repr(stop))
+        
+        # A logger glitch repeating a timestamp yields a zero-length stop that replays without raising
+        glitch = np.zeros(2, dtype=RUN_LOG_DTYPE)
+        glitch['time_s'] = 1.0
+        glitch['brake_pressure_bar'] = 80.0
+        glitch['wheel_speed_fl_kmh'][0] = 60.0
+        path = os.path.join(self.tmp.name, 'glitch.bin')
+        write_run_log(path, [glitch])
+        stops = replay_run_log(path).stops
+        self.assertEqual(len(stops), 1)
+        self.assertEqual((stops[0].stopping_time_s, stops[0].stopping_distance_m), (0.0, 0.0))
+        self.assertTrue(np.isnan(stops[0].mean_deceleration_g))
+    
+    def test_malformed_logs(self):
+        """Test truncated raw logs, missing channels and bad chunk sizes are rejected"""
+        with open(self.path, 'ab') as f:
+            f.write(b'\0' * 3)
+        with self.assertRaises(ValueError):
+            open_run_log(self.path)
+        npy_path = os.path.join(self.tmp.name, 'speeds_only.npy')
+        np.save(npy_path, np.zeros(4, dtype=[('time_s', '<f8'), ('wheel_speed_fl_kmh', '<f4')]))
+        with self.assertRaises(ValueError):
+            open_run_log(npy_path)
+        with self.assertRaises(ValueError):
+            RunLogReplayer(chunk_rows=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Asyncio Service Test Suite
+===============================================================
+Tests for queue draining, request coalescing and the HTTP front end
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import json
+import asyncio
+import urllib.error
+import urllib.request
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import MHMBrakePerformanceOptimizer, json_default
+from mhm_brake_service import OptimizationService, serve
+
+
+def _plain(value):
+    return json.loads(json.dumps(value, default=json_default))
+
+
+def _http(url: str, payload=None):
+    """(status, decoded JSON body) of a GET, or a POST when payload is given"""
+    data = None if payload is None else json.dumps(payload).encode()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data), timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+class TestOptimizationService(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the queue-draining, coalescing service core"""
+    
+    async def test_identical_requests_coalesce(self):
+        """Test concurrent identical requests run once and match a direct optimizer run"""
+        print("\n🔍 Testing Optimization Service...")
+        async with OptimizationService(batch_window_s=0.01) as service:
+            results = await asyncio.gather(*[service.submit('optimize') for _ in range(5)],
+                                           service.submit('optimize', {'tesla_multiplier': 2.5}),
+                                           service.submit('optimize', {'source': 'builtin'}))
+            stats = service.stats()
+        
+        self.assertEqual((stats['requests'], stats['coalesced'], stats['jobs']), (7, 5, 2))
+        self.assertEqual(stats['batches'], 1)
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertTrue(all(result is results[0] for result in results[1:5] + results[6:]))
+        self.assertEqual(_plain(results[0]), _plain(MHMBrakePerformanceOptimizer().run_complete_brake_optimization()))
+        self.assertEqual(results[5]['system_info']['tesla_multiplier'], 2.5)
+        print(f"  ✅ {stats['requests']} requests → {stats['jobs']} optimizer runs")
+    
+    async def test_event_loop_stays_responsive(self):
+        """Test the loop keeps ticking while a large sweep runs on the executor"""
+        levels = [0.5 + 0.001 * i for i in range(400)]
+        async with OptimizationService() as service:
+            ticks = 0
+            request = asyncio.ensure_future(service.submit('sweep', {'consciousness_levels': levels,
+                                                                      'proven_improvements': [20.0, 23.4],
+                                                                      'group_by': 'vehicle_class'}))
+            while not request.done():
+                await asyncio.sleep(0.001)
+                ticks += 1
+            statistics = request.result()
+        
+        self.assertGreater(ticks, 1)
+        self.assertEqual(list(statistics['braking']), ['compact_car', 'midsize_sedan', 'suv'])
+    
+    async def test_bad_requests(self):
+        """Test invalid requests and unserved sources fail for their caller only"""
+        service = OptimizationService(allowed_sources=['/nonexistent.json'])
+        with self.assertRaises(RuntimeError):
+            await service.submit('optimize')
+        async with service:
+            with self.assertRaises(ValueError):
+                await service.submit('compile')
+            with self.assertRaises(ValueError):
+                await service.submit('optimize', {'speed': 100})
+            with self.assertRaises(ValueError):
+                await service.submit('sweep', {'consciousness_levels': [0.8]})
+            for source in (__file__, '/etc/passwd', ['builtin']):
+                with self.assertRaises(ValueError):
+                    await service.submit('optimize', {'source': source})
+            missing, ok = await asyncio.gather(service.submit('optimize', {'source': '/nonexistent.json'}),
+                                               service.submit('optimize'), return_exceptions=True)
+            self.assertIsInstance(missing, FileNotFoundError)
+            self.assertIn('overall_performance', ok)
+            self.assertEqual(service.stats()['errors'], 1)
+
+
+class TestServiceHTTP(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the HTTP front end"""
+    
+    async def test_endpoints(self):
+        """Test health, optimize, sweep and error responses over HTTP"""
+        async with OptimizationService() as service:
+            server = await serve(service, port=0)
+            host, port = server.sockets[0].getsockname()[:2]
+            base = f"http://{host}:{port}"
+            loop = asyncio.get_running_loop()
+            
+            async def call(path, payload=None):
+                return await loop.run_in_executor(None, _http, base + path, payload)
+            
+            async with server:
+                health = await call('/health')
+                optimized = await call('/optimize', {'consciousness_level': 0.9})
+                sweep = await call('/sweep', {'consciousness_levels': [0.8, 0.9], 'proven_improvements': [23.4]})
+                unknown_path = await call('/compile', {})
+                wrong_method = await call('/optimize')
+                bad_parameter = await call('/optimize', {'speed': 100})
+                unserved_source = await call('/sweep', {'consciousness_levels': [0.8], 'proven_improvements': [23.4],
+                                                        'source': __file__})
+        
+        self.assertEqual(health[0], 200)
+        self.assertEqual(health[1]['status'], 'ok')
+        self.assertEqual(optimized[0], 200)
+        self.assertEqual(optimized[1]['system_info']['consciousness_level'], 0.9)
+        self.assertEqual(sweep[0], 200)
+        self.assertEqual(sweep[1]['abs_split_mu']['all']['distance_reduction_percent']['count'], 2 * 3)
+        self.assertEqual([unknown_path[0], wrong_method[0], bad_parameter[0], unserved_source[0]],
+                         [404, 405, 400, 400])
+        self.assertIn('speed', bad_parameter[1]['error'])
+        self.assertFalse(os.path.exists(__file__ + '.catalog'))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
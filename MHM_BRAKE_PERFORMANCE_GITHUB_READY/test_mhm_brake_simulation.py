@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Simulation Test Suite
+==========================================================
+Tests for the physics-based braking simulators
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import MHMBrakePerformanceOptimizer, get_builtin_iso_store
+from mhm_brake_simulation import (
+    ABS_CONTROLLERS,
+    GRAVITY_MS2,
+    generate_baseline_store,
+    simulate_abs_braking,
+    simulate_abs_scenarios,
+    simulate_stopping_distance,
+    tire_radius_m,
+    with_simulated_abs
+)
+
+
+class TestStoppingDistanceSimulator(unittest.TestCase):
+    """Test suite for the longitudinal stopping-distance simulator"""
+    
+    def test_matches_constant_deceleration_solution(self):
+        """Test an ideal stop reproduces v² / 2a at the axle friction limit"""
+        print("\n🔍 Testing Stopping Distance Kernel...")
+        
+        result = simulate_stopping_distance(1500, 2.7, 0.55, 0.85, 100, pressure_rise_time_s=0,
+                                            drag_area_m2=0, rolling_resistance=0, max_system_deceleration_g=5)
+        
+        expected = (100 / 3.6) ** 2 / (2 * result.friction_limit_g * GRAVITY_MS2)
+        self.assertAlmostEqual(float(result.stopping_distance_m), float(expected), places=6)
+        self.assertAlmostEqual(float(result.mean_deceleration_g), float(result.friction_limit_g), places=6)
+        print(f"  ✅ Stopping distance: {float(result.stopping_distance_m):.2f} m")
+    
+    def test_vehicle_by_surface_broadcast(self):
+        """Test vehicles × surfaces are simulated in one call"""
+        mass = np.array([1400.0, 1600.0, 2000.0])[:, None]
+        cg_height = np.array([0.52, 0.55, 0.68])[:, None]
+        mu = np.array([0.85, 0.45, 0.1])[None, :]
+        
+        result = simulate_stopping_distance(mass, 2.8, cg_height, mu, 100)
+        
+        self.assertEqual(result.stopping_distance_m.shape, (3, 3))
+        self.assertTrue(np.all(np.diff(result.stopping_distance_m, axis=1) > 0))
+        self.assertTrue(np.all(result.peak_deceleration_g <= result.friction_limit_g + 0.05))
+    
+    def test_step_size_convergence(self):
+        """Test the default step agrees with a fine step"""
+        coarse = simulate_stopping_distance(1600, 2.85, 0.55, [0.85, 0.45], [100, 80])
+        fine = simulate_stopping_distance(1600, 2.85, 0.55, [0.85, 0.45], [100, 80], dt=5e-4)
+        
+        np.testing.assert_allclose(coarse.stopping_distance_m, fine.stopping_distance_m, rtol=1e-4)
+        np.testing.assert_allclose(coarse.stopping_time_s, fine.stopping_time_s, rtol=1e-3)
+    
+    def test_no_stop_and_bad_parameters(self):
+        """Test vehicles that cannot stop report inf and unknown parameters are rejected"""
+        result = simulate_stopping_distance(1500, 2.7, 0.55, 0.0, 50, drag_area_m2=0, rolling_resistance=0,
+                                            max_time_s=1.0)
+        self.assertTrue(np.isinf(result.stopping_distance_m))
+        with self.assertRaises(TypeError):
+            simulate_stopping_distance(1500, 2.7, 0.55, 0.85, 100, brake_bias=0.6)
+    
+    def test_generated_baselines_feed_optimizer(self):
+        """Test simulated baselines form a store usable by the batch optimizer"""
+        builtin = get_builtin_iso_store()
+        
+        store = generate_baseline_store(builtin.metadata['test_vehicles'], builtin.surfaces)
+        
+        self.assertEqual(store.vehicles, builtin.vehicles)
+        self.assertEqual(store.performance.shape, builtin.performance.shape)
+        dry = store.baseline('suv', 'dry_asphalt_100_0')
+        wet = store.baseline('suv', 'wet_asphalt_100_0')
+        self.assertGreater(wet[0], dry[0])
+        self.assertGreater(dry[3], 120.0)
+        
+        vehicles, table = store.surface_table('wet_asphalt_100_0')
+        batch = MHMBrakePerformanceOptimizer().apply_tesla_folding_batch(table, vehicles=vehicles)
+        self.assertEqual(len(batch.dry_asphalt), 3)
+
+
+
+class TestABSControlSimulator(unittest.TestCase):
+    """Test suite for the batched ABS control-loop simulator"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.builtin = get_builtin_iso_store()
+        cls.result = simulate_abs_scenarios(cls.builtin.metadata['test_vehicles'], cls.builtin.abs_scenarios)
+    
+    def test_controller_batch_shapes_and_cycles(self):
+        """Test every vehicle × scenario × controller is simulated with sensible ABS activity"""
+        print("\n🔍 Testing ABS Control Loop...")
+        
+        result = self.result
+        self.assertEqual(result.controllers, list(ABS_CONTROLLERS))
+        self.assertEqual(result.stopping_distance_m.shape, (3, len(self.builtin.abs_scenarios), 3))
+        self.assertTrue(np.isfinite(result.stopping_distance_m).all())
+        
+        bang_bang, five_state, open_loop = (result.abs_cycles_per_second[..., c] for c in range(3))
+        self.assertTrue((bang_bang > 0).all())
+        self.assertTrue((five_state > 0).all())
+        self.assertTrue((open_loop == 0).all())
+        # Bang-bang cannot cycle faster than half the 50 Hz control clock
+        self.assertTrue((bang_bang <= 25.0).all())
+        print(f"  ✅ bang_bang_abs: {bang_bang.mean():.1f} cycles/s")
+    
+    def test_abs_limits_split_mu_yaw(self):
+        """Test modulated braking yaws less than open-loop braking on split-μ"""
+        yaw = self.result.max_yaw_rate_deg_s
+        self.assertTrue((yaw[..., 0] < yaw[..., 2]).all())
+        self.assertTrue((self.result.lateral_displacement_m[..., 1] < self.result.lateral_displacement_m[..., 2]).all())
+    
+    def test_uniform_surface_is_symmetric(self):
+        """Test equal left/right friction produces no yaw and a plausible high-μ stop"""
+        outputs = simulate_abs_braking(1500, 2.7, 0.55, 0.31, 0.9, 0.9, 100, controllers=['bang_bang_abs'])
+        
+        self.assertLess(float(outputs['max_yaw_rate_deg_s'][0, 0]), 1e-9)
+        self.assertTrue(40.0 < float(outputs['stopping_distance_m'][0, 0]) < 70.0)
+        with self.assertRaises(ValueError):
+            simulate_abs_braking(1500, 2.7, 0.55, 0.31, 0.9, 0.9, 100, controllers=['fuzzy_abs'])
+        with self.assertRaises(TypeError):
+            simulate_abs_braking(1500, 2.7, 0.55, 0.31, 0.9, 0.9, 100, slip_target=0.1)
+    
+    def test_simulated_abs_feeds_optimizer(self):
+        """Test a simulated abs table drops into the existing ABS optimization"""
+        self.assertAlmostEqual(tire_radius_m('205/55R16'), 0.31595)
+        self.assertEqual(tire_radius_m('unknown', 0.3), 0.3)
+        
+        store = with_simulated_abs(self.builtin, controller='five_state_abs')
+        
+        np.testing.assert_array_equal(store.performance, self.builtin.performance)
+        np.testing.assert_allclose(store.abs_performance,
+                                   self.result.abs_metrics('five_state_abs'))
+        results = MHMBrakePerformanceOptimizer().apply_tesla_folding_to_brake_performance(store)
+        abs_suv = results['abs_optimization']['suv']
+        self.assertLess(abs_suv['mhm_optimized_abs_performance']['stopping_distance_m'],
+                        abs_suv['baseline_abs_performance']['stopping_distance_m'])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
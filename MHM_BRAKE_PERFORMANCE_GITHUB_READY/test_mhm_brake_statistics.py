@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Aggregate Statistics Test Suite
+====================================================================
+Tests for grouped improvement statistics over folding and sweep results
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import (
+    BRAKE_IMPROVEMENTS,
+    MHMBrakePerformanceOptimizer,
+    get_builtin_iso_store
+)
+from mhm_brake_statistics import aggregate
+from benchmark_mhm_brake_performance import synthetic_fleet_store
+
+
+class TestAggregateStatistics(unittest.TestCase):
+    """Test suite for the array aggregation layer"""
+    
+    def test_matches_numpy_reductions(self):
+        """Test grouped statistics equal NumPy's NaN-aware reductions group by group"""
+        print("\n🔍 Testing Aggregate Statistics...")
+        rng = np.random.default_rng(7)
+        values = rng.normal(5.0, 2.0, (40, 6, 3))
+        values[rng.random((40, 6, 3)) < 0.15] = np.nan
+        codes = rng.integers(0, 3, 40)[:, None]
+        
+        statistics = aggregate(values, codes, ['a', 'b', 'c', 'empty'], ('x', 'y', 'z'), (10, 50, 90))
+        
+        self.assertEqual(statistics.statistics, ('count', 'mean', 'std', 'min', 'max', 'p10', 'p50', 'p90'))
+        for g, group in enumerate('abc'):
+            samples = values[np.broadcast_to(codes, (40, 6)) == g]
+            expected = np.column_stack([(~np.isnan(samples)).sum(axis=0), np.nanmean(samples, axis=0),
+                                        np.nanstd(samples, axis=0), np.nanmin(samples, axis=0),
+                                        np.nanmax(samples, axis=0),
+                                        np.nanpercentile(samples, [10, 50, 90], axis=0).T])
+            np.testing.assert_allclose(statistics.values[g], expected)
+        self.assertEqual(statistics.get('y', 'count', 'empty'), 0.0)
+        self.assertTrue(np.isnan(statistics.get('y', 'mean', 'empty')))
+        print(f"  ✅ {len(statistics.groups)} groups × {len(statistics.metrics)} metrics")
+    
+    def test_bad_arguments(self):
+        """Test inconsistent names, percentiles and ambiguous lookups are rejected"""
+        values = np.ones((4, 2))
+        with self.assertRaises(ValueError):
+            aggregate(values, metric_names=('only_one',))
+        with self.assertRaises(ValueError):
+            aggregate(values, percentiles=(101,))
+        with self.assertRaises(ValueError):
+            aggregate(values, np.array([0, 0, 1, 1]), ['a', 'b']).get('metric_0')
+        with self.assertRaises(KeyError):
+            aggregate(values).get('metric_0', 'median')
+
+
+class TestResultStatistics(unittest.TestCase):
+    """Test suite for statistics over folding, sweep and complete results"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.optimizer = MHMBrakePerformanceOptimizer()
+    
+    def test_group_by_vehicle_class(self):
+        """Test a synthetic fleet groups back to its three source vehicle classes"""
+        store = synthetic_fleet_store(60)
+        folded = self.optimizer.apply_tesla_folding_to_conditions(store)
+        
+        by_class = folded.statistics('vehicle_class')['braking']
+        self.assertEqual(by_class.groups, ['compact_car', 'midsize_sedan', 'suv'])
+        self.assertEqual(by_class.get('distance_reduction_percent', 'count', 'suv'), 20 * 2)
+        
+        suv_rows = [i for i, vehicle in enumerate(store.vehicles) if vehicle.startswith('suv')]
+        suv_thermal = folded.braking[2][suv_rows, :, BRAKE_IMPROVEMENTS.index('thermal_improvement_percent')]
+        self.assertAlmostEqual(by_class.get('thermal_improvement_percent', 'p50', 'suv'), np.median(suv_thermal))
+        
+        by_condition = folded.statistics('condition')['abs_split_mu']
+        self.assertEqual(by_condition.groups, ['split_mu_braking'])
+        with self.assertRaises(ValueError):
+            folded.statistics('tire_size')
+    
+    def test_sweep_statistics_by_parameter(self):
+        """Test sweep statistics group along any grid dimension"""
+        sweep = self.optimizer.sweep_parameters([0.7, 0.82, 0.9], [20.0, 23.4])
+        
+        by_level = sweep.statistics('consciousness_level')['braking']
+        pooled = sweep.statistics()['abs_split_mu']
+        
+        self.assertEqual(by_level.groups, [0.7, 0.82, 0.9])
+        pedal = sweep.braking.sel(consciousness_level=0.9, field='pedal_force_reduction_percent').values
+        self.assertAlmostEqual(by_level.get('pedal_force_reduction_percent', 'mean', 0.9), np.nanmean(pedal))
+        self.assertEqual(pooled.get('distance_reduction_percent', 'count'), 3 * 2 * 3)
+    
+    def test_overall_performance_in_results(self):
+        """Test complete runs report headline averages and full statistics"""
+        results = self.optimizer.run_complete_brake_optimization()
+        overall = results['overall_performance']
+        
+        self.assertAlmostEqual(overall['average_distance_reduction'], 7.02)
+        self.assertEqual(overall['tesla_folding_foundation'], 23.4)
+        distance = overall['improvement_statistics']['braking']['distance_reduction_percent']
+        self.assertEqual(distance['count'], len(get_builtin_iso_store().vehicles) * 2)
+        self.assertAlmostEqual(distance['p95'], 7.02)
+        self.assertEqual(list(overall['vehicle_class_statistics']['abs_split_mu']),
+                         ['compact_car', 'midsize_sedan', 'suv'])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
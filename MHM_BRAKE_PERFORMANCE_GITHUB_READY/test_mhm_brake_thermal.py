@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Thermal Fade Test Suite
+============================================================
+Tests for the repeated-stop rotor temperature and friction fade model
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import MHMBrakePerformanceOptimizer, get_iso_brake_data
+from mhm_brake_simulation import CAST_IRON_SPECIFIC_HEAT_J_KGK, front_rotor_temperature_c, rotor_mass_kg
+from mhm_brake_thermal import optimize_brake_fade, simulate_brake_fade
+
+
+class TestBrakeFadeModel(unittest.TestCase):
+    """Test suite for the thermal recurrence over repeated stops"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_vehicles = get_iso_brake_data()['test_vehicles']
+    
+    def test_first_stop_and_steady_state(self):
+        """Test the first stop matches the single-stop model and a fade-free run settles analytically"""
+        print("\n🔍 Testing Thermal Fade Model...")
+        result = simulate_brake_fade(self.test_vehicles, 400, fade_rate_per_c=0.0)
+        
+        masses = [vehicle['mass_kg'] for vehicle in self.test_vehicles.values()]
+        front = [vehicle['front_brake_diameter_mm'] for vehicle in self.test_vehicles.values()]
+        np.testing.assert_allclose(result.rotor_temperature_c[:, 0, 0],
+                                   front_rotor_temperature_c(np.array(masses), 100.0, np.array(front)))
+        
+        # Without fade every cycle is identical: T* = ambient + rise / (1 - exp(-cooling / tau))
+        capacity = 2 * rotor_mass_kg(np.array(front)) * CAST_IRON_SPECIFIC_HEAT_J_KGK
+        tau = capacity / (60.0 * 4 * np.pi * (np.array(front) / 2000) ** 2 * 2.0)
+        rise = 0.7 * 0.5 * np.array(masses) * (100 / 3.6) ** 2 / capacity
+        cooling = 35.0 - (100 / 3.6) / (0.5 * 9.81)
+        np.testing.assert_allclose(result.rotor_temperature_c[:, -1, 0], 25.0 + rise / (1 - np.exp(-cooling / tau)))
+        np.testing.assert_allclose(result.friction_fade_percent, 0.0)
+        print(f"  ✅ Steady front rotor temperatures {np.round(result.rotor_temperature_c[:, -1, 0], 1)} °C")
+    
+    def test_fade_curves(self):
+        """Test friction fades once rotors pass the onset and stops lengthen accordingly"""
+        result = simulate_brake_fade(self.test_vehicles, 150)
+        fade = result.friction_fade_percent
+        
+        self.assertTrue((np.diff(fade, axis=1) >= -1e-9).all())
+        self.assertTrue((fade[:, -1] > 0).all())
+        np.testing.assert_allclose(result.stopping_distance_m * result.deceleration_g,
+                                   (100 / 3.6) ** 2 / (2 * 9.81))
+        np.testing.assert_allclose(result.deceleration_g / 0.5, result.friction_coefficient / 0.42)
+        
+        summary = result.summary()
+        self.assertGreater(summary['compact_car']['max_friction_fade_percent'],
+                           summary['suv']['max_friction_fade_percent'])
+        self.assertGreater(summary['compact_car']['final_stopping_distance_m'],
+                           summary['compact_car']['first_stopping_distance_m'])
+        
+        rolling = result.rolling('friction_coefficient', 5)
+        self.assertAlmostEqual(rolling[0, 2], result.friction_coefficient[0, :3].mean())
+        self.assertAlmostEqual(rolling[1, 40], result.friction_coefficient[1, 36:41].mean())
+        self.assertEqual(result.rolling('rotor_temperature_c', 5).shape, (3, 150, 2))
+    
+    def test_optimized_fade_and_bad_arguments(self):
+        """Test the MHM-optimized pads fade less, and bad arguments are rejected"""
+        comparison = optimize_brake_fade(get_iso_brake_data(), n_stops=80)
+        for vehicle, result in comparison.items():
+            self.assertLess(result['mhm_optimized_fade']['max_friction_fade_percent'],
+                            result['baseline_fade']['max_friction_fade_percent'])
+            self.assertGreater(result['fade_reduction_percent'], 0.0)
+        
+        # The pads are scaled by the same public factors as the component optimization
+        optimizer = MHMBrakePerformanceOptimizer(consciousness_level=0.9)
+        consciousness_factor, tesla_factor = optimizer.component_factors()
+        components = optimizer.optimize_brake_system_components(get_iso_brake_data())
+        self.assertAlmostEqual(components['pad_friction_optimization']['friction_improvement_percent'],
+                               consciousness_factor * 100)
+        self.assertAlmostEqual(components['pad_friction_optimization']['temperature_stability_improvement_c'],
+                               tesla_factor * 100)
+        
+        with self.assertRaises(TypeError):
+            simulate_brake_fade(self.test_vehicles, rotor_color='grey')
+        with self.assertRaises(ValueError):
+            simulate_brake_fade(self.test_vehicles, 0)
+        with self.assertRaises(ValueError):
+            simulate_brake_fade(self.test_vehicles, 3).rolling('deceleration_g', 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
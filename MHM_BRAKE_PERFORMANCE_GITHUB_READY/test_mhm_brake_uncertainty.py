@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Monte Carlo Uncertainty Test Suite
+=======================================================================
+Tests for chunked, seeded Monte Carlo sampling of stopping distances
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import MHMBrakePerformanceOptimizer, get_builtin_iso_store, get_iso_brake_data
+from mhm_brake_uncertainty import DEFAULT_UNCERTAINTY, _MonteCarloProblem, monte_carlo_stopping_distance
+
+
+class TestMonteCarloUncertainty(unittest.TestCase):
+    """Test suite for the Monte Carlo stopping-distance engine"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.store = get_builtin_iso_store()
+    
+    def test_statistics_match_raw_samples(self):
+        """Test the streamed sums and histograms reproduce statistics of the raw samples"""
+        print("\n🔍 Testing Monte Carlo Uncertainty...")
+        result = monte_carlo_stopping_distance(self.store, 4000, chunk_size=4000, seed=11)
+        
+        problem = _MonteCarloProblem(self.store, DEFAULT_UNCERTAINTY, {})
+        rng = np.random.default_rng(np.random.SeedSequence(11).spawn(1)[0])
+        distances = problem.simulate(*problem.draw(rng, 4000))
+        np.testing.assert_allclose(result.mean_m, distances.mean(axis=0))
+        np.testing.assert_allclose(result.std_m, distances.std(axis=0, ddof=1))
+        np.testing.assert_allclose(result.min_m, distances.min(axis=0))
+        
+        # Histogram quantiles are exact to within a bin (0.05% of the nominal stop)
+        low, high = result.prediction_interval(0.9)
+        np.testing.assert_allclose(low, np.quantile(distances, 0.05, axis=0), atol=1e-3 * result.nominal_m.max())
+        np.testing.assert_allclose(high, np.quantile(distances, 0.95, axis=0), atol=1e-3 * result.nominal_m.max())
+        mean_low, mean_high = result.mean_interval()
+        self.assertTrue((mean_low < result.mean_m).all() and (result.mean_m < mean_high).all())
+        self.assertTrue(((high - low) > (mean_high - mean_low)).all())
+        print(f"  ✅ Dry compact car 90% interval {low[0, 0]:.1f}-{high[0, 0]:.1f} m "
+              f"around {result.nominal_m[0, 0]:.1f} m nominal")
+    
+    def test_reproducible_across_workers(self):
+        """Test results depend on seed and chunk size only, not on worker count"""
+        serial = monte_carlo_stopping_distance(self.store, 3000, chunk_size=700, seed=5)
+        parallel = monte_carlo_stopping_distance(self.store, 3000, chunk_size=700, seed=5, workers=2)
+        np.testing.assert_array_equal(serial.histogram, parallel.histogram)
+        np.testing.assert_array_equal(serial.mean_m, parallel.mean_m)
+        self.assertEqual(int(serial.histogram.sum(axis=-1)[0, 0]), 3000)
+        
+        other = monte_carlo_stopping_distance(self.store, 3000, chunk_size=700, seed=6)
+        self.assertFalse(np.array_equal(serial.mean_m, other.mean_m))
+    
+    def test_no_spread_optimizer_and_bad_arguments(self):
+        """Test zero spread collapses onto the nominal stop, the optimized figures scale, and bad input fails"""
+        flat = monte_carlo_stopping_distance(get_iso_brake_data(), 50, seed=1,
+                                             uncertainty=dict.fromkeys(DEFAULT_UNCERTAINTY, 0.0))
+        np.testing.assert_allclose(flat.std_m, 0.0, atol=1e-9)
+        np.testing.assert_allclose(flat.prediction_interval()[0], flat.nominal_m)
+        
+        optimizer = MHMBrakePerformanceOptimizer(consciousness_level=0.9, proven_improvement=20.0)
+        summary = monte_carlo_stopping_distance(self.store, 200, seed=2, optimizer=optimizer).summary()
+        dry = summary['suv']['dry_asphalt_100_0']
+        self.assertAlmostEqual(dry['mhm_optimized']['mean_m'], dry['baseline']['mean_m'] * (1 - 0.2 * 0.3))
+        
+        with self.assertRaises(ValueError):
+            monte_carlo_stopping_distance(self.store, 100, uncertainty={'tire_pressure_bar': 0.1})
+        with self.assertRaises(ValueError):
+            monte_carlo_stopping_distance(self.store, 100, chunk_size=0)
+        with self.assertRaises(TypeError):
+            monte_carlo_stopping_distance(self.store, 100, rotor_color='grey')
+        with self.assertRaises(ValueError):
+            flat.quantile(1.5)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
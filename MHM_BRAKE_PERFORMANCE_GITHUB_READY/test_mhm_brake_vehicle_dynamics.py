@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+MHM Brake Performance Optimization - Vehicle Dynamics Test Suite
+================================================================
+Tests for the multi-DOF vehicle models and stacked solvers
+
+Author: William Miller - Viraxis MHM
+Contact: holdatllc2@gmail.com
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add the package to path for testing
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mhm_brake_performance_optimization import get_builtin_iso_store
+from mhm_brake_vehicle_dynamics import (
+    PassVeh7DOF,
+    _solve_rk4,
+    simulate_scenario_dynamics,
+    simulate_split_mu_maneuver
+)
+
+
+class TestPassVeh7DOF(unittest.TestCase):
+    """Test suite for the 7-DOF split-μ braking model"""
+    
+    # Uniform high-μ and split-μ
+    MU_LEFT = np.array([0.85, 0.2])
+    MU_RIGHT = np.array([0.85, 0.8])
+    
+    def test_fixed_and_adaptive_solvers_agree(self):
+        """Test hand-written RK4 and adaptive BDF give the same stacked solution"""
+        print("\n🔍 Testing 7-DOF Stacked Solvers...")
+        
+        rk4 = simulate_split_mu_maneuver(1500, 2.7, 0.55, 0.31, self.MU_LEFT, self.MU_RIGHT, 60)
+        bdf = simulate_split_mu_maneuver(1500, 2.7, 0.55, 0.31, self.MU_LEFT, self.MU_RIGHT, 60, method='BDF')
+        
+        np.testing.assert_allclose(rk4.stopping_distance_m, bdf.stopping_distance_m, rtol=1e-3)
+        np.testing.assert_allclose(rk4.max_yaw_rate_deg_s[1], bdf.max_yaw_rate_deg_s[1], rtol=1e-2)
+        np.testing.assert_allclose(rk4.lateral_displacement_m[1], bdf.lateral_displacement_m[1], rtol=1e-2)
+        print(f"  ✅ Split-μ stop: {rk4.stopping_distance_m[1]:.2f} m, {rk4.max_yaw_rate_deg_s[1]:.2f} deg/s")
+    
+    def test_uniform_surface_is_symmetric(self):
+        """Test equal friction brakes straight near the ABS-held friction limit"""
+        result = simulate_split_mu_maneuver(1500, 2.7, 0.55, 0.31, 0.85, 0.85, 60)
+        
+        ideal = (60 / 3.6) ** 2 / (2 * 0.85 * 9.81)
+        self.assertTrue(ideal < float(result.stopping_distance_m[0]) < 1.2 * ideal)
+        self.assertLess(float(result.max_yaw_rate_deg_s[0]), 1e-6)
+        self.assertLess(float(result.lateral_displacement_m[0]), 1e-6)
+    
+    def test_select_low_limits_split_mu_yaw(self):
+        """Test rear select-low keeps split-μ yaw and drift below independent rear ABS"""
+        select_low = simulate_split_mu_maneuver(1500, 2.7, 0.55, 0.31, 0.2, 0.8, 60, method='BDF')
+        independent = simulate_split_mu_maneuver(1500, 2.7, 0.55, 0.31, 0.2, 0.8, 60, method='BDF',
+                                                 rear_select_low=False)
+        
+        self.assertLess(float(select_low.max_yaw_rate_deg_s[0]), float(independent.max_yaw_rate_deg_s[0]))
+        self.assertLess(float(select_low.lateral_displacement_m[0]), float(independent.lateral_displacement_m[0]))
+        # High-μ on the right pulls the car right, i.e. negative heading
+        self.assertLess(float(select_low.final_heading_deg[0]), 0.0)
+    
+    def test_stopping_distance_is_path_length(self):
+        """Test a yawing split-μ stop travels further than its straight-line displacement"""
+        vehicle = PassVeh7DOF(1500, 2.7, 0.55, 0.31, self.MU_LEFT, self.MU_RIGHT, 60, rear_select_low=False)
+        final = _solve_rk4(vehicle, vehicle.initial_state(), 1e-3, 30.0, 1.0)[0]
+        displacement = np.hypot(final[:, 7], final[:, 8])
+        
+        self.assertAlmostEqual(final[0, 10], displacement[0], places=6)
+        self.assertGreater(final[1, 10], displacement[1] + 1e-4)
+        result = simulate_split_mu_maneuver(1500, 2.7, 0.55, 0.31, self.MU_LEFT, self.MU_RIGHT, 60,
+                                            rear_select_low=False)
+        self.assertTrue((result.stopping_distance_m > final[:, 10]).all())
+    
+    def test_builtin_scenarios_and_bad_inputs(self):
+        """Test every built-in vehicle × split-μ scenario solves in one batch"""
+        builtin = get_builtin_iso_store()
+        result = simulate_scenario_dynamics(builtin.metadata['test_vehicles'], builtin.abs_scenarios,
+                                            method='BDF')
+        
+        self.assertEqual(result.stopping_distance_m.shape, (3, len(builtin.abs_scenarios)))
+        self.assertTrue(np.isfinite(result.stopping_distance_m).all())
+        self.assertTrue((result.max_yaw_rate_deg_s > 0).all())
+        self.assertEqual(PassVeh7DOF(1500, 2.7, 0.55, 0.31, 0.2, 0.8, [60, 80]).initial_state().shape, (2, 11))
+        
+        with self.assertRaises(ValueError):
+            simulate_split_mu_maneuver(1500, 2.7, 0.55, 0.31, 0.2, 0.8, 60, model='PassVeh3DOF')
+        with self.assertRaises(ValueError):
+            simulate_split_mu_maneuver(1500, 2.7, 0.55, 0.31, 0.2, 0.8, 60, method='euler')
+        with self.assertRaises(TypeError):
+            simulate_split_mu_maneuver(1500, 2.7, 0.55, 0.31, 0.2, 0.8, 60, abs_slip=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)